@@ -2,6 +2,7 @@ from types import MappingProxyType
 
 from api.models import Provider
 from prowler.config.config import get_available_compliance_frameworks
+from prowler.lib.check.compliance import build_checks_compliance_index
 from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.check.models import CheckMetadata
 
@@ -96,8 +97,9 @@ def load_prowler_checks(prowler_compliance):
     Generate a mapping of checks to the compliance frameworks that include them.
 
     This function processes the provided compliance data and creates a dictionary
-    mapping each provider type to a dictionary where each check ID maps to a set
-    of compliance names that include that check.
+    mapping each provider type to a dictionary where each check ID maps to the
+    compliance names that include that check, along with the IDs of the requirements
+    that include it within each compliance.
 
     Args:
         prowler_compliance (dict): The compliance data for all provider types,
@@ -105,22 +107,18 @@ def load_prowler_checks(prowler_compliance):
 
     Returns:
         dict: A nested dictionary where the first-level keys are provider types,
-            and the values are dictionaries mapping check IDs to sets of compliance names.
+            and the values are dictionaries mapping check IDs to dictionaries of
+            compliance names and their requirement IDs.
     """
     checks = {}
     for provider_type in Provider.ProviderChoices.values:
+        checks_compliance_index = build_checks_compliance_index(
+            prowler_compliance[provider_type]
+        )
         checks[provider_type] = {
-            check_id: set() for check_id in get_prowler_provider_checks(provider_type)
+            check_id: checks_compliance_index.get(check_id, {})
+            for check_id in get_prowler_provider_checks(provider_type)
         }
-        for compliance_name, compliance_data in prowler_compliance[
-            provider_type
-        ].items():
-            for requirement in compliance_data.Requirements:
-                for check in requirement.Checks:
-                    try:
-                        checks[provider_type][check].add(compliance_name)
-                    except KeyError:
-                        continue
     return checks
 
 
@@ -144,8 +142,12 @@ def generate_scan_compliance(
     Returns:
         None: This function modifies the compliance_overview in place.
     """
-    for compliance_id in PROWLER_CHECKS[provider_type][check_id]:
-        for requirement in compliance_overview[compliance_id]["requirements"].values():
+    for compliance_id, requirement_ids in PROWLER_CHECKS[provider_type][
+        check_id
+    ].items():
+        compliance_requirements = compliance_overview[compliance_id]["requirements"]
+        for requirement_id in dict.fromkeys(requirement_ids):
+            requirement = compliance_requirements[requirement_id]
             if check_id in requirement["checks"]:
                 requirement["checks"][check_id] = status
                 requirement["checks_status"][status.lower()] += 1
@@ -158,6 +160,37 @@ def generate_scan_compliance(
                 compliance_overview[compliance_id]["requirements_status"]["failed"] += 1
 
 
+def generate_scan_requirements_checks_status(
+    provider_type: str, check_status: dict
+) -> dict:
+    """
+    Count the statuses of the checks of each compliance requirement.
+
+    This function uses the precomputed check to requirements index, `PROWLER_CHECKS`, so
+    it only visits the requirements that include the given checks instead of walking
+    every requirement of every compliance framework.
+
+    Args:
+        provider_type (str): The provider type (e.g., 'aws', 'azure') associated with the checks.
+        check_status (dict): The status of each check (e.g., {'check_id': 'FAIL'}) in a region.
+
+    Returns:
+        dict: A dictionary mapping each (compliance_id, requirement_id) including any of the
+            checks to its number of passed, failed and manual checks.
+    """
+    requirements_checks_status = {}
+    provider_checks = PROWLER_CHECKS[provider_type]
+    for check_id, status in check_status.items():
+        for compliance_id, requirement_ids in provider_checks.get(check_id, {}).items():
+            for requirement_id in dict.fromkeys(requirement_ids):
+                checks_status = requirements_checks_status.setdefault(
+                    (compliance_id, requirement_id),
+                    {"pass": 0, "fail": 0, "manual": 0},
+                )
+                checks_status[status.lower()] += 1
+    return requirements_checks_status
+
+
 def generate_compliance_overview_template(prowler_compliance: dict):
     """
     Generate a compliance overview template for all provider types.
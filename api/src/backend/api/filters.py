@@ -27,6 +27,7 @@ from api.models import (
     Finding,
     Integration,
     Invitation,
+    LatestScanOverview,
     Membership,
     PermissionChoices,
     Processor,
@@ -750,6 +751,20 @@ class ScanSummaryFilter(FilterSet):
         }
 
 
+class LatestScanOverviewFilter(FilterSet):
+    provider_id = UUIDFilter(field_name="provider__id", lookup_expr="exact")
+    provider_type = ChoiceFilter(
+        field_name="provider__provider", choices=Provider.ProviderChoices.choices
+    )
+    provider_type__in = ChoiceInFilter(
+        field_name="provider__provider", choices=Provider.ProviderChoices.choices
+    )
+
+    class Meta:
+        model = LatestScanOverview
+        fields = []
+
+
 class ServiceOverviewFilter(ScanSummaryFilter):
     def is_valid(self):
         # Check if at least one of the inserted_at filters is present
@@ -0,0 +1,48 @@
+from django.db import migrations
+from django.db.models import Exists, OuterRef
+from tasks.jobs.scan import update_latest_scan_overview
+
+from api.db_router import MainRouter
+from api.models import StateChoices
+
+
+def backfill_latest_scan_overviews(apps, schema_editor):
+    Provider = apps.get_model("api", "Provider")
+    Scan = apps.get_model("api", "Scan")
+    LatestScanOverview = apps.get_model("api", "LatestScanOverview")
+
+    # Providers scanned before the latest scan overviews were introduced
+    providers = (
+        Provider.objects.using(MainRouter.admin_db)
+        .filter(
+            Exists(
+                Scan.objects.using(MainRouter.admin_db).filter(
+                    provider_id=OuterRef("id"), state=StateChoices.COMPLETED
+                )
+            )
+        )
+        .exclude(
+            Exists(
+                LatestScanOverview.objects.using(MainRouter.admin_db).filter(
+                    provider_id=OuterRef("id")
+                )
+            )
+        )
+        .values_list("tenant_id", "id")
+    )
+    for tenant_id, provider_id in providers:
+        update_latest_scan_overview(str(tenant_id), str(provider_id))
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("api", "0040_latest_scan_overviews"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_latest_scan_overviews, reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -1,5 +1,8 @@
+import json
 from contextlib import nullcontext
 
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
 from rest_framework_json_api.renderers import JSONRenderer
 
 from api.db_utils import rls_transaction
@@ -21,3 +24,33 @@ class APIJSONRenderer(JSONRenderer):
         )
         with context_manager:
             return super().render(data, accepted_media_type, renderer_context)
+
+
+class FindingsExportRenderer(BaseRenderer):
+    """
+    Base renderer of the findings exports, selected with the `format` query parameter.
+
+    The exports are streamed by the view, so this renderer only renders the error responses, as JSON.
+    """
+
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return json.dumps(data, cls=DjangoJSONEncoder).encode()
+
+
+class NDJSONFindingsExportRenderer(FindingsExportRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+
+class ParquetFindingsExportRenderer(FindingsExportRenderer):
+    media_type = "application/vnd.apache.parquet"
+    format = "parquet"
+
+
+class OCSFFindingsExportRenderer(FindingsExportRenderer):
+    media_type = "application/x-ndjson"
+    format = "ocsf"
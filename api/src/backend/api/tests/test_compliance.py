@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 from api.compliance import (
     generate_compliance_overview_template,
     generate_scan_compliance,
+    generate_scan_requirements_checks_status,
     get_prowler_provider_checks,
     get_prowler_provider_compliance,
     load_prowler_checks,
@@ -98,8 +99,13 @@ class TestCompliance:
                 "compliance1": MagicMock(
                     Requirements=[
                         MagicMock(
+                            Id="requirement1",
                             Checks=["check1", "check2"],
                         ),
+                        MagicMock(
+                            Id="requirement2",
+                            Checks=["check2"],
+                        ),
                     ],
                 ),
             },
@@ -107,9 +113,9 @@ class TestCompliance:
 
         expected_checks = {
             "aws": {
-                "check1": {"compliance1"},
-                "check2": {"compliance1"},
-                "check3": set(),
+                "check1": {"compliance1": ["requirement1"]},
+                "check2": {"compliance1": ["requirement1", "requirement2"]},
+                "check3": {},
             }
         }
 
@@ -117,11 +123,40 @@ class TestCompliance:
         assert checks == expected_checks
         mock_get_prowler_provider_checks.assert_called_once_with("aws")
 
+    @patch("api.compliance.PROWLER_CHECKS", new_callable=dict)
+    def test_generate_scan_requirements_checks_status(self, mock_prowler_checks):
+        mock_prowler_checks["aws"] = {
+            "check1": {"compliance1": ["requirement1"]},
+            "check2": {
+                "compliance1": ["requirement1", "requirement1"],
+                "compliance2": ["requirement2"],
+            },
+            "check3": {},
+        }
+
+        requirements_checks_status = generate_scan_requirements_checks_status(
+            "aws",
+            {
+                "check1": "PASS",
+                "check2": "FAIL",
+                "check3": "FAIL",
+                "custom_check": "FAIL",
+            },
+        )
+
+        assert requirements_checks_status == {
+            ("compliance1", "requirement1"): {"pass": 1, "fail": 1, "manual": 0},
+            ("compliance2", "requirement2"): {"pass": 0, "fail": 1, "manual": 0},
+        }
+
     @patch("api.compliance.PROWLER_CHECKS", new_callable=dict)
     def test_generate_scan_compliance(self, mock_prowler_checks):
         mock_prowler_checks["aws"] = {
-            "check1": {"compliance1"},
-            "check2": {"compliance1", "compliance2"},
+            "check1": {"compliance1": ["requirement1"]},
+            "check2": {
+                "compliance1": ["requirement1"],
+                "compliance2": ["requirement2"],
+            },
         }
 
         compliance_overview = {
@@ -1,4 +1,5 @@
 import glob
+import gzip
 import io
 import json
 import os
@@ -11,6 +12,7 @@ from urllib.parse import parse_qs, urlparse
 from uuid import uuid4
 
 import jwt
+import pyarrow.parquet as pq
 import pytest
 from allauth.socialaccount.models import SocialAccount, SocialApp
 from botocore.exceptions import ClientError, NoCredentialsError
@@ -28,6 +30,7 @@ from api.db_router import MainRouter
 from api.models import (
     Integration,
     Invitation,
+    LatestScanOverview,
     Membership,
     Processor,
     Provider,
@@ -2615,6 +2618,70 @@ class TestScanViewSet:
             assert content_disposition.startswith('attachment; filename="')
             assert f'filename="{file_path.name}"' in content_disposition
 
+    def test_findings_export_ndjson(self, authenticated_client, findings_fixture):
+        scan = findings_fixture[0].scan
+        url = reverse("scan-findings-export", kwargs={"pk": scan.id})
+        response = authenticated_client.get(url, {"format": "ndjson"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/gzip"
+        assert response["Content-Disposition"].endswith('.ndjson.gz"')
+
+        content = gzip.decompress(b"".join(response.streaming_content))
+        records = [json.loads(line) for line in content.decode().splitlines()]
+        assert sorted(record["id"] for record in records) == sorted(
+            str(finding.id) for finding in findings_fixture
+        )
+        assert all(record["scan_id"] == str(scan.id) for record in records)
+        assert records[0]["resource_uids"]
+
+    def test_findings_export_parquet(self, authenticated_client, findings_fixture):
+        scan = findings_fixture[0].scan
+        url = reverse("scan-findings-export", kwargs={"pk": scan.id})
+        response = authenticated_client.get(url, {"format": "parquet"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/vnd.apache.parquet"
+
+        table = pq.read_table(io.BytesIO(b"".join(response.streaming_content)))
+        assert table.num_rows == len(findings_fixture)
+        assert sorted(table.column("uid").to_pylist()) == sorted(
+            finding.uid for finding in findings_fixture
+        )
+
+    def test_findings_export_ocsf_provider_without_secret(
+        self, authenticated_client, providers_fixture
+    ):
+        provider = providers_fixture[4]
+        scan = Scan.objects.create(
+            name="azure scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.COMPLETED,
+            tenant_id=provider.tenant_id,
+        )
+
+        url = reverse("scan-findings-export", kwargs={"pk": scan.id})
+        response = authenticated_client.get(url, {"format": "ocsf"})
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_findings_export_invalid_format(
+        self, authenticated_client, findings_fixture
+    ):
+        scan = findings_fixture[0].scan
+        url = reverse("scan-findings-export", kwargs={"pk": scan.id})
+        response = authenticated_client.get(url, {"format": "xml"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_findings_export_scan_not_completed(
+        self, authenticated_client, scans_fixture
+    ):
+        scan = scans_fixture[0]
+        scan.state = StateChoices.EXECUTING
+        scan.save()
+
+        url = reverse("scan-findings-export", kwargs={"pk": scan.id})
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_409_CONFLICT
+
     def test_compliance_invalid_framework(self, authenticated_client, scans_fixture):
         scan = scans_fixture[0]
         scan.state = StateChoices.COMPLETED
@@ -3347,6 +3414,52 @@ class TestFindingViewSet:
                 d.get("type") == expected_type for d in included_data
             ), f"Expected type '{expected_type}' not found in included data"
 
+    def test_findings_list_cursor_pagination(
+        self, authenticated_client, findings_fixture
+    ):
+        expected_ids = sorted(str(finding.id) for finding in findings_fixture)
+
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {"filter[inserted_at]": TODAY, "page[cursor]": "", "page[size]": 1},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()["data"]] == expected_ids[:1]
+        next_link = response.json()["links"]["next"]
+        assert next_link is not None
+
+        response = authenticated_client.get(next_link)
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()["data"]] == expected_ids[1:2]
+        assert response.json()["meta"]["pagination"]["cursor"] == expected_ids[0]
+        assert response.json()["links"]["next"] is None
+
+    def test_findings_list_cursor_pagination_invalid_cursor(
+        self, authenticated_client, findings_fixture
+    ):
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {"filter[inserted_at]": TODAY, "page[cursor]": "invalid"},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_findings_list_sparse_fieldsets(
+        self, authenticated_client, findings_fixture
+    ):
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {
+                "filter[inserted_at]": TODAY,
+                "fields[findings]": "status,severity",
+                "page[cursor]": "",
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["data"]) == len(findings_fixture)
+        for item in response.json()["data"]:
+            assert set(item["attributes"]) == {"status", "severity"}
+            assert "relationships" not in item
+
     @pytest.mark.parametrize(
         "filter_name, filter_value, expected_count",
         (
@@ -3654,7 +3767,11 @@ class TestFindingViewSet:
         mock_backfill_task.assert_not_called()
 
     def test_findings_metadata_latest_backfill(
-        self, authenticated_client, scans_fixture, findings_fixture
+        self,
+        authenticated_client,
+        scans_fixture,
+        findings_fixture,
+        latest_scan_overviews_fixture,
     ):
         scan = scans_fixture[0]
         scan.unique_resource_count = 1
@@ -3668,7 +3785,7 @@ class TestFindingViewSet:
         mock_backfill_task.assert_called()
 
     def test_findings_metadata_latest_backfill_no_resources(
-        self, authenticated_client, scans_fixture
+        self, authenticated_client, scans_fixture, latest_scan_overviews_fixture
     ):
         with patch(
             "api.v1.views.backfill_scan_resource_summaries_task.apply_async"
@@ -5413,7 +5530,11 @@ class TestOverviewViewSet:
         assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
 
     def test_overview_providers_list(
-        self, authenticated_client, scan_summaries_fixture, resources_fixture
+        self,
+        authenticated_client,
+        scan_summaries_fixture,
+        resources_fixture,
+        latest_scan_overviews_fixture,
     ):
         response = authenticated_client.get(reverse("overview-providers"))
         assert response.status_code == status.HTTP_200_OK
@@ -5425,13 +5546,95 @@ class TestOverviewViewSet:
         # Since we rely on completed scans, there are only 2 resources now
         assert response.json()["data"][0]["attributes"]["resources"]["total"] == 2
 
+    def test_overview_providers_list_without_overview(
+        self, authenticated_client, scan_summaries_fixture
+    ):
+        # The overviews are not computed while reading them
+        response = authenticated_client.get(reverse("overview-providers"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"] == []
+        assert not LatestScanOverview.objects.exists()
+
+    def test_overview_providers_list_refreshed_overview(
+        self,
+        authenticated_client,
+        scan_summaries_fixture,
+        providers_fixture,
+        latest_scan_overviews_fixture,
+    ):
+        provider = providers_fixture[0]
+        # The overviews are read from the stored latest scan overviews
+        LatestScanOverview.objects.filter(provider_id=provider.id).update(
+            total=10, _pass=10
+        )
+
+        response = authenticated_client.get(reverse("overview-providers"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"][0]["attributes"]["findings"]["total"] == 10
+        assert response.json()["data"][0]["attributes"]["findings"]["pass"] == 10
+
+    def test_overview_findings(
+        self,
+        authenticated_client,
+        scan_summaries_fixture,
+        latest_scan_overviews_fixture,
+    ):
+        response = authenticated_client.get(reverse("overview-findings"))
+        assert response.status_code == status.HTTP_200_OK
+        attributes = response.json()["data"]["attributes"]
+        assert attributes["total"] == 4
+        assert attributes["pass"] == 2
+        assert attributes["fail"] == 1
+        assert attributes["muted"] == 1
+
+    @pytest.mark.parametrize(
+        "filter_name, filter_value, expected_total",
+        [
+            ("provider_type", "aws", 4),
+            ("provider_type", "gcp", 0),
+            ("region", "region1", 2),
+        ],
+    )
+    def test_overview_findings_filters(
+        self,
+        authenticated_client,
+        scan_summaries_fixture,
+        latest_scan_overviews_fixture,
+        filter_name,
+        filter_value,
+        expected_total,
+    ):
+        response = authenticated_client.get(
+            reverse("overview-findings"), {f"filter[{filter_name}]": filter_value}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["attributes"]["total"] == expected_total
+
+    def test_overview_findings_severity(
+        self,
+        authenticated_client,
+        scan_summaries_fixture,
+        latest_scan_overviews_fixture,
+    ):
+        response = authenticated_client.get(reverse("overview-findings_severity"))
+        assert response.status_code == status.HTTP_200_OK
+        attributes = response.json()["data"]["attributes"]
+        assert attributes["critical"] == 1
+        assert attributes["high"] == 3
+        assert attributes["low"] == 0
+
     def test_overview_services_list_no_required_filters(
         self, authenticated_client, scan_summaries_fixture
     ):
         response = authenticated_client.get(reverse("overview-services"))
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_overview_services_list(self, authenticated_client, scan_summaries_fixture):
+    def test_overview_services_list(
+        self,
+        authenticated_client,
+        scan_summaries_fixture,
+        latest_scan_overviews_fixture,
+    ):
         response = authenticated_client.get(
             reverse("overview-services"), {"filter[inserted_at]": TODAY}
         )
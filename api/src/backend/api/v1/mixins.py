@@ -1,14 +1,22 @@
+from uuid import UUID
+
+from config.django.base import DJANGO_CURSOR_PAGINATION_MAX_PAGE_SIZE
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models import JSONField
 from django.urls import reverse
 from django_celery_results.models import TaskResult
 from rest_framework import status
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+from rest_framework_json_api.serializers import ValidationError
 
 from api.exceptions import (
     TaskFailedException,
     TaskInProgressException,
     TaskNotFoundException,
 )
-from api.models import StateChoices, Task
+from api.models import LatestScanOverview, StateChoices, Task
 from api.v1.serializers import TaskSerializer
 
 
@@ -17,8 +25,16 @@ class PaginateByPkMixin:
     Mixin to paginate on a list of PKs (cheaper than heavy JOINs),
     re-fetch the full objects with the desired select/prefetch,
     re-sort them to preserve DB ordering, then serialize + return.
+
+    The requests with `page[cursor]` are paginated by keyset on the PKs instead of by page
+    number, so walking through all the objects does not get slower with every page.
     """
 
+    cursor_query_param = "page[cursor]"
+    cursor_page_size_query_param = "page[size]"
+    # Column types only loaded if the serializer renders them, e.g. not in the sparse fieldsets
+    deferrable_field_types = (JSONField, SearchVectorField)
+
     def paginate_by_pk(
         self,
         request,  # noqa: F841
@@ -34,26 +50,180 @@ class PaginateByPkMixin:
         filtered or annotated in a way that would be lost if you used the default
         pagination method.
         """
+        if self.cursor_query_param in request.query_params:
+            return self.paginate_by_cursor(
+                request, base_queryset, manager, select_related, prefetch_related
+            )
+
         pk_list = base_queryset.values_list("id", flat=True)
         page = self.paginate_queryset(pk_list)
         if page is None:
             return Response(self.get_serializer(base_queryset, many=True).data)
 
-        queryset = manager.filter(id__in=page)
+        queryset = self._get_page_queryset(
+            manager.filter(id__in=page), select_related, prefetch_related
+        )
+
+        queryset = sorted(queryset, key=lambda obj: page.index(obj.id))
+
+        serialized = self.get_serializer(queryset, many=True).data
+        return self.get_paginated_response(serialized)
+
+    def paginate_by_cursor(
+        self,
+        request,
+        base_queryset,
+        manager,
+        select_related: list | None = None,
+        prefetch_related: list | None = None,
+    ) -> Response:
+        """
+        Paginate a queryset by keyset on its primary key.
+
+        The objects are returned in ascending order of their PKs after the one given in
+        `page[cursor]`, or from the first one if it is empty. As the PKs of the findings are
+        UUIDv7, ordered by time and used to partition the table, the partitions before the
+        cursor are pruned and the pages do not get slower with the offset. The `sort`
+        parameter is ignored and no total count is computed. The `next` link holds the
+        cursor of the following page, or null in the last one.
+        """
+        cursor = request.query_params.get(self.cursor_query_param)
+        page_size = self._get_cursor_page_size(request)
+
+        pk_queryset = base_queryset.order_by("id")
+        if cursor:
+            try:
+                cursor = UUID(cursor)
+            except ValueError:
+                raise ValidationError(
+                    {self.cursor_query_param: ["Invalid cursor value."]}
+                )
+            pk_queryset = pk_queryset.filter(id__gt=cursor)
+
+        # One more PK than the page size tells if there is a next page
+        pk_list = list(pk_queryset.values_list("id", flat=True)[: page_size + 1])
+        page = pk_list[:page_size]
+
+        queryset = self._get_page_queryset(
+            manager.filter(id__in=page), select_related, prefetch_related
+        )
+        if page:
+            # Keeps the partition pruning on the re-fetch as well
+            queryset = queryset.filter(id__gte=page[0], id__lte=page[-1])
+        queryset = queryset.order_by("id")
+
+        next_link = None
+        if len(pk_list) > page_size:
+            next_link = replace_query_param(
+                request.build_absolute_uri(), self.cursor_query_param, str(page[-1])
+            )
+
+        serialized = self.get_serializer(queryset, many=True).data
+        return Response(
+            {
+                "results": serialized,
+                "meta": {
+                    "pagination": {
+                        "cursor": str(cursor) if cursor else None,
+                        "size": page_size,
+                    }
+                },
+                "links": {
+                    "first": replace_query_param(
+                        request.build_absolute_uri(), self.cursor_query_param, ""
+                    ),
+                    "next": next_link,
+                },
+            }
+        )
+
+    def _get_cursor_page_size(self, request) -> int:
+        try:
+            page_size = int(
+                request.query_params.get(
+                    self.cursor_page_size_query_param, api_settings.PAGE_SIZE
+                )
+            )
+        except ValueError:
+            raise ValidationError(
+                {self.cursor_page_size_query_param: ["Invalid page size."]}
+            )
+        if page_size < 1:
+            raise ValidationError(
+                {self.cursor_page_size_query_param: ["Invalid page size."]}
+            )
+        return min(page_size, DJANGO_CURSOR_PAGINATION_MAX_PAGE_SIZE)
+
+    def _get_page_queryset(
+        self,
+        queryset,
+        select_related: list | None = None,
+        prefetch_related: list | None = None,
+    ):
+        """
+        Apply the select/prefetch of the relationships rendered by the serializer and
+        defer the heavy columns it does not render, e.g. left out of the sparse fieldsets.
+        """
+        serializer_fields = self.get_serializer().fields
+        rendered_sources = set(serializer_fields) | {
+            field.source.split(".")[0] for field in serializer_fields.values()
+        }
+        included = set(
+            filter(None, self.request.query_params.get("include", "").split(","))
+        )
+        needed_relationships = rendered_sources | {
+            include.split(".")[0] for include in included
+        }
 
         if select_related:
-            queryset = queryset.select_related(*select_related)
+            select_related = [
+                relation
+                for relation in select_related
+                if relation.split("__")[0] in needed_relationships
+            ]
+            if select_related:
+                queryset = queryset.select_related(*select_related)
         if prefetch_related:
-            queryset = queryset.prefetch_related(*prefetch_related)
+            prefetch_related = [
+                relation
+                for relation in prefetch_related
+                if relation.split("__")[0] in needed_relationships
+            ]
+            if prefetch_related:
+                queryset = queryset.prefetch_related(*prefetch_related)
 
         # Optimize tags loading, if applicable
-        if hasattr(self, "_optimize_tags_loading"):
+        if hasattr(self, "_optimize_tags_loading") and "tags" in rendered_sources:
             queryset = self._optimize_tags_loading(queryset)
 
-        queryset = sorted(queryset, key=lambda obj: page.index(obj.id))
+        deferred_fields = [
+            field.name
+            for field in queryset.model._meta.concrete_fields
+            if isinstance(
+                # The search vectors are generated fields
+                getattr(field, "output_field", field),
+                self.deferrable_field_types,
+            )
+            and field.name not in rendered_sources
+        ]
+        if deferred_fields:
+            queryset = queryset.defer(*deferred_fields)
+        return queryset
 
-        serialized = self.get_serializer(queryset, many=True).data
-        return self.get_paginated_response(serialized)
+
+class LatestScanOverviewMixin:
+    """
+    Mixin to read the latest completed scan of each provider from the LatestScanOverview
+    rows refreshed after each scan summary, instead of looking for them through all the scans.
+    """
+
+    def get_latest_scan_overviews(self, tenant_id: str):
+        """Return the latest scan overviews of the tenant."""
+        return LatestScanOverview.all_objects.filter(tenant_id=tenant_id)
+
+    def get_latest_scan_ids(self, tenant_id: str):
+        """Return a subquery with the IDs of the latest completed scan of each provider of the tenant."""
+        return self.get_latest_scan_overviews(tenant_id).values("scan_id")
 
 
 class TaskManagementMixin:
@@ -23,8 +23,7 @@ from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.search import SearchQuery
 from django.db import transaction
 from django.db.models import Count, F, Prefetch, Q, Sum
-from django.db.models.functions import Coalesce
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils.dateparse import parse_date
@@ -54,7 +53,11 @@ from rest_framework.permissions import SAFE_METHODS
 from rest_framework_json_api.views import RelationshipView, Response
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from tasks.beat import schedule_provider_scan
-from tasks.jobs.export import get_s3_client
+from tasks.jobs.export import (
+    FINDINGS_EXPORT_FORMATS,
+    get_s3_client,
+    stream_scan_findings,
+)
 from tasks.tasks import (
     backfill_scan_resource_summaries_task,
     check_lighthouse_connection_task,
@@ -79,6 +82,7 @@ from api.filters import (
     InvitationFilter,
     LatestFindingFilter,
     LatestResourceFilter,
+    LatestScanOverviewFilter,
     MembershipFilter,
     ProcessorFilter,
     ProviderFilter,
@@ -99,6 +103,7 @@ from api.models import (
     Finding,
     Integration,
     Invitation,
+    LatestScanOverview,
     LighthouseConfiguration,
     Membership,
     Processor,
@@ -125,6 +130,11 @@ from api.models import (
 )
 from api.pagination import ComplianceOverviewPagination
 from api.rbac.permissions import Permissions, get_providers, get_role
+from api.renderers import (
+    NDJSONFindingsExportRenderer,
+    OCSFFindingsExportRenderer,
+    ParquetFindingsExportRenderer,
+)
 from api.rls import Tenant
 from api.utils import (
     CustomOAuth2Client,
@@ -132,7 +142,11 @@ from api.utils import (
     validate_invitation,
 )
 from api.uuid_utils import datetime_to_uuid7, uuid7_start
-from api.v1.mixins import PaginateByPkMixin, TaskManagementMixin
+from api.v1.mixins import (
+    LatestScanOverviewMixin,
+    PaginateByPkMixin,
+    TaskManagementMixin,
+)
 from api.v1.serializers import (
     ComplianceOverviewAttributesSerializer,
     ComplianceOverviewDetailSerializer,
@@ -1497,6 +1511,34 @@ class ProviderViewSet(BaseRLSViewSet):
         },
         request=None,
     ),
+    findings_export=extend_schema(
+        tags=["Scan"],
+        summary="Export the findings of a scan",
+        description=(
+            "Stream all the findings of a completed scan, without pagination and without waiting for the "
+            "report generation. The findings are read with a server-side cursor and encoded and compressed "
+            "in batches. `ndjson` returns gzip compressed JSON lines with the findings as stored, `parquet` "
+            "a Parquet file with the same columns compressed with zstd, and `ocsf` gzip compressed JSON "
+            "lines with the findings in the OCSF format."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="format",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                enum=list(FINDINGS_EXPORT_FORMATS),
+                default="ndjson",
+                description="The format of the export.",
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(description="Findings export streamed successfully"),
+            404: OpenApiResponse(description="The scan does not exist"),
+            409: OpenApiResponse(description="The scan has not completed yet"),
+        },
+        request=None,
+    ),
 )
 @method_decorator(CACHE_DECORATOR, name="list")
 @method_decorator(CACHE_DECORATOR, name="retrieve")
@@ -1784,6 +1826,44 @@ class ScanViewSet(BaseRLSViewSet):
         content, filename = loader
         return self._serve_file(content, filename, "text/csv")
 
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="findings/export",
+        url_name="findings-export",
+        # The format is selected with the `format` query parameter, which is not a JSON:API one
+        renderer_classes=[
+            NDJSONFindingsExportRenderer,
+            ParquetFindingsExportRenderer,
+            OCSFFindingsExportRenderer,
+        ],
+        filter_backends=[],
+    )
+    def findings_export(self, request, pk=None):
+        scan = self.get_object()
+        if scan.state != StateChoices.COMPLETED:
+            return Response(
+                {"detail": "The scan has not completed yet."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        export_format = request.accepted_renderer.format
+        content_type = FINDINGS_EXPORT_FORMATS[export_format]["content_type"]
+        suffix = FINDINGS_EXPORT_FORMATS[export_format]["suffix"]
+        try:
+            findings_stream = stream_scan_findings(
+                request.tenant_id, scan, export_format
+            )
+        except ValueError as error:
+            return Response(
+                {"detail": str(error)}, status=status.HTTP_422_UNPROCESSABLE_ENTITY
+            )
+        response = StreamingHttpResponse(findings_stream, content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="prowler-findings-{scan.id}{suffix}"'
+        )
+        return response
+
     def create(self, request, *args, **kwargs):
         input_serializer = self.get_serializer(data=request.data)
         input_serializer.is_valid(raise_exception=True)
@@ -1932,7 +2012,7 @@ class TaskViewSet(BaseRLSViewSet):
 )
 @method_decorator(CACHE_DECORATOR, name="list")
 @method_decorator(CACHE_DECORATOR, name="retrieve")
-class ResourceViewSet(PaginateByPkMixin, BaseRLSViewSet):
+class ResourceViewSet(LatestScanOverviewMixin, PaginateByPkMixin, BaseRLSViewSet):
     queryset = Resource.all_objects.all()
     serializer_class = ResourceSerializer
     http_method_names = ["get"]
@@ -2043,12 +2123,7 @@ class ResourceViewSet(PaginateByPkMixin, BaseRLSViewSet):
         tenant_id = request.tenant_id
         filtered_queryset = self.filter_queryset(self.get_queryset())
 
-        latest_scan_ids = (
-            Scan.all_objects.filter(tenant_id=tenant_id, state=StateChoices.COMPLETED)
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
+        latest_scan_ids = self.get_latest_scan_ids(tenant_id)
         filtered_queryset = filtered_queryset.filter(
             tenant_id=tenant_id, provider__scan__in=latest_scan_ids
         )
@@ -2165,15 +2240,9 @@ class ResourceViewSet(PaginateByPkMixin, BaseRLSViewSet):
         tenant_id = request.tenant_id
         query_params = request.query_params
 
-        latest_scans_queryset = (
-            Scan.all_objects.filter(tenant_id=tenant_id, state=StateChoices.COMPLETED)
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-        )
-
         queryset = ResourceScanSummary.objects.filter(
             tenant_id=tenant_id,
-            scan_id__in=latest_scans_queryset.values_list("id", flat=True),
+            scan_id__in=self.get_latest_scan_ids(tenant_id),
         )
 
         if service_filter := query_params.get("filter[service]") or query_params.get(
@@ -2273,7 +2342,7 @@ class ResourceViewSet(PaginateByPkMixin, BaseRLSViewSet):
 )
 @method_decorator(CACHE_DECORATOR, name="list")
 @method_decorator(CACHE_DECORATOR, name="retrieve")
-class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
+class FindingViewSet(LatestScanOverviewMixin, PaginateByPkMixin, BaseRLSViewSet):
     queryset = Finding.all_objects.all()
     serializer_class = FindingSerializer
     filterset_class = FindingFilter
@@ -2494,12 +2563,7 @@ class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
         tenant_id = request.tenant_id
         filtered_queryset = self.filter_queryset(self.get_queryset())
 
-        latest_scan_ids = (
-            Scan.all_objects.filter(tenant_id=tenant_id, state=StateChoices.COMPLETED)
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
+        latest_scan_ids = self.get_latest_scan_ids(tenant_id)
         filtered_queryset = filtered_queryset.filter(
             tenant_id=tenant_id, scan_id__in=latest_scan_ids
         )
@@ -2522,10 +2586,8 @@ class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
         tenant_id = request.tenant_id
         query_params = request.query_params
 
-        latest_scans_queryset = (
-            Scan.all_objects.filter(tenant_id=tenant_id, state=StateChoices.COMPLETED)
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
+        latest_scans_queryset = Scan.all_objects.filter(
+            tenant_id=tenant_id, id__in=self.get_latest_scan_ids(tenant_id)
         )
         raw_latest_scans_ids = list(
             latest_scans_queryset.values_list("id", "unique_resource_count")
@@ -3468,7 +3530,7 @@ class ComplianceOverviewViewSet(BaseRLSViewSet, TaskManagementMixin):
     ),
 )
 @method_decorator(CACHE_DECORATOR, name="list")
-class OverviewViewSet(BaseRLSViewSet):
+class OverviewViewSet(LatestScanOverviewMixin, BaseRLSViewSet):
     queryset = ComplianceOverview.objects.all()
     http_method_names = ["get"]
     ordering = ["-inserted_at"]
@@ -3476,6 +3538,19 @@ class OverviewViewSet(BaseRLSViewSet):
     # the provider through the provider group)
     required_permissions = []
 
+    # Filters answered by the latest scan overviews, any other filter is applied to the scan summaries
+    latest_scan_overview_filters = {"provider_id", "provider_type", "provider_type__in"}
+
+    def _use_latest_scan_overviews(self):
+        if self.action not in ("findings", "findings_severity"):
+            return False
+        filters = {
+            key[len("filter[") : -1]
+            for key in self.request.query_params
+            if key.startswith("filter[")
+        }
+        return filters <= self.latest_scan_overview_filters
+
     def get_queryset(self):
         role = get_role(self.request.user)
         providers = get_providers(role)
@@ -3489,6 +3564,8 @@ class OverviewViewSet(BaseRLSViewSet):
 
         if self.action == "providers":
             return _get_filtered_queryset(Finding)
+        elif self._use_latest_scan_overviews():
+            return _get_filtered_queryset(LatestScanOverview)
         elif self.action in ("findings", "findings_severity", "services"):
             return _get_filtered_queryset(ScanSummary)
         else:
@@ -3508,6 +3585,8 @@ class OverviewViewSet(BaseRLSViewSet):
     def get_filterset_class(self):
         if self.action == "providers":
             return None
+        elif self._use_latest_scan_overviews():
+            return LatestScanOverviewFilter
         elif self.action in ["findings", "findings_severity"]:
             return ScanSummaryFilter
         elif self.action == "services":
@@ -3526,48 +3605,30 @@ class OverviewViewSet(BaseRLSViewSet):
     def providers(self, request):
         tenant_id = self.request.tenant_id
 
-        latest_scan_ids = (
-            Scan.all_objects.filter(tenant_id=tenant_id, state=StateChoices.COMPLETED)
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
-
-        findings_aggregated = (
-            ScanSummary.all_objects.filter(
-                tenant_id=tenant_id, scan_id__in=latest_scan_ids
-            )
+        # The providers whose latest scan has no findings are not listed
+        latest_scan_overviews = (
+            self.get_latest_scan_overviews(tenant_id)
+            .filter(total__gt=0)
             .values(
-                "scan__provider_id",
-                provider=F("scan__provider__provider"),
-            )
-            .annotate(
-                findings_passed=Coalesce(Sum("_pass"), 0),
-                findings_failed=Coalesce(Sum("fail"), 0),
-                findings_muted=Coalesce(Sum("muted"), 0),
-                total_findings=Coalesce(Sum("total"), 0),
+                "total_resources",
+                "_pass",
+                "fail",
+                "muted",
+                "total",
+                provider_type=F("provider__provider"),
             )
         )
 
-        resources_aggregated = (
-            Resource.all_objects.filter(tenant_id=tenant_id)
-            .values("provider_id")
-            .annotate(total_resources=Count("id"))
-        )
-        resource_map = {
-            row["provider_id"]: row["total_resources"] for row in resources_aggregated
-        }
-
         overview = []
-        for row in findings_aggregated:
+        for row in latest_scan_overviews:
             overview.append(
                 {
-                    "provider": row["provider"],
-                    "total_resources": resource_map.get(row["scan__provider_id"], 0),
-                    "total_findings": row["total_findings"],
-                    "findings_passed": row["findings_passed"],
-                    "findings_failed": row["findings_failed"],
-                    "findings_muted": row["findings_muted"],
+                    "provider": row["provider_type"],
+                    "total_resources": row["total_resources"],
+                    "total_findings": row["total"],
+                    "findings_passed": row["_pass"],
+                    "findings_failed": row["fail"],
+                    "findings_muted": row["muted"],
                 }
             )
 
@@ -3582,15 +3643,12 @@ class OverviewViewSet(BaseRLSViewSet):
         queryset = self.get_queryset()
         filtered_queryset = self.filter_queryset(queryset)
 
-        latest_scan_ids = (
-            Scan.all_objects.filter(tenant_id=tenant_id, state=StateChoices.COMPLETED)
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
-        filtered_queryset = filtered_queryset.filter(
-            tenant_id=tenant_id, scan_id__in=latest_scan_ids
-        )
+        # Also computes the overviews of the providers that do not have one yet
+        latest_scan_ids = self.get_latest_scan_ids(tenant_id)
+        if not self._use_latest_scan_overviews():
+            filtered_queryset = filtered_queryset.filter(
+                tenant_id=tenant_id, scan_id__in=latest_scan_ids
+            )
 
         aggregated_totals = filtered_queryset.aggregate(
             _pass=Sum("_pass") or 0,
@@ -3621,26 +3679,25 @@ class OverviewViewSet(BaseRLSViewSet):
         queryset = self.get_queryset()
         filtered_queryset = self.filter_queryset(queryset)
 
-        latest_scan_ids = (
-            Scan.all_objects.filter(tenant_id=tenant_id, state=StateChoices.COMPLETED)
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
-        filtered_queryset = filtered_queryset.filter(
-            tenant_id=tenant_id, scan_id__in=latest_scan_ids
-        )
-
-        severity_counts = (
-            filtered_queryset.values("severity")
-            .annotate(count=Sum("total"))
-            .order_by("severity")
-        )
-
         severity_data = {sev[0]: 0 for sev in SeverityChoices}
 
-        for item in severity_counts:
-            severity_data[item["severity"]] = item["count"]
+        # Also computes the overviews of the providers that do not have one yet
+        latest_scan_ids = self.get_latest_scan_ids(tenant_id)
+        if self._use_latest_scan_overviews():
+            for severities in filtered_queryset.values_list("severities", flat=True):
+                for severity, count in severities.items():
+                    severity_data[severity] = severity_data.get(severity, 0) + count
+        else:
+            severity_counts = (
+                filtered_queryset.filter(
+                    tenant_id=tenant_id, scan_id__in=latest_scan_ids
+                )
+                .values("severity")
+                .annotate(count=Sum("total"))
+                .order_by("severity")
+            )
+            for item in severity_counts:
+                severity_data[item["severity"]] = item["count"]
 
         serializer = OverviewSeveritySerializer(severity_data)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -3651,12 +3708,7 @@ class OverviewViewSet(BaseRLSViewSet):
         queryset = self.get_queryset()
         filtered_queryset = self.filter_queryset(queryset)
 
-        latest_scan_ids = (
-            Scan.all_objects.filter(tenant_id=tenant_id, state=StateChoices.COMPLETED)
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
+        latest_scan_ids = self.get_latest_scan_ids(tenant_id)
         filtered_queryset = filtered_queryset.filter(
             tenant_id=tenant_id, scan_id__in=latest_scan_ids
         )
@@ -257,7 +257,9 @@ FINDINGS_MAX_DAYS_IN_RANGE = env.int("DJANGO_FINDINGS_MAX_DAYS_IN_RANGE", 7)
 DJANGO_TMP_OUTPUT_DIRECTORY = env.str(
     "DJANGO_TMP_OUTPUT_DIRECTORY", "/tmp/prowler_api_output"
 )
-DJANGO_FINDINGS_BATCH_SIZE = env.str("DJANGO_FINDINGS_BATCH_SIZE", 1000)
+DJANGO_FINDINGS_BATCH_SIZE = env.int("DJANGO_FINDINGS_BATCH_SIZE", 1000)
+# Number of threads used to write the output files and upload them to S3
+DJANGO_OUTPUT_MAX_WORKERS = env.int("DJANGO_OUTPUT_MAX_WORKERS", 8)
 
 DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET = env.str("DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET", "")
 DJANGO_OUTPUT_S3_AWS_ACCESS_KEY_ID = env.str("DJANGO_OUTPUT_S3_AWS_ACCESS_KEY_ID", "")
@@ -274,6 +276,19 @@ SECURE_REFERRER_POLICY = "strict-origin-when-cross-origin"
 
 DJANGO_DELETION_BATCH_SIZE = env.int("DJANGO_DELETION_BATCH_SIZE", 5000)
 
+# Number of findings stored together during a scan
+DJANGO_SCAN_INGESTION_BATCH_SIZE = env.int("DJANGO_SCAN_INGESTION_BATCH_SIZE", 1000)
+
+# Number of resources whose failed findings count is updated together after a scan
+DJANGO_RESOURCE_FAILED_FINDINGS_BATCH_SIZE = env.int(
+    "DJANGO_RESOURCE_FAILED_FINDINGS_BATCH_SIZE", 10000
+)
+
+# Maximum page size of the list endpoints paginated with page[cursor]
+DJANGO_CURSOR_PAGINATION_MAX_PAGE_SIZE = env.int(
+    "DJANGO_CURSOR_PAGINATION_MAX_PAGE_SIZE", 1000
+)
+
 # SAML requirement
 CSRF_COOKIE_SECURE = True
 SESSION_COOKIE_SECURE = True
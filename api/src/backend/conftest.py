@@ -12,6 +12,7 @@ from django_celery_results.models import TaskResult
 from rest_framework import status
 from rest_framework.test import APIClient
 from tasks.jobs.backfill import backfill_resource_scan_summaries
+from tasks.jobs.scan import update_latest_scan_overview
 
 from api.db_utils import rls_transaction
 from api.models import (
@@ -1035,6 +1036,13 @@ def scan_summaries_fixture(tenants_fixture, providers_fixture):
     )
 
 
+@pytest.fixture
+def latest_scan_overviews_fixture(providers_fixture):
+    # Refreshed after the scan summaries of each scan, request it after the scans data
+    for provider in providers_fixture:
+        update_latest_scan_overview(str(provider.tenant_id), str(provider.id))
+
+
 @pytest.fixture
 def integrations_fixture(providers_fixture):
     provider1, provider2, *_ = providers_fixture
@@ -1135,6 +1143,7 @@ def latest_scan_finding(authenticated_client, providers_fixture, resources_fixtu
 
     finding.add_resources([resource])
     backfill_resource_scan_summaries(tenant_id, str(scan.id))
+    update_latest_scan_overview(tenant_id, str(provider.id))
     return finding
 
 
@@ -1198,6 +1207,7 @@ def latest_scan_resource(authenticated_client, providers_fixture):
     finding.add_resources([resource])
 
     backfill_resource_scan_summaries(tenant_id, str(scan.id))
+    update_latest_scan_overview(tenant_id, str(provider.id))
     return resource
 
 
@@ -1,13 +1,27 @@
+import io
+import json
 import os
 import re
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
 import boto3
 import config.django.base as base
+import pyarrow as pa
+import pyarrow.parquet as pq
 from botocore.exceptions import ClientError, NoCredentialsError, ParamValidationError
 from celery.utils.log import get_task_logger
 from django.conf import settings
-
+from django.contrib.postgres.expressions import ArraySubquery
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import OuterRef, Prefetch, prefetch_related_objects
+from tasks.utils import batched
+
+from api.db_utils import rls_transaction
+from api.models import Finding, Provider, Resource, ResourceFindingMapping, Scan
+from api.uuid_utils import uuid7_start
 from prowler.config.config import (
     csv_file_suffix,
     html_file_suffix,
@@ -51,6 +65,7 @@ from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365
     ProwlerThreatScoreM365,
 )
 from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.finding import Finding as FindingOutput
 from prowler.lib.outputs.html.html import HTML
 from prowler.lib.outputs.ocsf.ocsf import OCSF
 
@@ -108,6 +123,311 @@ OUTPUT_FORMATS_MAPPING = {
 }
 
 
+# Formats of the findings exports streamed by the API, with their content type and file suffix
+FINDINGS_EXPORT_FORMATS = {
+    "ndjson": {"content_type": "application/gzip", "suffix": ".ndjson.gz"},
+    "parquet": {
+        "content_type": "application/vnd.apache.parquet",
+        "suffix": ".parquet",
+    },
+    "ocsf": {"content_type": "application/gzip", "suffix": ".ocsf.ndjson.gz"},
+}
+
+# Columns of the findings exports, the JSON ones are exported as JSON strings in Parquet
+FINDINGS_EXPORT_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("uid", pa.string()),
+        ("scan_id", pa.string()),
+        ("inserted_at", pa.timestamp("us", tz="UTC")),
+        ("updated_at", pa.timestamp("us", tz="UTC")),
+        ("first_seen_at", pa.timestamp("us", tz="UTC")),
+        ("delta", pa.string()),
+        ("status", pa.string()),
+        ("status_extended", pa.string()),
+        ("severity", pa.string()),
+        ("impact", pa.string()),
+        ("impact_extended", pa.string()),
+        ("check_id", pa.string()),
+        ("check_metadata", pa.string()),
+        ("raw_result", pa.string()),
+        ("tags", pa.string()),
+        ("compliance", pa.string()),
+        ("muted", pa.bool_()),
+        ("muted_reason", pa.string()),
+        ("resource_uids", pa.list_(pa.string())),
+        ("resource_regions", pa.list_(pa.string())),
+        ("resource_services", pa.list_(pa.string())),
+        ("resource_types", pa.list_(pa.string())),
+    ]
+)
+FINDINGS_EXPORT_JSON_FIELDS = ("check_metadata", "raw_result", "tags", "compliance")
+FINDINGS_EXPORT_UUID_FIELDS = ("id", "scan_id")
+
+# gzip header and trailer for the zlib compressor
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class _StreamBuffer(io.RawIOBase):
+    """Write-only file object that keeps the written bytes until they are drained to be streamed."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _get_scan_findings_queryset(tenant_id: str, scan: Scan):
+    """
+    Returns the findings of the scan ordered by their primary key.
+
+    The findings are created after the scan, so their UUIDv7 primary keys are not lower than the
+    start of the day of the scan ID, which prunes the older partitions of the findings table.
+    """
+    return Finding.all_objects.filter(
+        tenant_id=tenant_id, scan_id=scan.id, id__gte=uuid7_start(scan.id)
+    ).order_by("id")
+
+
+def _iter_scan_findings_rows(tenant_id: str, scan: Scan):
+    """
+    Yields the batches of rows of the findings of the scan, read with a server-side cursor.
+
+    Args:
+        tenant_id (str): The tenant identifier.
+        scan (Scan): The scan to export.
+
+    Yields:
+        list[dict]: The rows of up to DJANGO_FINDINGS_BATCH_SIZE findings, with the exported columns.
+    """
+    resource_uids = ArraySubquery(
+        ResourceFindingMapping.objects.filter(finding_id=OuterRef("id")).values(
+            "resource__uid"
+        )
+    )
+    fields = [
+        field for field in FINDINGS_EXPORT_SCHEMA.names if field != "resource_uids"
+    ]
+    with rls_transaction(tenant_id):
+        rows = (
+            _get_scan_findings_queryset(tenant_id, scan)
+            .annotate(resource_uids=resource_uids)
+            .values(*fields, "resource_uids")
+            .iterator(chunk_size=settings.DJANGO_FINDINGS_BATCH_SIZE)
+        )
+        for batch, _ in batched(rows, settings.DJANGO_FINDINGS_BATCH_SIZE):
+            yield batch
+
+
+def _iter_scan_findings_ndjson(tenant_id: str, scan: Scan):
+    """Yields the findings of the scan as NDJSON, one chunk of lines per batch of findings."""
+    for batch in _iter_scan_findings_rows(tenant_id, scan):
+        yield "".join(
+            f"{json.dumps(row, cls=DjangoJSONEncoder)}\n" for row in batch
+        ).encode()
+
+
+def _get_export_provider(provider: Provider) -> SimpleNamespace:
+    """
+    Returns the identity data of the provider used to build the OCSF findings of its scans.
+
+    The data is built from the stored provider, without connecting to the cloud provider like
+    initialize_prowler_provider does, so the stored findings can be exported even if the
+    credentials of the provider are no longer valid.
+
+    Args:
+        provider (Provider): The provider of the exported scan.
+
+    Returns:
+        SimpleNamespace: The provider type and identity attributes read by FindingOutput.
+
+    Raises:
+        ValueError: If the provider type is not supported or its credentials are missing.
+    """
+    name = provider.alias or provider.uid
+    match provider.provider:
+        case Provider.ProviderChoices.AWS.value:
+            # The partition is only known from the ARNs of the scanned resources
+            resource_arn = (
+                Resource.all_objects.filter(
+                    tenant_id=provider.tenant_id,
+                    provider_id=provider.id,
+                    uid__startswith="arn:",
+                )
+                .values_list("uid", flat=True)
+                .first()
+            )
+            return SimpleNamespace(
+                type=provider.provider,
+                identity=SimpleNamespace(
+                    account=provider.uid,
+                    partition=resource_arn.split(":")[1] if resource_arn else "aws",
+                    profile=None,
+                ),
+                organizations_metadata=SimpleNamespace(
+                    account_name=provider.alias,
+                    account_email=None,
+                    organization_arn=None,
+                    organization_id=None,
+                    account_tags={},
+                ),
+            )
+        case Provider.ProviderChoices.GCP.value:
+            return SimpleNamespace(
+                type=provider.provider,
+                identity=SimpleNamespace(profile="default"),
+                projects={
+                    provider.uid: SimpleNamespace(
+                        id=provider.uid, name=name, labels={}, organization=None
+                    )
+                },
+            )
+        case Provider.ProviderChoices.KUBERNETES.value:
+            return SimpleNamespace(
+                type=provider.provider,
+                identity=SimpleNamespace(context=provider.uid, cluster=provider.uid),
+            )
+
+    # The tenant and the client of Azure and M365 are only known from the credentials
+    secret = getattr(provider, "secret", None)
+    if secret is None or provider.provider not in (
+        Provider.ProviderChoices.AZURE.value,
+        Provider.ProviderChoices.M365.value,
+    ):
+        raise ValueError(
+            f"The findings of the {provider.provider} provider {provider.uid} cannot be exported as OCSF"
+        )
+    credentials = secret.secret
+    identity = SimpleNamespace(
+        identity_type=(
+            "Service Principal and User Credentials"
+            if credentials.get("user")
+            else "Service Principal"
+        ),
+        identity_id=credentials.get("client_id", ""),
+    )
+    if provider.provider == Provider.ProviderChoices.AZURE.value:
+        identity.tenant_ids = [credentials.get("tenant_id", "")]
+        identity.tenant_domain = None
+        identity.subscriptions = {name: provider.uid}
+        return SimpleNamespace(
+            type=provider.provider,
+            identity=identity,
+            region_config=SimpleNamespace(name="AzureCloud"),
+        )
+    identity.tenant_id = credentials.get("tenant_id", "")
+    identity.tenant_domain = provider.uid
+    return SimpleNamespace(type=provider.provider, identity=identity)
+
+
+def _iter_scan_findings_ocsf(tenant_id: str, scan: Scan, export_provider):
+    """Yields the findings of the scan as OCSF NDJSON, one chunk of lines per batch of findings."""
+    # The resources are sorted like `finding.resources.first()`, which reads them from the prefetch
+    resources = Prefetch(
+        "resources",
+        queryset=Resource.all_objects.order_by("id").prefetch_related("tags"),
+    )
+    with rls_transaction(tenant_id):
+        findings = _get_scan_findings_queryset(tenant_id, scan).iterator(
+            chunk_size=settings.DJANGO_FINDINGS_BATCH_SIZE
+        )
+        for batch, _ in batched(findings, settings.DJANGO_FINDINGS_BATCH_SIZE):
+            # The resources and their tags of the whole batch are read with one query each
+            prefetch_related_objects(batch, resources)
+            ocsf = OCSF(
+                findings=[
+                    FindingOutput.transform_api_finding(finding, export_provider)
+                    for finding in batch
+                ],
+                from_cli=False,
+            )
+            yield "".join(
+                f"{finding.json(exclude_none=True)}\n" for finding in ocsf.data
+            ).encode()
+
+
+def _stream_gzip(chunks):
+    """Compresses the chunks as a gzip stream, yielding the compressed bytes as they are available."""
+    compressor = zlib.compressobj(wbits=GZIP_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _stream_scan_findings_parquet(tenant_id: str, scan: Scan):
+    """
+    Yields the findings of the scan as a Parquet file, written with one row group per batch of findings.
+
+    The columns are dictionary encoded and compressed with zstd, and each row group is streamed as
+    soon as it is written, so only one batch of findings is kept in memory.
+    """
+    sink = _StreamBuffer()
+    writer = pq.ParquetWriter(sink, FINDINGS_EXPORT_SCHEMA, compression="zstd")
+    try:
+        for batch in _iter_scan_findings_rows(tenant_id, scan):
+            for row in batch:
+                for field in FINDINGS_EXPORT_UUID_FIELDS:
+                    row[field] = str(row[field])
+                for field in FINDINGS_EXPORT_JSON_FIELDS:
+                    row[field] = json.dumps(row[field], cls=DjangoJSONEncoder)
+            writer.write_batch(
+                pa.RecordBatch.from_pylist(batch, schema=FINDINGS_EXPORT_SCHEMA)
+            )
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def stream_scan_findings(tenant_id: str, scan: Scan, export_format: str):
+    """
+    Returns a generator streaming all the findings of a scan in the given format.
+
+    The findings are read from the database in batches of DJANGO_FINDINGS_BATCH_SIZE with a
+    server-side cursor, and every batch is encoded and compressed before reading the next one,
+    so the memory used does not depend on the number of findings of the scan.
+
+    Args:
+        tenant_id (str): The tenant identifier.
+        scan (Scan): The scan to export.
+        export_format (str): One of FINDINGS_EXPORT_FORMATS:
+            - ndjson: gzip compressed JSON lines with the findings as stored in the database.
+            - parquet: Parquet file with the same columns, compressed with zstd.
+            - ocsf: gzip compressed JSON lines with the findings in the OCSF format.
+              The identity of the provider of the scan is read from the stored provider.
+
+    Returns:
+        Iterator[bytes]: The chunks of the exported file.
+
+    Raises:
+        ValueError: If the findings cannot be exported as OCSF for the provider of the scan.
+    """
+    if export_format == "parquet":
+        return _stream_scan_findings_parquet(tenant_id, scan)
+    if export_format == "ocsf":
+        with rls_transaction(tenant_id):
+            export_provider = _get_export_provider(scan.provider)
+        return _stream_gzip(_iter_scan_findings_ocsf(tenant_id, scan, export_provider))
+    return _stream_gzip(_iter_scan_findings_ndjson(tenant_id, scan))
+
+
 def _compress_output_files(output_directory: str) -> str:
     """
     Compress output files from all configured output formats into a ZIP archive.
@@ -189,22 +509,29 @@ def _upload_to_s3(tenant_id: str, zip_path: str, scan_id: str) -> str:
     try:
         s3 = get_s3_client()
 
-        # Upload the ZIP file (outputs) to the S3 bucket
+        # Upload the ZIP file (outputs) and the compliance directory to the S3 bucket concurrently
         zip_key = f"{tenant_id}/{scan_id}/{os.path.basename(zip_path)}"
-        s3.upload_file(
-            Filename=zip_path,
-            Bucket=bucket,
-            Key=zip_key,
-        )
+        uploads = [(zip_path, zip_key)]
 
-        # Upload the compliance directory to the S3 bucket
         compliance_dir = os.path.join(os.path.dirname(zip_path), "compliance")
         for filename in os.listdir(compliance_dir):
             local_path = os.path.join(compliance_dir, filename)
             if not os.path.isfile(local_path):
                 continue
             file_key = f"{tenant_id}/{scan_id}/compliance/{filename}"
-            s3.upload_file(Filename=local_path, Bucket=bucket, Key=file_key)
+            uploads.append((local_path, file_key))
+
+        with ThreadPoolExecutor(
+            max_workers=settings.DJANGO_OUTPUT_MAX_WORKERS
+        ) as executor:
+            futures = [
+                executor.submit(
+                    s3.upload_file, Filename=local_path, Bucket=bucket, Key=key
+                )
+                for local_path, key in uploads
+            ]
+            for future in futures:
+                future.result()
 
         return f"s3://{base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET}/{zip_key}"
     except (ClientError, NoCredentialsError, ParamValidationError, ValueError) as e:
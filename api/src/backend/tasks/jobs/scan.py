@@ -1,28 +1,35 @@
 import json
 import time
-from copy import deepcopy
 from datetime import datetime, timezone
 
 from celery.utils.log import get_task_logger
+from config.django.base import (
+    DJANGO_RESOURCE_FAILED_FINDINGS_BATCH_SIZE,
+    DJANGO_SCAN_INGESTION_BATCH_SIZE,
+)
 from config.settings.celery import CELERY_DEADLOCK_ATTEMPTS
 from django.db import IntegrityError, OperationalError
-from django.db.models import Case, Count, IntegerField, OuterRef, Subquery, Sum, When
+from django.db.models import Case, Count, IntegerField, Sum, When
+from django.db.models.functions import Coalesce
 from tasks.utils import CustomEncoder
 
 from api.compliance import (
     PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE,
-    generate_scan_compliance,
+    generate_scan_requirements_checks_status,
 )
 from api.db_utils import create_objects_in_batches, rls_transaction
 from api.exceptions import ProviderConnectionError
 from api.models import (
     ComplianceRequirementOverview,
     Finding,
+    LatestScanOverview,
     Processor,
     Provider,
     Resource,
+    ResourceFindingMapping,
     ResourceScanSummary,
     ResourceTag,
+    ResourceTagMapping,
     Scan,
     ScanSummary,
     StateChoices,
@@ -35,6 +42,23 @@ from prowler.lib.scan.scan import Scan as ProwlerScan
 
 logger = get_task_logger(__name__)
 
+# Scan summary counters pre-aggregated by the latest scan overviews
+LATEST_SCAN_OVERVIEW_COUNTERS = (
+    "_pass",
+    "fail",
+    "muted",
+    "total",
+    "new",
+    "changed",
+    "unchanged",
+    "fail_new",
+    "fail_changed",
+    "pass_new",
+    "pass_changed",
+    "muted_new",
+    "muted_changed",
+)
+
 
 def _create_finding_delta(
     last_status: FindingStatus | None | str, new_status: FindingStatus | None
@@ -102,6 +126,338 @@ def _store_resources(
     return resource_instance, (resource_instance.uid, resource_instance.region)
 
 
+def _get_resource_tags(
+    tenant_id: str, tag_keys: set[tuple[str, str]]
+) -> dict[tuple[str, str], ResourceTag]:
+    """
+    Retrieve the existing resource tags matching the given key-value pairs with a single query.
+
+    Args:
+        tenant_id (str): The ID of the tenant owning the tags.
+        tag_keys (set[tuple[str, str]]): The (key, value) pairs of the tags.
+
+    Returns:
+        dict[tuple[str, str], ResourceTag]: The existing tags by their (key, value) pair.
+    """
+    tags = ResourceTag.objects.filter(
+        tenant_id=tenant_id,
+        key__in={key for key, _ in tag_keys},
+        value__in={value for _, value in tag_keys},
+    )
+    return {
+        (tag.key, tag.value): tag for tag in tags if (tag.key, tag.value) in tag_keys
+    }
+
+
+def _store_findings_batch(
+    tenant_id: str,
+    provider_instance: Provider,
+    scan_instance: Scan,
+    findings: list[ProwlerFinding],
+    resource_cache: dict[str, Resource],
+    tag_cache: dict[tuple[str, str], ResourceTag],
+    last_status_cache: dict[str, tuple],
+) -> tuple[set[tuple[str, str]], set[tuple[str, str, str, str]]]:
+    """
+    Store a batch of findings with their resources and tags in the database.
+
+    The resources, tags and previous finding statuses missing from the caches are resolved with one query
+    per batch, and the findings and their mappings are written with `bulk_create` in a single transaction.
+
+    Args:
+        tenant_id (str): The ID of the tenant for which the scan is performed.
+        provider_instance (Provider): The provider instance associated with the resources.
+        scan_instance (Scan): The scan instance the findings belong to.
+        findings (list[ProwlerFinding]): The findings to store.
+        resource_cache (dict[str, Resource]): The resources already stored in the scan, by UID.
+        tag_cache (dict[tuple[str, str], ResourceTag]): The tags already stored in the scan, by (key, value).
+        last_status_cache (dict[str, tuple]): The previous status and first seen date of the findings, by UID.
+
+    Returns:
+        tuple:
+            - set[tuple[str, str]]: The (UID, region) of the resources of the findings.
+            - set[tuple[str, str, str, str]]: The (ID, service, region, type) of the resources of the findings.
+    """
+    resource_uids = {finding.resource_uid for finding in findings}
+    tag_keys = {
+        (key, value)
+        for finding in findings
+        for key, value in finding.resource_tags.items()
+    }
+    finding_uids = {finding.uid for finding in findings}
+
+    with rls_transaction(tenant_id):
+        # Resources
+        resources = {
+            uid: resource_cache[uid] for uid in resource_uids if uid in resource_cache
+        }
+        missing_resource_uids = resource_uids - resources.keys()
+        if missing_resource_uids:
+            resources.update(
+                {
+                    resource.uid: resource
+                    for resource in Resource.objects.filter(
+                        tenant_id=tenant_id,
+                        provider=provider_instance,
+                        uid__in=missing_resource_uids,
+                    )
+                }
+            )
+            first_findings = {}
+            for finding in findings:
+                first_findings.setdefault(finding.resource_uid, finding)
+            new_resources = [
+                Resource(
+                    tenant_id=tenant_id,
+                    provider=provider_instance,
+                    uid=uid,
+                    region=first_findings[uid].region,
+                    service=first_findings[uid].service_name,
+                    type=first_findings[uid].resource_type,
+                    name=first_findings[uid].resource_name,
+                )
+                for uid in missing_resource_uids - resources.keys()
+            ]
+            if new_resources:
+                Resource.objects.bulk_create(
+                    new_resources,
+                    batch_size=DJANGO_SCAN_INGESTION_BATCH_SIZE,
+                    ignore_conflicts=True,
+                )
+                # Retrieve them again since the conflicting ones are not created
+                resources.update(
+                    {
+                        resource.uid: resource
+                        for resource in Resource.objects.filter(
+                            tenant_id=tenant_id,
+                            provider=provider_instance,
+                            uid__in=[resource.uid for resource in new_resources],
+                        )
+                    }
+                )
+
+        # Tags
+        tags = {key: tag_cache[key] for key in tag_keys if key in tag_cache}
+        missing_tag_keys = tag_keys - tags.keys()
+        if missing_tag_keys:
+            tags.update(_get_resource_tags(tenant_id, missing_tag_keys))
+            new_tag_keys = missing_tag_keys - tags.keys()
+            if new_tag_keys:
+                ResourceTag.objects.bulk_create(
+                    [
+                        ResourceTag(tenant_id=tenant_id, key=key, value=value)
+                        for key, value in new_tag_keys
+                    ],
+                    batch_size=DJANGO_SCAN_INGESTION_BATCH_SIZE,
+                    ignore_conflicts=True,
+                )
+                tags.update(_get_resource_tags(tenant_id, new_tag_keys))
+
+        # Latest status of each finding from previous scans
+        last_statuses = {
+            uid: last_status_cache[uid]
+            for uid in finding_uids
+            if uid in last_status_cache
+        }
+        missing_finding_uids = finding_uids - last_statuses.keys()
+        if missing_finding_uids:
+            most_recent_findings = (
+                Finding.all_objects.filter(
+                    tenant_id=tenant_id, uid__in=missing_finding_uids
+                )
+                .order_by("uid", "-inserted_at")
+                .distinct("uid")
+                .values("uid", "status", "first_seen_at")
+            )
+            for most_recent_finding in most_recent_findings:
+                last_statuses[most_recent_finding["uid"]] = (
+                    most_recent_finding["status"],
+                    most_recent_finding["first_seen_at"],
+                )
+            for uid in missing_finding_uids - last_statuses.keys():
+                last_statuses[uid] = None, None
+
+        unique_resources = set()
+        scan_resources = set()
+        tag_mappings = {}
+        finding_instances = []
+        resource_finding_mappings = []
+        for finding in findings:
+            resource_instance = resources[finding.resource_uid]
+
+            # Update resource fields if necessary
+            if finding.region and resource_instance.region != finding.region:
+                resource_instance.region = finding.region
+            if resource_instance.service != finding.service_name:
+                resource_instance.service = finding.service_name
+            if resource_instance.type != finding.resource_type:
+                resource_instance.type = finding.resource_type
+            if resource_instance.metadata != finding.resource_metadata:
+                resource_instance.metadata = json.dumps(
+                    finding.resource_metadata, cls=CustomEncoder
+                )
+            if resource_instance.details != finding.resource_details:
+                resource_instance.details = finding.resource_details
+            if resource_instance.partition != finding.partition:
+                resource_instance.partition = finding.partition
+
+            # Update tags
+            for key, value in finding.resource_tags.items():
+                tag_instance = tags[(key, value)]
+                tag_mappings[(resource_instance.id, tag_instance.id)] = (
+                    ResourceTagMapping(
+                        tenant_id=tenant_id,
+                        resource=resource_instance,
+                        tag=tag_instance,
+                    )
+                )
+
+            unique_resources.add((resource_instance.uid, resource_instance.region))
+
+            # Process finding
+            last_status, last_first_seen_at = last_statuses[finding.uid]
+            status = FindingStatus[finding.status]
+            delta = _create_finding_delta(last_status, status)
+            # For the findings prior to the change, when a first finding is found with delta!="new" it will be
+            # assigned a current date as first_seen_at and the successive findings with the same UID will
+            # always get the date of the previous finding.
+            # For new findings, when a finding (delta="new") is found for the first time, the first_seen_at
+            # attribute will be assigned the current date, the following findings will get that date.
+            if not last_first_seen_at:
+                last_first_seen_at = datetime.now(tz=timezone.utc)
+
+            # If the finding is muted at this time the reason must be the configured Mutelist
+            muted_reason = "Muted by mutelist" if finding.muted else None
+
+            finding_instance = Finding(
+                tenant_id=tenant_id,
+                uid=finding.uid,
+                delta=delta,
+                check_metadata=finding.get_metadata(),
+                status=status,
+                status_extended=finding.status_extended,
+                severity=finding.severity,
+                impact=finding.severity,
+                raw_result=finding.raw,
+                check_id=finding.check_id,
+                scan=scan_instance,
+                first_seen_at=last_first_seen_at,
+                muted=finding.muted,
+                muted_reason=muted_reason,
+                compliance=finding.compliance,
+                resource_regions=[resource_instance.region],
+                resource_services=[resource_instance.service],
+                resource_types=[resource_instance.type],
+            )
+            finding_instances.append(finding_instance)
+            resource_finding_mappings.append(
+                ResourceFindingMapping(
+                    tenant_id=tenant_id,
+                    resource=resource_instance,
+                    finding=finding_instance,
+                )
+            )
+
+            # Update scan resource summaries
+            scan_resources.add(
+                (
+                    str(resource_instance.id),
+                    resource_instance.service,
+                    resource_instance.region,
+                    resource_instance.type,
+                )
+            )
+
+        updated_at = datetime.now(tz=timezone.utc)
+        for resource_instance in resources.values():
+            resource_instance.updated_at = updated_at
+        Resource.objects.bulk_update(
+            resources.values(),
+            fields=[
+                "region",
+                "service",
+                "type",
+                "metadata",
+                "details",
+                "partition",
+                "updated_at",
+            ],
+            batch_size=DJANGO_SCAN_INGESTION_BATCH_SIZE,
+        )
+        ResourceTagMapping.objects.bulk_create(
+            tag_mappings.values(),
+            batch_size=DJANGO_SCAN_INGESTION_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        Finding.objects.bulk_create(
+            finding_instances, batch_size=DJANGO_SCAN_INGESTION_BATCH_SIZE
+        )
+        ResourceFindingMapping.objects.bulk_create(
+            resource_finding_mappings, batch_size=DJANGO_SCAN_INGESTION_BATCH_SIZE
+        )
+
+    # The caches are only updated once the batch is stored
+    resource_cache.update(resources)
+    tag_cache.update(tags)
+    last_status_cache.update(last_statuses)
+
+    return unique_resources, scan_resources
+
+
+def _ingest_findings_batch(
+    tenant_id: str,
+    scan_id: str,
+    provider_instance: Provider,
+    scan_instance: Scan,
+    findings: list[ProwlerFinding],
+    resource_cache: dict[str, Resource],
+    tag_cache: dict[tuple[str, str], ResourceTag],
+    last_status_cache: dict[str, tuple],
+    unique_resources: set[tuple[str, str]],
+    scan_resource_cache: set[tuple[str, str, str, str]],
+):
+    """
+    Store a batch of findings, retrying the whole batch on deadlock or integrity errors.
+
+    Args:
+        tenant_id (str): The ID of the tenant for which the scan is performed.
+        scan_id (str): The ID of the scan instance.
+        provider_instance (Provider): The provider instance associated with the resources.
+        scan_instance (Scan): The scan instance the findings belong to.
+        findings (list[ProwlerFinding]): The findings to store.
+        resource_cache (dict[str, Resource]): The resources already stored in the scan, by UID.
+        tag_cache (dict[tuple[str, str], ResourceTag]): The tags already stored in the scan, by (key, value).
+        last_status_cache (dict[str, tuple]): The previous status and first seen date of the findings, by UID.
+        unique_resources (set[tuple[str, str]]): The (UID, region) of the scan resources, updated in place.
+        scan_resource_cache (set[tuple[str, str, str, str]]): The (ID, service, region, type) of the scan resources, updated in place.
+    """
+    for attempt in range(CELERY_DEADLOCK_ATTEMPTS):
+        try:
+            batch_unique_resources, batch_scan_resources = _store_findings_batch(
+                tenant_id,
+                provider_instance,
+                scan_instance,
+                findings,
+                resource_cache,
+                tag_cache,
+                last_status_cache,
+            )
+            break
+        except (OperationalError, IntegrityError) as db_err:
+            if attempt < CELERY_DEADLOCK_ATTEMPTS - 1:
+                logger.warning(
+                    f"{'Deadlock error' if isinstance(db_err, OperationalError) else 'Integrity error'} "
+                    f"detected when storing {len(findings)} findings on scan {scan_id}. Retrying..."
+                )
+                time.sleep(0.1 * (2**attempt))
+                continue
+            else:
+                raise db_err
+
+    unique_resources.update(batch_unique_resources)
+    scan_resource_cache.update(batch_scan_resources)
+
+
 def perform_prowler_scan(
     tenant_id: str, scan_id: str, provider_id: str, checks_to_execute: list[str] = None
 ):
@@ -176,158 +532,49 @@ def perform_prowler_scan(
         tag_cache = {}
         last_status_cache = {}
 
+        # The findings are buffered and stored in batches
+        findings_batch = []
         for progress, findings in prowler_scan.scan():
             for finding in findings:
                 if finding is None:
                     logger.error(f"None finding detected on scan {scan_id}.")
                     continue
-                for attempt in range(CELERY_DEADLOCK_ATTEMPTS):
-                    try:
-                        with rls_transaction(tenant_id):
-                            # Process resource
-                            resource_uid = finding.resource_uid
-                            if resource_uid not in resource_cache:
-                                # Get or create the resource
-                                resource_instance, _ = Resource.objects.get_or_create(
-                                    tenant_id=tenant_id,
-                                    provider=provider_instance,
-                                    uid=resource_uid,
-                                    defaults={
-                                        "region": finding.region,
-                                        "service": finding.service_name,
-                                        "type": finding.resource_type,
-                                        "name": finding.resource_name,
-                                    },
-                                )
-                                resource_cache[resource_uid] = resource_instance
-                            else:
-                                resource_instance = resource_cache[resource_uid]
-
-                        # Update resource fields if necessary
-                        updated_fields = []
-                        if (
-                            finding.region
-                            and resource_instance.region != finding.region
-                        ):
-                            resource_instance.region = finding.region
-                            updated_fields.append("region")
-                        if resource_instance.service != finding.service_name:
-                            resource_instance.service = finding.service_name
-                            updated_fields.append("service")
-                        if resource_instance.type != finding.resource_type:
-                            resource_instance.type = finding.resource_type
-                            updated_fields.append("type")
-                        if resource_instance.metadata != finding.resource_metadata:
-                            resource_instance.metadata = json.dumps(
-                                finding.resource_metadata, cls=CustomEncoder
-                            )
-                            updated_fields.append("metadata")
-                        if resource_instance.details != finding.resource_details:
-                            resource_instance.details = finding.resource_details
-                            updated_fields.append("details")
-                        if resource_instance.partition != finding.partition:
-                            resource_instance.partition = finding.partition
-                            updated_fields.append("partition")
-                        if updated_fields:
-                            with rls_transaction(tenant_id):
-                                resource_instance.save(update_fields=updated_fields)
-                    except (OperationalError, IntegrityError) as db_err:
-                        if attempt < CELERY_DEADLOCK_ATTEMPTS - 1:
-                            logger.warning(
-                                f"{'Deadlock error' if isinstance(db_err, OperationalError) else 'Integrity error'} "
-                                f"detected when processing resource {resource_uid} on scan {scan_id}. Retrying..."
-                            )
-                            time.sleep(0.1 * (2**attempt))
-                            continue
-                        else:
-                            raise db_err
-
-                # Update tags
-                tags = []
-                with rls_transaction(tenant_id):
-                    for key, value in finding.resource_tags.items():
-                        tag_key = (key, value)
-                        if tag_key not in tag_cache:
-                            tag_instance, _ = ResourceTag.objects.get_or_create(
-                                tenant_id=tenant_id, key=key, value=value
-                            )
-                            tag_cache[tag_key] = tag_instance
-                        else:
-                            tag_instance = tag_cache[tag_key]
-                        tags.append(tag_instance)
-                    resource_instance.upsert_or_delete_tags(tags=tags)
-
-                unique_resources.add((resource_instance.uid, resource_instance.region))
-
-                # Process finding
-                with rls_transaction(tenant_id):
-                    finding_uid = finding.uid
-                    last_first_seen_at = None
-                    if finding_uid not in last_status_cache:
-                        most_recent_finding = (
-                            Finding.all_objects.filter(
-                                tenant_id=tenant_id, uid=finding_uid
-                            )
-                            .order_by("-inserted_at")
-                            .values("status", "first_seen_at")
-                            .first()
-                        )
-                        last_status = None
-                        if most_recent_finding:
-                            last_status = most_recent_finding["status"]
-                            last_first_seen_at = most_recent_finding["first_seen_at"]
-                        last_status_cache[finding_uid] = last_status, last_first_seen_at
-                    else:
-                        last_status, last_first_seen_at = last_status_cache[finding_uid]
-
-                    status = FindingStatus[finding.status]
-                    delta = _create_finding_delta(last_status, status)
-                    # For the findings prior to the change, when a first finding is found with delta!="new" it will be
-                    # assigned a current date as first_seen_at and the successive findings with the same UID will
-                    # always get the date of the previous finding.
-                    # For new findings, when a finding (delta="new") is found for the first time, the first_seen_at
-                    # attribute will be assigned the current date, the following findings will get that date.
-                    if not last_first_seen_at:
-                        last_first_seen_at = datetime.now(tz=timezone.utc)
-
-                    # If the finding is muted at this time the reason must be the configured Mutelist
-                    muted_reason = "Muted by mutelist" if finding.muted else None
-
-                    # Create the finding
-                    finding_instance = Finding.objects.create(
-                        tenant_id=tenant_id,
-                        uid=finding_uid,
-                        delta=delta,
-                        check_metadata=finding.get_metadata(),
-                        status=status,
-                        status_extended=finding.status_extended,
-                        severity=finding.severity,
-                        impact=finding.severity,
-                        raw_result=finding.raw,
-                        check_id=finding.check_id,
-                        scan=scan_instance,
-                        first_seen_at=last_first_seen_at,
-                        muted=finding.muted,
-                        muted_reason=muted_reason,
-                        compliance=finding.compliance,
-                    )
-                    finding_instance.add_resources([resource_instance])
-
-                # Update scan resource summaries
-                scan_resource_cache.add(
-                    (
-                        str(resource_instance.id),
-                        resource_instance.service,
-                        resource_instance.region,
-                        resource_instance.type,
-                    )
+                findings_batch.append(finding)
+
+            if len(findings_batch) >= DJANGO_SCAN_INGESTION_BATCH_SIZE:
+                _ingest_findings_batch(
+                    tenant_id,
+                    scan_id,
+                    provider_instance,
+                    scan_instance,
+                    findings_batch,
+                    resource_cache,
+                    tag_cache,
+                    last_status_cache,
+                    unique_resources,
+                    scan_resource_cache,
                 )
+                findings_batch = []
 
             # Update scan progress
             with rls_transaction(tenant_id):
                 scan_instance.progress = progress
                 scan_instance.save()
 
+        if findings_batch:
+            _ingest_findings_batch(
+                tenant_id,
+                scan_id,
+                provider_instance,
+                scan_instance,
+                findings_batch,
+                resource_cache,
+                tag_cache,
+                last_status_cache,
+                unique_resources,
+                scan_resource_cache,
+            )
+
         scan_instance.state = StateChoices.COMPLETED
 
     except Exception as e:
@@ -529,54 +776,158 @@ def aggregate_findings(tenant_id: str, scan_id: str):
             for agg in aggregation
         }
         ScanSummary.objects.bulk_create(scan_aggregations, batch_size=3000)
+        provider_id = (
+            Scan.all_objects.filter(tenant_id=tenant_id, id=scan_id)
+            .values_list("provider_id", flat=True)
+            .first()
+        )
+
+    if provider_id:
+        update_latest_scan_overview(tenant_id, provider_id)
+
+
+def update_latest_scan_overview(tenant_id: str, provider_id: str):
+    """
+    Refresh the overview of the latest completed scan of a provider.
+
+    The findings counters of the scan summaries of the latest completed scan are aggregated
+    once into a single LatestScanOverview row per provider, together with its number of
+    resources and findings by severity, so the overview endpoints read those rows instead
+    of aggregating the scan summaries of the latest scans on every request.
+
+    Args:
+        tenant_id (str): The ID of the tenant to which the provider belongs.
+        provider_id (str): The ID of the provider whose overview needs to be refreshed.
+
+    Returns:
+        LatestScanOverview | None: The refreshed overview, or None if the provider has no completed scans.
+    """
+    with rls_transaction(tenant_id):
+        latest_scan_id = (
+            Scan.all_objects.filter(
+                tenant_id=tenant_id,
+                provider_id=provider_id,
+                state=StateChoices.COMPLETED,
+            )
+            .order_by("-inserted_at")
+            .values_list("id", flat=True)
+            .first()
+        )
+        if latest_scan_id is None:
+            LatestScanOverview.all_objects.filter(
+                tenant_id=tenant_id, provider_id=provider_id
+            ).delete()
+            return None
+
+        scan_summaries = ScanSummary.all_objects.filter(
+            tenant_id=tenant_id, scan_id=latest_scan_id
+        )
+        counters = scan_summaries.aggregate(
+            **{
+                counter: Coalesce(Sum(counter), 0)
+                for counter in LATEST_SCAN_OVERVIEW_COUNTERS
+            }
+        )
+        severities = {
+            row["severity"]: row["count"]
+            for row in scan_summaries.values("severity")
+            .annotate(count=Sum("total"))
+            .order_by()
+        }
+        total_resources = Resource.all_objects.filter(
+            tenant_id=tenant_id, provider_id=provider_id
+        ).count()
+
+        latest_scan_overview = LatestScanOverview(
+            tenant_id=tenant_id,
+            provider_id=provider_id,
+            scan_id=latest_scan_id,
+            total_resources=total_resources,
+            severities=severities,
+            **counters,
+        )
+        # Upsert, the overview of a provider can be refreshed concurrently by several scans
+        LatestScanOverview.all_objects.bulk_create(
+            [latest_scan_overview],
+            update_conflicts=True,
+            unique_fields=["tenant", "provider"],
+            update_fields=[
+                "updated_at",
+                "scan",
+                "total_resources",
+                "severities",
+                *LATEST_SCAN_OVERVIEW_COUNTERS,
+            ],
+        )
+    return latest_scan_overview
 
 
 def _update_resource_failed_findings_count(tenant_id: str, scan_id: str):
     """
     Update the failed_findings_count field for resources based on the latest findings.
 
-    This function calculates the number of failed findings for each resource by:
-    1. Getting the latest finding for each finding.uid
+    The count is calculated and stored with a single UPDATE per chunk of resources by:
+    1. Getting the latest finding for each finding.uid and resource
     2. Counting failed findings per resource
-    3. Updating the failed_findings_count field for each resource
+    3. Updating the failed_findings_count field of the resources whose count changed
 
     Args:
         tenant_id (str): The ID of the tenant to which the scan belongs.
         scan_id (str): The ID of the scan for which to update resource counts.
     """
+    update_query = f"""
+        WITH latest_findings AS (
+            SELECT DISTINCT ON (rfm.resource_id, f.uid)
+                rfm.resource_id,
+                f.status,
+                f.muted
+            FROM {ResourceFindingMapping._meta.db_table} rfm
+            JOIN {Finding._meta.db_table} f ON f.id = rfm.finding_id
+            WHERE rfm.tenant_id = %(tenant_id)s
+              AND f.tenant_id = %(tenant_id)s
+              AND rfm.resource_id = ANY(%(resource_ids)s::uuid[])
+            ORDER BY rfm.resource_id, f.uid, f.inserted_at DESC
+        ),
+        failed_counts AS (
+            SELECT
+                resource_id,
+                COUNT(*) FILTER (
+                    WHERE status = '{FindingStatus.FAIL}' AND NOT muted
+                ) AS failed_count
+            FROM latest_findings
+            GROUP BY resource_id
+        )
+        UPDATE {Resource._meta.db_table} r
+        SET failed_findings_count = COALESCE(fc.failed_count, 0)
+        FROM unnest(%(resource_ids)s::uuid[]) AS chunk(id)
+        LEFT JOIN failed_counts fc ON fc.resource_id = chunk.id
+        WHERE r.tenant_id = %(tenant_id)s
+          AND r.id = chunk.id
+          AND r.failed_findings_count IS DISTINCT FROM COALESCE(fc.failed_count, 0)
+    """
 
     with rls_transaction(tenant_id):
         scan = Scan.objects.get(pk=scan_id)
         provider_id = scan.provider_id
 
-        resources = list(
+        resource_ids = list(
             Resource.all_objects.filter(tenant_id=tenant_id, provider_id=provider_id)
+            .order_by("id")
+            .values_list("id", flat=True)
         )
 
-    # For each resource, calculate failed findings count based on latest findings
-    for resource in resources:
-        with rls_transaction(tenant_id):
-            # Get the latest finding for each finding.uid that affects this resource
-            latest_findings_subquery = (
-                Finding.all_objects.filter(
-                    tenant_id=tenant_id, uid=OuterRef("uid"), resources=resource
-                )
-                .order_by("-inserted_at")
-                .values("id")[:1]
+    # Each chunk of resources is updated in its own transaction
+    for i in range(0, len(resource_ids), DJANGO_RESOURCE_FAILED_FINDINGS_BATCH_SIZE):
+        chunk = resource_ids[i : i + DJANGO_RESOURCE_FAILED_FINDINGS_BATCH_SIZE]
+        with rls_transaction(tenant_id) as cursor:
+            cursor.execute(
+                update_query,
+                {
+                    "tenant_id": tenant_id,
+                    "resource_ids": [str(resource_id) for resource_id in chunk],
+                },
             )
 
-            # Count failed findings from the latest findings
-            failed_count = Finding.all_objects.filter(
-                tenant_id=tenant_id,
-                resources=resource,
-                id__in=Subquery(latest_findings_subquery),
-                status=FindingStatus.FAIL,
-                muted=False,
-            ).count()
-
-            resource.failed_findings_count = failed_count
-            resource.save(update_fields=["failed_findings_count"])
-
 
 def create_compliance_requirements(tenant_id: str, scan_id: str):
     """
@@ -602,19 +953,43 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
             provider_instance = scan_instance.provider
             prowler_provider = return_prowler_provider(provider_instance)
 
-        # Get check status data by region from findings
+        # Get the worst status of each check by region with a single aggregation
         check_status_by_region = {}
         with rls_transaction(tenant_id):
-            findings = Finding.objects.filter(scan_id=scan_id, muted=False)
-            for finding in findings:
-                # Get region from resources
-                for resource in finding.resources.all():
-                    region = resource.region
-                    region_dict = check_status_by_region.setdefault(region, {})
-                    current_status = region_dict.get(finding.check_id)
-                    if current_status == "FAIL":
-                        continue
-                    region_dict[finding.check_id] = finding.status
+            check_statuses = (
+                Finding.objects.filter(scan_id=scan_id, muted=False)
+                .values("resources__region", "check_id")
+                .annotate(
+                    fail=Sum(
+                        Case(
+                            When(status="FAIL", then=1),
+                            default=0,
+                            output_field=IntegerField(),
+                        )
+                    ),
+                    _pass=Sum(
+                        Case(
+                            When(status="PASS", then=1),
+                            default=0,
+                            output_field=IntegerField(),
+                        )
+                    ),
+                )
+            )
+            for check_status in check_statuses:
+                region = check_status["resources__region"]
+                # Findings without resources have no region
+                if region is None:
+                    continue
+                if check_status["fail"]:
+                    status = "FAIL"
+                elif check_status["_pass"]:
+                    status = "PASS"
+                else:
+                    status = "MANUAL"
+                check_status_by_region.setdefault(region, {})[
+                    check_status["check_id"]
+                ] = status
 
         try:
             # Try to get regions from provider
@@ -628,30 +1003,34 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
             provider_instance.provider
         ]
 
-        # Create compliance data by region
-        compliance_overview_by_region = {
-            region: deepcopy(compliance_template) for region in regions
-        }
-
-        # Apply check statuses to compliance data
-        for region, check_status in check_status_by_region.items():
-            compliance_data = compliance_overview_by_region.setdefault(
-                region, deepcopy(compliance_template)
-            )
-            for check_name, status in check_status.items():
-                generate_scan_compliance(
-                    compliance_data,
-                    provider_instance.provider,
-                    check_name,
-                    status,
-                )
+        # The regions with findings are also processed even if the provider does not return them
+        regions_to_process = list(dict.fromkeys(regions))
+        regions_to_process.extend(
+            region
+            for region in check_status_by_region
+            if region not in regions_to_process
+        )
 
         # Prepare compliance requirement objects
         compliance_requirement_objects = []
-        for region, compliance_data in compliance_overview_by_region.items():
-            for compliance_id, compliance in compliance_data.items():
+        for region in regions_to_process:
+            requirements_checks_status = generate_scan_requirements_checks_status(
+                provider_instance.provider, check_status_by_region.get(region, {})
+            )
+            for compliance_id, compliance in compliance_template.items():
                 # Create an overview record for each requirement within each compliance framework
                 for requirement_id, requirement in compliance["requirements"].items():
+                    checks_status = requirements_checks_status.get(
+                        (compliance_id, requirement_id)
+                    )
+                    passed_checks = requirement["checks_status"]["pass"]
+                    failed_checks = requirement["checks_status"]["fail"]
+                    requirement_status = requirement["status"]
+                    if checks_status:
+                        passed_checks += checks_status["pass"]
+                        failed_checks += checks_status["fail"]
+                        if checks_status["fail"]:
+                            requirement_status = "FAIL"
                     compliance_requirement_objects.append(
                         ComplianceRequirementOverview(
                             tenant_id=tenant_id,
@@ -662,10 +1041,10 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
                             version=compliance["version"],
                             requirement_id=requirement_id,
                             description=requirement["description"],
-                            passed_checks=requirement["checks_status"]["pass"],
-                            failed_checks=requirement["checks_status"]["fail"],
+                            passed_checks=passed_checks,
+                            failed_checks=failed_checks,
                             total_checks=requirement["checks_status"]["total"],
-                            requirement_status=requirement["status"],
+                            requirement_status=requirement_status,
                         )
                     )
 
@@ -678,9 +1057,7 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
             "requirements_created": len(compliance_requirement_objects),
             "regions_processed": list(regions),
             "compliance_frameworks": (
-                list(compliance_overview_by_region.get(list(regions)[0], {}).keys())
-                if regions
-                else []
+                list(compliance_template.keys()) if regions else []
             ),
         }
 
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from shutil import rmtree
@@ -5,7 +6,11 @@ from shutil import rmtree
 from celery import chain, shared_task
 from celery.utils.log import get_task_logger
 from config.celery import RLSTask
-from config.django.base import DJANGO_FINDINGS_BATCH_SIZE, DJANGO_TMP_OUTPUT_DIRECTORY
+from config.django.base import (
+    DJANGO_FINDINGS_BATCH_SIZE,
+    DJANGO_OUTPUT_MAX_WORKERS,
+    DJANGO_TMP_OUTPUT_DIRECTORY,
+)
 from django_celery_beat.models import PeriodicTask
 from tasks.jobs.backfill import backfill_resource_scan_summaries
 from tasks.jobs.connection import check_lighthouse_connection, check_provider_connection
@@ -254,11 +259,13 @@ def generate_outputs_task(scan_id: str, provider_id: str, tenant_id: str):
     Process findings in batches and generate output files in multiple formats.
 
     This function retrieves findings associated with a scan, processes them
-    in batches of 50, and writes each batch to the corresponding output files.
-    It reuses output writer instances across batches, updates them with each
-    batch of transformed findings, and uses a flag to indicate when the final
-    batch is being processed. Finally, the output files are compressed and
-    uploaded to S3.
+    in batches of DJANGO_FINDINGS_BATCH_SIZE, and writes each batch to the
+    corresponding output files. Each finding is transformed once per batch and
+    the output and compliance writers run concurrently over the transformed
+    findings, while the next batch is transformed. It reuses output writer
+    instances across batches and uses a flag to indicate when the final batch
+    is being processed. Finally, the output files are compressed and uploaded
+    to S3.
 
     Args:
         tenant_id (str): The tenant identifier.
@@ -295,6 +302,17 @@ def generate_outputs_task(scan_id: str, provider_id: str, tenant_id: str):
 
         return w, initialization
 
+    def write_batch(writer_map, name, factory, transform, is_last, **extra):
+        """
+        Write a batch of findings with writer_map[name], transforming them
+        with transform(writer) if the writer was already created.
+        """
+        writer, initialization = get_writer(writer_map, name, factory, is_last)
+        if not initialization:
+            transform(writer)
+        writer.batch_write_data_to_file(**extra)
+        writer._data.clear()
+
     output_writers = {}
     compliance_writers = {}
 
@@ -303,60 +321,75 @@ def generate_outputs_task(scan_id: str, provider_id: str, tenant_id: str):
     )
 
     qs = Finding.all_objects.filter(scan_id=scan_id).order_by("uid").iterator()
-    for batch, is_last in batched(qs, DJANGO_FINDINGS_BATCH_SIZE):
-        fos = [FindingOutput.transform_api_finding(f, prowler_provider) for f in batch]
-
-        # Outputs
-        for mode, cfg in OUTPUT_FORMATS_MAPPING.items():
-            cls = cfg["class"]
-            suffix = cfg["suffix"]
-            extra = cfg.get("kwargs", {}).copy()
-            if mode == "html":
-                extra.update(provider=prowler_provider, stats=scan_summary)
-
-            writer, initialization = get_writer(
-                output_writers,
-                cls,
-                lambda cls=cls, fos=fos, suffix=suffix: cls(
-                    findings=fos,
-                    file_path=out_dir,
-                    file_extension=suffix,
-                    from_cli=False,
-                ),
-                is_last,
-            )
-            if not initialization:
-                writer.transform(fos)
-            writer.batch_write_data_to_file(**extra)
-            writer._data.clear()
-
-        # Compliance CSVs
-        for name in frameworks_avail:
-            compliance_obj = frameworks_bulk[name]
-
-            klass = GenericCompliance
-            for condition, cls in COMPLIANCE_CLASS_MAP.get(provider_type, []):
-                if condition(name):
-                    klass = cls
-                    break
-
-            filename = f"{comp_dir}_{name}.csv"
-
-            writer, initialization = get_writer(
-                compliance_writers,
-                name,
-                lambda klass=klass, fos=fos: klass(
-                    findings=fos,
-                    compliance=compliance_obj,
-                    file_path=filename,
-                    from_cli=False,
-                ),
-                is_last,
-            )
-            if not initialization:
-                writer.transform(fos, compliance_obj, name)
-            writer.batch_write_data_to_file()
-            writer._data.clear()
+    pending_writes = []
+    with ThreadPoolExecutor(max_workers=DJANGO_OUTPUT_MAX_WORKERS) as executor:
+        for batch, is_last in batched(qs, DJANGO_FINDINGS_BATCH_SIZE):
+            fos = [
+                FindingOutput.transform_api_finding(f, prowler_provider) for f in batch
+            ]
+
+            # Each writer appends to its own file, so the previous batch must be written first
+            for future in pending_writes:
+                future.result()
+            pending_writes = []
+
+            # Outputs
+            for mode, cfg in OUTPUT_FORMATS_MAPPING.items():
+                cls = cfg["class"]
+                suffix = cfg["suffix"]
+                extra = cfg.get("kwargs", {}).copy()
+                if mode == "html":
+                    extra.update(provider=prowler_provider, stats=scan_summary)
+
+                pending_writes.append(
+                    executor.submit(
+                        write_batch,
+                        output_writers,
+                        cls,
+                        lambda cls=cls, fos=fos, suffix=suffix: cls(
+                            findings=fos,
+                            file_path=out_dir,
+                            file_extension=suffix,
+                            from_cli=False,
+                        ),
+                        lambda writer, fos=fos: writer.transform(fos),
+                        is_last,
+                        **extra,
+                    )
+                )
+
+            # Compliance CSVs
+            for name in frameworks_avail:
+                compliance_obj = frameworks_bulk[name]
+
+                klass = GenericCompliance
+                for condition, cls in COMPLIANCE_CLASS_MAP.get(provider_type, []):
+                    if condition(name):
+                        klass = cls
+                        break
+
+                filename = f"{comp_dir}_{name}.csv"
+
+                pending_writes.append(
+                    executor.submit(
+                        write_batch,
+                        compliance_writers,
+                        name,
+                        lambda klass=klass, fos=fos, compliance_obj=compliance_obj, filename=filename: klass(
+                            findings=fos,
+                            compliance=compliance_obj,
+                            file_path=filename,
+                            from_cli=False,
+                        ),
+                        lambda writer, fos=fos, compliance_obj=compliance_obj, name=name: writer.transform(
+                            fos, compliance_obj, name
+                        ),
+                        is_last,
+                    )
+                )
+
+        for future in pending_writes:
+            future.result()
 
     compressed = _compress_output_files(out_dir)
     upload_uri = _upload_to_s3(tenant_id, compressed, scan_id)
@@ -5,13 +5,19 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from botocore.exceptions import ClientError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from tasks.jobs.export import (
     _compress_output_files,
     _generate_output_directory,
+    _get_export_provider,
+    _iter_scan_findings_ocsf,
     _upload_to_s3,
     get_s3_client,
 )
 
+from api.models import ProviderSecret
+
 
 @pytest.mark.django_db
 class TestOutputs:
@@ -164,3 +170,82 @@ class TestOutputs:
 
         assert path.endswith(f"aws-test-check-{output_file_timestamp}")
         assert compliance.endswith(f"aws-test-check-{output_file_timestamp}")
+
+
+@pytest.mark.django_db
+class TestFindingsExport:
+    def test_get_export_provider_aws(self, providers_fixture, resources_fixture):
+        provider = providers_fixture[0]
+
+        export_provider = _get_export_provider(provider)
+
+        assert export_provider.type == "aws"
+        assert export_provider.identity.account == provider.uid
+        assert export_provider.identity.partition == "aws"
+        assert export_provider.organizations_metadata.account_name == provider.alias
+        assert export_provider.organizations_metadata.account_tags == {}
+
+    def test_get_export_provider_gcp(self, providers_fixture):
+        provider = providers_fixture[2]
+
+        export_provider = _get_export_provider(provider)
+
+        assert export_provider.type == "gcp"
+        assert list(export_provider.projects) == [provider.uid]
+        assert export_provider.projects[provider.uid].name == provider.alias
+
+    def test_get_export_provider_azure(self, providers_fixture):
+        provider = providers_fixture[4]
+        ProviderSecret.objects.create(
+            tenant_id=provider.tenant_id,
+            provider=provider,
+            secret_type=ProviderSecret.TypeChoices.STATIC,
+            secret={
+                "client_id": "client-id",
+                "client_secret": "client-secret",
+                "tenant_id": "tenant-id",
+            },
+            name=provider.alias,
+        )
+
+        export_provider = _get_export_provider(provider)
+
+        assert export_provider.type == "azure"
+        assert export_provider.identity.identity_type == "Service Principal"
+        assert export_provider.identity.identity_id == "client-id"
+        assert export_provider.identity.tenant_ids == ["tenant-id"]
+        assert export_provider.identity.subscriptions == {provider.alias: provider.uid}
+
+    def test_get_export_provider_azure_without_secret(self, providers_fixture):
+        with pytest.raises(ValueError):
+            _get_export_provider(providers_fixture[4])
+
+    def test_iter_scan_findings_ocsf_prefetches_resources(self, findings_fixture):
+        scan = findings_fixture[0].scan
+
+        def transform_api_finding(finding, provider):
+            resource = finding.resources.first()
+            return resource.uid, [tag.key for tag in resource.tags.all()]
+
+        with (
+            patch(
+                "tasks.jobs.export.FindingOutput.transform_api_finding",
+                side_effect=transform_api_finding,
+            ),
+            patch("tasks.jobs.export.OCSF") as mock_ocsf,
+            CaptureQueriesContext(connection) as queries,
+        ):
+            mock_ocsf.return_value.data = []
+            list(_iter_scan_findings_ocsf(str(scan.tenant_id), scan, MagicMock()))
+
+        transformed_findings = mock_ocsf.call_args.kwargs["findings"]
+        assert sorted(uid for uid, _ in transformed_findings) == sorted(
+            finding.resources.first().uid for finding in findings_fixture
+        )
+        # The resources of the whole batch are read at once instead of once per finding
+        resource_queries = [
+            query
+            for query in queries.captured_queries
+            if 'FROM "resources"' in query["sql"]
+        ]
+        assert len(resource_queries) == 1
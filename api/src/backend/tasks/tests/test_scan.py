@@ -1,7 +1,7 @@
 import json
 import uuid
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 from tasks.jobs.scan import (
@@ -10,6 +10,7 @@ from tasks.jobs.scan import (
     _update_resource_failed_findings_count,
     create_compliance_requirements,
     perform_prowler_scan,
+    update_latest_scan_overview,
 )
 from tasks.utils import CustomEncoder
 
@@ -17,8 +18,10 @@ from api.exceptions import ProviderConnectionError
 from api.models import (
     ComplianceRequirementOverview,
     Finding,
+    LatestScanOverview,
     Provider,
     Resource,
+    Scan,
     Severity,
     StateChoices,
     StatusChoices,
@@ -49,8 +52,11 @@ class TestPerformScan:
         ):
             # Set up the mock PROWLER_CHECKS
             mock_prowler_checks["aws"] = {
-                "check1": {"compliance1"},
-                "check2": {"compliance1", "compliance2"},
+                "check1": {"compliance1": ["requirement1"]},
+                "check2": {
+                    "compliance1": ["requirement1"],
+                    "compliance2": ["requirement2"],
+                },
             }
 
             # Set up the mock PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE
@@ -216,6 +222,106 @@ class TestPerformScan:
         assert provider.connected is False
         assert isinstance(provider.connection_last_checked_at, datetime)
 
+    @patch("tasks.jobs.scan.DJANGO_SCAN_INGESTION_BATCH_SIZE", 1)
+    @patch("tasks.jobs.scan.ProwlerScan")
+    @patch("tasks.jobs.scan.initialize_prowler_provider")
+    def test_perform_prowler_scan_batched_ingestion(
+        self,
+        mock_initialize_prowler_provider,
+        mock_prowler_scan_class,
+        tenants_fixture,
+        scans_fixture,
+        providers_fixture,
+        resources_fixture,
+        findings_fixture,
+    ):
+        tenant = tenants_fixture[0]
+        scan = scans_fixture[1]
+        provider = providers_fixture[0]
+        resource1, *_ = resources_fixture
+        previous_finding, _ = findings_fixture
+
+        def build_finding(uid, resource_uid, status, resource_tags):
+            finding = MagicMock()
+            finding.uid = uid
+            finding.status = status
+            finding.status_extended = "test status extended"
+            finding.severity = Severity.medium
+            finding.check_id = "check1"
+            finding.get_metadata.return_value = {"key": "value"}
+            finding.resource_uid = resource_uid
+            finding.resource_name = "resource_name"
+            finding.region = "us-east-1"
+            finding.service_name = "ec2"
+            finding.resource_type = "prowler-test"
+            finding.resource_tags = resource_tags
+            finding.resource_metadata = {}
+            finding.resource_details = ""
+            finding.partition = "aws"
+            finding.muted = False
+            finding.raw = {}
+            finding.compliance = {}
+            return finding
+
+        # The existing finding and resource are reused, and the new resource is shared by two findings
+        existing_finding = build_finding(
+            previous_finding.uid,
+            resource1.uid,
+            StatusChoices.PASS,
+            {"key": "value", "new_key": "new_value"},
+        )
+        new_finding1 = build_finding(
+            "new_finding_1", "new_resource", StatusChoices.FAIL, {"key": "value"}
+        )
+        new_finding2 = build_finding(
+            "new_finding_2", "new_resource", StatusChoices.FAIL, {}
+        )
+
+        mock_prowler_scan_instance = MagicMock()
+        mock_prowler_scan_instance.scan.return_value = [
+            (50, [existing_finding, None]),
+            (100, [new_finding1, new_finding2]),
+        ]
+        mock_prowler_scan_class.return_value = mock_prowler_scan_instance
+        mock_initialize_prowler_provider.return_value = MagicMock()
+
+        perform_prowler_scan(str(tenant.id), str(scan.id), str(provider.id))
+
+        scan.refresh_from_db()
+        assert scan.state == StateChoices.COMPLETED
+        assert scan.progress == 100
+        assert scan.unique_resource_count == 2
+
+        scan_findings = {
+            finding.uid: finding for finding in Finding.objects.filter(scan=scan)
+        }
+        assert len(scan_findings) == 3
+        assert scan_findings[previous_finding.uid].delta == Finding.DeltaChoices.CHANGED
+        assert (
+            scan_findings[previous_finding.uid].first_seen_at
+            == previous_finding.first_seen_at
+        )
+        assert scan_findings["new_finding_1"].delta == Finding.DeltaChoices.NEW
+        assert scan_findings["new_finding_2"].delta == Finding.DeltaChoices.NEW
+        assert scan_findings["new_finding_1"].resource_regions == ["us-east-1"]
+        assert scan_findings["new_finding_1"].resource_services == ["ec2"]
+        assert scan_findings["new_finding_1"].resource_types == ["prowler-test"]
+
+        assert list(scan_findings[previous_finding.uid].resources.all()) == [resource1]
+        new_resource = Resource.objects.get(provider=provider, uid="new_resource")
+        assert list(scan_findings["new_finding_1"].resources.all()) == [new_resource]
+        assert list(scan_findings["new_finding_2"].resources.all()) == [new_resource]
+        assert new_resource.name == "resource_name"
+
+        assert {(tag.key, tag.value) for tag in resource1.tags.all()} == {
+            ("key", "value"),
+            ("key2", "value2"),
+            ("new_key", "new_value"),
+        }
+        assert {(tag.key, tag.value) for tag in new_resource.tags.all()} == {
+            ("key", "value")
+        }
+
     @pytest.mark.parametrize(
         "last_status, new_status, expected_delta",
         [
@@ -406,7 +512,10 @@ class TestCreateComplianceRequirements:
             patch(
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
-            patch("tasks.jobs.scan.generate_scan_compliance"),
+            patch(
+                "tasks.jobs.scan.generate_scan_requirements_checks_status",
+                return_value={},
+            ),
             patch("tasks.jobs.scan.create_objects_in_batches") as mock_create_objects,
             patch("api.models.Finding.objects.filter") as mock_findings_filter,
         ):
@@ -475,7 +584,9 @@ class TestCreateComplianceRequirements:
                 },
             }
 
-            mock_findings_filter.return_value = []
+            mock_findings_filter.return_value.values.return_value.annotate.return_value = (
+                []
+            )
 
             result = create_compliance_requirements(tenant_id, scan_id)
 
@@ -516,7 +627,8 @@ class TestCreateComplianceRequirements:
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
             patch(
-                "tasks.jobs.scan.generate_scan_compliance"
+                "tasks.jobs.scan.generate_scan_requirements_checks_status",
+                return_value={},
             ) as mock_generate_compliance,
             patch("tasks.jobs.scan.create_objects_in_batches"),
             patch("api.models.Finding.objects.filter") as mock_findings_filter,
@@ -533,21 +645,20 @@ class TestCreateComplianceRequirements:
             tenant_id = str(tenant.id)
             scan_id = str(scan.id)
 
-            mock_finding1 = MagicMock()
-            mock_finding1.check_id = "check1"
-            mock_finding1.status = "PASS"
-            mock_resource1 = MagicMock()
-            mock_resource1.region = "us-east-1"
-            mock_finding1.resources.all.return_value = [mock_resource1]
-
-            mock_finding2 = MagicMock()
-            mock_finding2.check_id = "check2"
-            mock_finding2.status = "FAIL"
-            mock_resource2 = MagicMock()
-            mock_resource2.region = "us-west-2"
-            mock_finding2.resources.all.return_value = [mock_resource2]
-
-            mock_findings_filter.return_value = [mock_finding1, mock_finding2]
+            mock_findings_filter.return_value.values.return_value.annotate.return_value = [
+                {
+                    "resources__region": "us-east-1",
+                    "check_id": "check1",
+                    "fail": 0,
+                    "_pass": 1,
+                },
+                {
+                    "resources__region": "us-west-2",
+                    "check_id": "check2",
+                    "fail": 1,
+                    "_pass": 0,
+                },
+            ]
 
             mock_prowler_provider_instance = MagicMock()
             mock_prowler_provider_instance.get_regions.return_value = [
@@ -590,7 +701,12 @@ class TestCreateComplianceRequirements:
             result = create_compliance_requirements(tenant_id, scan_id)
 
             mock_findings_filter.assert_called_once_with(scan_id=scan_id, muted=False)
-            assert mock_generate_compliance.call_count == 2
+            mock_generate_compliance.assert_has_calls(
+                [
+                    call(Provider.ProviderChoices.AWS, {"check1": "PASS"}),
+                    call(Provider.ProviderChoices.AWS, {"check2": "FAIL"}),
+                ]
+            )
             assert result["requirements_created"] == 4
             assert set(result["regions_processed"]) == {"us-east-1", "us-west-2"}
 
@@ -606,7 +722,10 @@ class TestCreateComplianceRequirements:
             patch(
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
-            patch("tasks.jobs.scan.generate_scan_compliance"),
+            patch(
+                "tasks.jobs.scan.generate_scan_requirements_checks_status",
+                return_value={},
+            ),
             patch("tasks.jobs.scan.create_objects_in_batches"),
             patch("api.models.Finding.objects.filter") as mock_findings_filter,
         ):
@@ -622,13 +741,14 @@ class TestCreateComplianceRequirements:
             tenant_id = str(tenant.id)
             scan_id = str(scan.id)
 
-            mock_finding = MagicMock()
-            mock_finding.check_id = "check1"
-            mock_finding.status = "PASS"
-            mock_resource = MagicMock()
-            mock_resource.region = "default"
-            mock_finding.resources.all.return_value = [mock_resource]
-            mock_findings_filter.return_value = [mock_finding]
+            mock_findings_filter.return_value.values.return_value.annotate.return_value = [
+                {
+                    "resources__region": "default",
+                    "check_id": "check1",
+                    "fail": 0,
+                    "_pass": 1,
+                }
+            ]
 
             mock_prowler_provider_instance = MagicMock()
             mock_prowler_provider_instance.get_regions.side_effect = AttributeError(
@@ -672,7 +792,8 @@ class TestCreateComplianceRequirements:
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
             patch(
-                "tasks.jobs.scan.generate_scan_compliance"
+                "tasks.jobs.scan.generate_scan_requirements_checks_status",
+                return_value={},
             ) as mock_generate_compliance,
             patch("tasks.jobs.scan.create_objects_in_batches"),
             patch("api.models.Finding.objects.filter") as mock_findings_filter,
@@ -689,7 +810,9 @@ class TestCreateComplianceRequirements:
             tenant_id = str(tenant.id)
             scan_id = str(scan.id)
 
-            mock_findings_filter.return_value = []
+            mock_findings_filter.return_value.values.return_value.annotate.return_value = (
+                []
+            )
 
             mock_prowler_provider_instance = MagicMock()
             mock_prowler_provider_instance.get_regions.return_value = ["us-east-1"]
@@ -714,13 +837,17 @@ class TestCreateComplianceRequirements:
                 },
             }
 
-            mock_findings_filter.return_value = []
+            mock_findings_filter.return_value.values.return_value.annotate.return_value = (
+                []
+            )
 
             result = create_compliance_requirements(tenant_id, scan_id)
 
             assert result["regions_processed"] == ["us-east-1"]
             assert result["requirements_created"] == 1
-            mock_generate_compliance.assert_not_called()
+            mock_generate_compliance.assert_called_once_with(
+                Provider.ProviderChoices.AWS, {}
+            )
 
     def test_create_compliance_requirements_error_handling(
         self,
@@ -763,7 +890,10 @@ class TestCreateComplianceRequirements:
             patch(
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
-            patch("tasks.jobs.scan.generate_scan_compliance"),
+            patch(
+                "tasks.jobs.scan.generate_scan_requirements_checks_status",
+                return_value={},
+            ),
             patch("tasks.jobs.scan.create_objects_in_batches"),
             patch("api.models.Finding.objects.filter") as mock_findings_filter,
         ):
@@ -779,7 +909,9 @@ class TestCreateComplianceRequirements:
             tenant_id = str(tenant.id)
             scan_id = str(scan.id)
 
-            mock_findings_filter.return_value = []
+            mock_findings_filter.return_value.values.return_value.annotate.return_value = (
+                []
+            )
 
             mock_prowler_provider_instance = MagicMock()
             mock_prowler_provider_instance.get_regions.return_value = ["us-east-1"]
@@ -787,7 +919,9 @@ class TestCreateComplianceRequirements:
 
             mock_compliance_template.__getitem__.return_value = {}
 
-            mock_findings_filter.return_value = []
+            mock_findings_filter.return_value.values.return_value.annotate.return_value = (
+                []
+            )
 
             create_compliance_requirements(tenant_id, scan_id)
 
@@ -808,7 +942,8 @@ class TestCreateComplianceRequirements:
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
             patch(
-                "tasks.jobs.scan.generate_scan_compliance"
+                "tasks.jobs.scan.generate_scan_requirements_checks_status",
+                return_value={},
             ) as mock_generate_compliance,
             patch("tasks.jobs.scan.create_objects_in_batches"),
             patch("api.models.Finding.objects.filter") as mock_findings_filter,
@@ -825,21 +960,14 @@ class TestCreateComplianceRequirements:
             tenant_id = str(tenant.id)
             scan_id = str(scan.id)
 
-            mock_finding1 = MagicMock()
-            mock_finding1.check_id = "check1"
-            mock_finding1.status = "PASS"
-            mock_resource1 = MagicMock()
-            mock_resource1.region = "us-east-1"
-            mock_finding1.resources.all.return_value = [mock_resource1]
-
-            mock_finding2 = MagicMock()
-            mock_finding2.check_id = "check1"
-            mock_finding2.status = "FAIL"
-            mock_resource2 = MagicMock()
-            mock_resource2.region = "us-east-1"
-            mock_finding2.resources.all.return_value = [mock_resource2]
-
-            mock_findings_filter.return_value = [mock_finding1, mock_finding2]
+            mock_findings_filter.return_value.values.return_value.annotate.return_value = [
+                {
+                    "resources__region": "us-east-1",
+                    "check_id": "check1",
+                    "fail": 1,
+                    "_pass": 1,
+                }
+            ]
 
             mock_prowler_provider_instance = MagicMock()
             mock_prowler_provider_instance.get_regions.return_value = ["us-east-1"]
@@ -866,7 +994,9 @@ class TestCreateComplianceRequirements:
 
             create_compliance_requirements(tenant_id, scan_id)
 
-            assert mock_generate_compliance.call_count == 1
+            mock_generate_compliance.assert_called_once_with(
+                Provider.ProviderChoices.AWS, {"check1": "FAIL"}
+            )
 
     def test_compliance_overview_aggregation_requirement_fail_priority(
         self,
@@ -883,7 +1013,8 @@ class TestCreateComplianceRequirements:
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
             patch(
-                "tasks.jobs.scan.generate_scan_compliance"
+                "tasks.jobs.scan.generate_scan_requirements_checks_status",
+                return_value={},
             ) as mock_generate_compliance,
             patch("tasks.jobs.scan.create_objects_in_batches") as mock_create_objects,
             patch("api.models.Finding.objects.filter") as mock_findings_filter,
@@ -891,7 +1022,9 @@ class TestCreateComplianceRequirements:
             tenant = tenants_fixture[0]
             scan = scans_fixture[0]
 
-            mock_findings_filter.return_value = []
+            mock_findings_filter.return_value.values.return_value.annotate.return_value = (
+                []
+            )
 
             mock_prowler_provider = MagicMock()
             mock_prowler_provider.get_regions.return_value = [
@@ -974,7 +1107,8 @@ class TestCreateComplianceRequirements:
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
             patch(
-                "tasks.jobs.scan.generate_scan_compliance"
+                "tasks.jobs.scan.generate_scan_requirements_checks_status",
+                return_value={},
             ) as mock_generate_compliance,
             patch("tasks.jobs.scan.create_objects_in_batches") as mock_create_objects,
             patch("api.models.Finding.objects.filter") as mock_findings_filter,
@@ -983,7 +1117,9 @@ class TestCreateComplianceRequirements:
             scan = scans_fixture[0]
             providers_fixture[0]
 
-            mock_findings_filter.return_value = []
+            mock_findings_filter.return_value.values.return_value.annotate.return_value = (
+                []
+            )
 
             mock_prowler_provider = MagicMock()
             mock_prowler_provider.get_regions.return_value = ["us-east-1", "us-west-2"]
@@ -1061,7 +1197,8 @@ class TestCreateComplianceRequirements:
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
             patch(
-                "tasks.jobs.scan.generate_scan_compliance"
+                "tasks.jobs.scan.generate_scan_requirements_checks_status",
+                return_value={},
             ) as mock_generate_compliance,
             patch("tasks.jobs.scan.create_objects_in_batches") as mock_create_objects,
             patch("api.models.Finding.objects.filter") as mock_findings_filter,
@@ -1069,7 +1206,9 @@ class TestCreateComplianceRequirements:
             tenant = tenants_fixture[0]
             scan = scans_fixture[0]
 
-            mock_findings_filter.return_value = []
+            mock_findings_filter.return_value.values.return_value.annotate.return_value = (
+                []
+            )
 
             mock_prowler_provider = MagicMock()
             mock_prowler_provider.get_regions.return_value = ["us-east-1", "us-west-2"]
@@ -1168,84 +1307,267 @@ class TestCreateComplianceRequirements:
             assert all(obj.requirement_status == "PASS" for obj in req_1_objects)
             assert all(obj.requirement_status == "FAIL" for obj in req_2_objects)
 
+    def test_create_compliance_requirements_checks_status_by_region(
+        self,
+        tenants_fixture,
+        scans_fixture,
+        providers_fixture,
+    ):
+        with (
+            patch("api.db_utils.rls_transaction"),
+            patch(
+                "tasks.jobs.scan.return_prowler_provider"
+            ) as mock_return_prowler_provider,
+            patch(
+                "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
+            ) as mock_compliance_template,
+            patch(
+                "api.compliance.PROWLER_CHECKS",
+                {
+                    Provider.ProviderChoices.AWS: {
+                        "check_1": {"test_compliance": ["req_1"]},
+                        "check_2": {"test_compliance": ["req_1"]},
+                    }
+                },
+            ),
+            patch("tasks.jobs.scan.create_objects_in_batches") as mock_create_objects,
+            patch("api.models.Finding.objects.filter") as mock_findings_filter,
+        ):
+            tenant = tenants_fixture[0]
+            scan = scans_fixture[0]
+            provider = providers_fixture[0]
+
+            provider.provider = Provider.ProviderChoices.AWS
+            provider.save()
+            scan.provider = provider
+            scan.save()
+
+            mock_findings_filter.return_value.values.return_value.annotate.return_value = [
+                {
+                    "resources__region": "us-east-1",
+                    "check_id": "check_1",
+                    "fail": 0,
+                    "_pass": 3,
+                },
+                {
+                    "resources__region": "us-east-1",
+                    "check_id": "check_2",
+                    "fail": 0,
+                    "_pass": 1,
+                },
+                {
+                    "resources__region": "us-west-2",
+                    "check_id": "check_1",
+                    "fail": 2,
+                    "_pass": 1,
+                },
+                {
+                    "resources__region": None,
+                    "check_id": "check_2",
+                    "fail": 1,
+                    "_pass": 0,
+                },
+            ]
+
+            mock_prowler_provider = MagicMock()
+            mock_prowler_provider.get_regions.return_value = ["us-east-1"]
+            mock_return_prowler_provider.return_value = mock_prowler_provider
+
+            mock_compliance_template.__getitem__.return_value = {
+                "test_compliance": {
+                    "framework": "Test Framework",
+                    "version": "1.0",
+                    "requirements": {
+                        "req_1": {
+                            "description": "Test Requirement 1",
+                            "checks": {"check_1": None, "check_2": None},
+                            "checks_status": {
+                                "pass": 0,
+                                "fail": 0,
+                                "manual": 0,
+                                "total": 2,
+                            },
+                            "status": "PASS",
+                        }
+                    },
+                }
+            }
+
+            result = create_compliance_requirements(str(tenant.id), str(scan.id))
+
+            assert result["requirements_created"] == 2
+            created_objects = {
+                obj.region: obj for obj in mock_create_objects.call_args[0][2]
+            }
+            assert created_objects["us-east-1"].passed_checks == 2
+            assert created_objects["us-east-1"].failed_checks == 0
+            assert created_objects["us-east-1"].requirement_status == "PASS"
+            assert created_objects["us-west-2"].passed_checks == 0
+            assert created_objects["us-west-2"].failed_checks == 1
+            assert created_objects["us-west-2"].requirement_status == "FAIL"
+
+
+@pytest.mark.django_db
+class TestUpdateLatestScanOverview:
+    def test_update_latest_scan_overview(
+        self, tenants_fixture, providers_fixture, scan_summaries_fixture
+    ):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+
+        latest_scan_overview = update_latest_scan_overview(
+            str(tenant.id), str(provider.id)
+        )
+
+        stored_overview = LatestScanOverview.objects.get(
+            tenant_id=tenant.id, provider_id=provider.id
+        )
+        assert stored_overview.id == latest_scan_overview.id
+        assert stored_overview.scan.name == "overview scan"
+        assert stored_overview._pass == 2
+        assert stored_overview.fail == 1
+        assert stored_overview.muted == 1
+        assert stored_overview.total == 4
+        assert stored_overview.new == 4
+        assert stored_overview.fail_new == 1
+        assert stored_overview.severities == {"high": 3, "critical": 1}
+
+    def test_update_latest_scan_overview_newer_scan(
+        self, tenants_fixture, providers_fixture, scan_summaries_fixture
+    ):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+        update_latest_scan_overview(str(tenant.id), str(provider.id))
+
+        newer_scan = Scan.objects.create(
+            name="newer scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.COMPLETED,
+            tenant=tenant,
+        )
+        update_latest_scan_overview(str(tenant.id), str(provider.id))
+
+        stored_overviews = LatestScanOverview.objects.filter(
+            tenant_id=tenant.id, provider_id=provider.id
+        )
+        assert stored_overviews.count() == 1
+        assert stored_overviews[0].scan_id == newer_scan.id
+        assert stored_overviews[0].total == 0
+        assert stored_overviews[0].severities == {}
+
+    def test_update_latest_scan_overview_no_completed_scans(
+        self, tenants_fixture, providers_fixture
+    ):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+
+        assert update_latest_scan_overview(str(tenant.id), str(provider.id)) is None
+        assert not LatestScanOverview.objects.filter(
+            tenant_id=tenant.id, provider_id=provider.id
+        ).exists()
+
 
 @pytest.mark.django_db
 class TestUpdateResourceFailedFindingsCount:
-    @patch("api.models.Resource.all_objects.filter")
-    @patch("api.models.Finding.all_objects.filter")
     def test_failed_findings_count_update(
         self,
-        mock_finding_filter,
-        mock_resource_filter,
         tenants_fixture,
         scans_fixture,
-        providers_fixture,
+        resources_fixture,
+        findings_fixture,
     ):
         tenant = tenants_fixture[0]
         scan = scans_fixture[0]
-        provider = providers_fixture[0]
-
-        scan.provider = provider
-        scan.save()
+        resource1, resource2, _ = resources_fixture
 
         tenant_id = str(tenant.id)
         scan_id = str(scan.id)
 
-        resource1 = MagicMock()
-        resource1.uid = "res-1"
-        resource1.failed_findings_count = None
-        resource1.save = MagicMock()
+        # Another failed finding for resource1, the muted failed finding of resource2 is not counted
+        finding = Finding.objects.create(
+            tenant_id=tenant_id,
+            uid="test_finding_uid_3",
+            scan=scan,
+            status=StatusChoices.FAIL,
+            severity=Severity.high,
+            impact=Severity.high,
+            check_id="test_check_id",
+            check_metadata={"CheckId": "test_check_id"},
+        )
+        finding.add_resources([resource1])
+
+        _update_resource_failed_findings_count(tenant_id, scan_id)
+
+        resource1.refresh_from_db()
+        resource2.refresh_from_db()
+        assert resource1.failed_findings_count == 2
+        assert resource2.failed_findings_count == 0
 
-        resource2 = MagicMock()
-        resource2.uid = "res-2"
-        resource2.failed_findings_count = None
-        resource2.save = MagicMock()
+    def test_failed_findings_count_uses_latest_findings(
+        self,
+        tenants_fixture,
+        scans_fixture,
+        resources_fixture,
+        findings_fixture,
+    ):
+        tenant = tenants_fixture[0]
+        scan, scan2, _ = scans_fixture
+        resource1, *_ = resources_fixture
+        finding1, _ = findings_fixture
 
-        mock_resource_filter.return_value = [resource1, resource2]
+        tenant_id = str(tenant.id)
 
-        fake_subquery_qs = MagicMock()
-        fake_subquery_qs.order_by.return_value = fake_subquery_qs
-        fake_subquery_qs.values.return_value = fake_subquery_qs
-        fake_subquery_qs.__getitem__.return_value = fake_subquery_qs
+        _update_resource_failed_findings_count(tenant_id, str(scan.id))
+        resource1.refresh_from_db()
+        assert resource1.failed_findings_count == 1
+
+        # The finding passes in the latest scan
+        latest_finding = Finding.objects.create(
+            tenant_id=tenant_id,
+            uid=finding1.uid,
+            scan=scan2,
+            status=StatusChoices.PASS,
+            severity=Severity.critical,
+            impact=Severity.critical,
+            check_id=finding1.check_id,
+            check_metadata=finding1.check_metadata,
+        )
+        latest_finding.add_resources([resource1])
 
-        def finding_filter_side_effect(*args, **kwargs):
-            if "status" in kwargs:
-                qs_count = MagicMock()
-                if kwargs.get("resources") == resource1:
-                    qs_count.count.return_value = 3
-                else:
-                    qs_count.count.return_value = 0
-                return qs_count
-            return fake_subquery_qs
+        _update_resource_failed_findings_count(tenant_id, str(scan2.id))
 
-        mock_finding_filter.side_effect = finding_filter_side_effect
+        resource1.refresh_from_db()
+        assert resource1.failed_findings_count == 0
 
-        _update_resource_failed_findings_count(tenant_id, scan_id)
+    @patch("tasks.jobs.scan.DJANGO_RESOURCE_FAILED_FINDINGS_BATCH_SIZE", 1)
+    def test_failed_findings_count_update_in_chunks(
+        self,
+        tenants_fixture,
+        scans_fixture,
+        resources_fixture,
+        findings_fixture,
+    ):
+        tenant = tenants_fixture[0]
+        scan = scans_fixture[0]
+        resource1, resource2, _ = resources_fixture
 
-        # resource1 should have been updated to 3
-        assert resource1.failed_findings_count == 3
-        resource1.save.assert_called_once_with(update_fields=["failed_findings_count"])
+        _update_resource_failed_findings_count(str(tenant.id), str(scan.id))
 
-        # resource2 should have been updated to 0
+        resource1.refresh_from_db()
+        resource2.refresh_from_db()
+        assert resource1.failed_findings_count == 1
         assert resource2.failed_findings_count == 0
-        resource2.save.assert_called_once_with(update_fields=["failed_findings_count"])
 
-    @patch("api.models.Resource.all_objects.filter", return_value=[])
-    @patch("api.models.Finding.all_objects.filter")
     def test_no_resources_no_error(
         self,
-        mock_finding_filter,
-        mock_resource_filter,
         tenants_fixture,
         scans_fixture,
         providers_fixture,
     ):
         tenant = tenants_fixture[0]
         scan = scans_fixture[0]
-        provider = providers_fixture[0]
-        scan.provider = provider
-        scan.save()
 
         _update_resource_failed_findings_count(str(tenant.id), str(scan.id))
 
-        mock_finding_filter.assert_not_called()
+        assert not Resource.objects.filter(provider=scan.provider).exists()
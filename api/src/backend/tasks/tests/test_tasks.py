@@ -358,6 +358,70 @@ class TestGenerateOutputs:
         assert writer.transform_calls == [([raw2], compliance_obj, "cis")]
         assert result == {"upload": True}
 
+    def test_compliance_writers_run_concurrently_per_framework(self):
+        compliance_objs = {"cis": MagicMock(), "ens": MagicMock()}
+        writer_instances = {}
+
+        class TrackingComplianceWriter:
+            def __init__(self, findings, compliance, file_path, from_cli):
+                self.compliance = compliance
+                self.file_path = file_path
+                self.written_batches = 0
+                self._data = []
+                writer_instances[file_path] = self
+
+            def transform(self, fos, comp_obj, name):
+                assert comp_obj is self.compliance
+
+            def batch_write_data_to_file(self):
+                self.written_batches += 1
+
+        with (
+            patch("tasks.tasks.ScanSummary.objects.filter") as mock_summary,
+            patch(
+                "tasks.tasks.Provider.objects.get",
+                return_value=MagicMock(uid="UID", provider="aws"),
+            ),
+            patch("tasks.tasks.initialize_prowler_provider"),
+            patch("tasks.tasks.Compliance.get_bulk", return_value=compliance_objs),
+            patch("tasks.tasks.get_compliance_frameworks", return_value=["cis", "ens"]),
+            patch(
+                "tasks.tasks._generate_output_directory",
+                return_value=("outdir", "compdir"),
+            ),
+            patch("tasks.tasks.FindingOutput._transform_findings_stats"),
+            patch(
+                "tasks.tasks.FindingOutput.transform_api_finding",
+                side_effect=lambda f, prov: f,
+            ),
+            patch("tasks.tasks._compress_output_files", return_value="outdir.zip"),
+            patch("tasks.tasks._upload_to_s3", return_value="s3://bucket/outdir.zip"),
+            patch("tasks.tasks.rmtree"),
+            patch("tasks.tasks.Scan.all_objects.filter"),
+            patch(
+                "tasks.tasks.batched",
+                return_value=[([MagicMock()], False), ([MagicMock()], True)],
+            ),
+            patch("tasks.tasks.OUTPUT_FORMATS_MAPPING", {}),
+            patch(
+                "tasks.tasks.COMPLIANCE_CLASS_MAP",
+                {"aws": [(lambda name: True, TrackingComplianceWriter)]},
+            ),
+        ):
+            mock_summary.return_value.exists.return_value = True
+
+            result = generate_outputs_task(
+                scan_id=self.scan_id,
+                provider_id=self.provider_id,
+                tenant_id=self.tenant_id,
+            )
+
+        assert result == {"upload": True}
+        # Each framework gets its own writer, even if they are created in other threads
+        assert writer_instances["compdir_cis.csv"].compliance is compliance_objs["cis"]
+        assert writer_instances["compdir_ens.csv"].compliance is compliance_objs["ens"]
+        assert all(writer.written_batches == 2 for writer in writer_instances.values())
+
     def test_generate_outputs_logs_rmtree_exception(self, caplog):
         mock_finding_output = MagicMock()
         mock_finding_output.compliance = {"cis": ["requirement-1", "requirement-2"]}
@@ -84,17 +84,22 @@ def load_csv_files(csv_files):
     """Load CSV files into a single pandas DataFrame."""
     dfs = []
     for file in csv_files:
-        account_columns = ["ACCOUNT_ID", "ACCOUNT_UID", "SUBSCRIPTION"]
+        # Read the Parquet output of the same scan if it was also generated, it has the same columns
+        parquet_file = f"{os.path.splitext(file)[0]}.parquet"
+        if os.path.exists(parquet_file):
+            df = pd.read_parquet(parquet_file)
+        else:
+            account_columns = ["ACCOUNT_ID", "ACCOUNT_UID", "SUBSCRIPTION"]
 
-        df_sample = pd.read_csv(file, sep=";", on_bad_lines="skip", nrows=1)
+            df_sample = pd.read_csv(file, sep=";", on_bad_lines="skip", nrows=1)
 
-        dtype_dict = {}
-        for col in account_columns:
-            if col in df_sample.columns:
-                dtype_dict[col] = str
+            dtype_dict = {}
+            for col in account_columns:
+                if col in df_sample.columns:
+                    dtype_dict[col] = str
 
-        # Read the full file with proper dtypes
-        df = pd.read_csv(file, sep=";", on_bad_lines="skip", dtype=dtype_dict)
+            # Read the full file with proper dtypes
+            df = pd.read_csv(file, sep=";", on_bad_lines="skip", dtype=dtype_dict)
 
         if "CHECK_ID" in df.columns:
             if "TIMESTAMP" in df.columns or df["PROVIDER"].unique() == "aws":
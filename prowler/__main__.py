@@ -13,6 +13,7 @@ from prowler.config.config import (
     html_file_suffix,
     json_asff_file_suffix,
     json_ocsf_file_suffix,
+    parquet_file_suffix,
 )
 from prowler.lib.banner import print_banner
 from prowler.lib.check.check import (
@@ -89,10 +90,13 @@ from prowler.lib.outputs.finding import Finding
 from prowler.lib.outputs.html.html import HTML
 from prowler.lib.outputs.ocsf.ocsf import OCSF
 from prowler.lib.outputs.outputs import extract_findings_statistics
+from prowler.lib.outputs.parquet.parquet import Parquet
 from prowler.lib.outputs.slack.slack import Slack
+from prowler.lib.outputs.streaming import StreamingOutputs
 from prowler.lib.outputs.summary_table import display_summary_table
 from prowler.providers.aws.lib.s3.s3 import S3
 from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
+from prowler.providers.aws.lib.service.service import AWSService
 from prowler.providers.aws.models import AWSOutputOptions
 from prowler.providers.azure.models import AzureOutputOptions
 from prowler.providers.common.provider import Provider
@@ -312,12 +316,30 @@ def prowler():
         run_provider_quick_inventory(global_provider, args)
         sys.exit()
 
+    # Write the findings to the outputs as soon as each check is completed
+    streaming_outputs = None
+    if getattr(args, "streaming_outputs", False) and not output_options.fixer:
+        streaming_outputs = StreamingOutputs(
+            provider=global_provider,
+            output_options=output_options,
+            output_formats=args.output_formats,
+            compliance_frameworks={
+                compliance_name: bulk_compliance_frameworks[compliance_name]
+                for compliance_name in set(output_options.output_modes).intersection(
+                    get_available_compliance_frameworks(provider)
+                )
+            },
+            keep_asff_findings=provider == "aws" and args.security_hub,
+        )
+
     # Execute checks
     findings = []
 
     if provider == "iac":
         # For IAC provider, run the scan directly
         findings = global_provider.run()
+        if streaming_outputs:
+            streaming_outputs.write(findings)
     elif len(checks_to_execute):
         findings = execute_checks(
             checks_to_execute,
@@ -325,7 +347,30 @@ def prowler():
             custom_checks_metadata,
             args.config_file,
             output_options,
+            parallel_checks=getattr(args, "parallel_checks", 1),
+            prefetch_services=getattr(args, "prefetch_services", False),
+            findings_handler=streaming_outputs.write if streaming_outputs else None,
         )
+        # The AWS services are not used once the checks are executed
+        if provider == "aws":
+            AWSService.shutdown_thread_pool()
+            # Report the APIs that have been throttled during the scan
+            throttled_apis = global_provider.api_calls_stats.get_throttled_apis()
+            for (service, region, operation), api_stats in throttled_apis.items():
+                logger.warning(
+                    f"{service} - {region} - {operation}: {api_stats['throttles']} throttled requests and {api_stats['retries']} retries in {api_stats['calls']} calls"
+                )
+            total_throttles = sum(
+                api_stats["throttles"] for api_stats in throttled_apis.values()
+            )
+            if (
+                total_throttles
+                and not args.only_logs
+                and args.aws_retries_mode != "adaptive"
+            ):
+                print(
+                    f"{Style.BRIGHT}{Fore.YELLOW}\n{total_throttles} AWS API requests were throttled during the scan, use --aws-retries-mode adaptive to back off automatically.{Style.RESET_ALL}"
+                )
     else:
         logger.error(
             "There are no checks to execute. Please, check your input arguments"
@@ -350,19 +395,26 @@ def prowler():
         sys.exit()
 
     # Outputs
-    # TODO: this part is needed since the checks generates a Check_Report_XXX and the output uses Finding
-    # This will be refactored for the outputs generate directly the Finding
-    finding_outputs = []
-    for finding in findings:
-        try:
-            finding_outputs.append(
-                Finding.generate_output(global_provider, finding, output_options)
-            )
-        except Exception:
-            continue
+    if streaming_outputs:
+        # The findings have been already written, only their summary is kept for the tables
+        generated_outputs = streaming_outputs.close()
+        stats = streaming_outputs.stats
+        findings = streaming_outputs.findings
+    else:
+        # TODO: this part is needed since the checks generates a Check_Report_XXX and the output uses Finding
+        # This will be refactored for the outputs generate directly the Finding
+        finding_outputs = []
+        for finding in findings:
+            try:
+                finding_outputs.append(
+                    Finding.generate_output(global_provider, finding, output_options)
+                )
+            except Exception:
+                continue
 
-    # Extract findings stats
-    stats = extract_findings_statistics(finding_outputs)
+        # Extract findings stats
+        stats = extract_findings_statistics(finding_outputs)
+        generated_outputs = {"regular": [], "compliance": []}
 
     if args.slack:
         # TODO: this should be also in a config file
@@ -385,9 +437,7 @@ def prowler():
             )
             sys.exit(1)
 
-    generated_outputs = {"regular": [], "compliance": []}
-
-    if args.output_formats:
+    if args.output_formats and not streaming_outputs:
         for mode in args.output_formats:
             filename = (
                 f"{output_options.output_directory}/{output_options.output_filename}"
@@ -426,10 +476,21 @@ def prowler():
                 html_output.batch_write_data_to_file(
                     provider=global_provider, stats=stats
                 )
+            if mode == "parquet":
+                parquet_output = Parquet(
+                    findings=finding_outputs,
+                    file_path=f"{filename}{parquet_file_suffix}",
+                )
+                generated_outputs["regular"].append(parquet_output)
+                parquet_output.batch_write_data_to_file()
 
-    # Compliance Frameworks
-    input_compliance_frameworks = set(output_options.output_modes).intersection(
-        get_available_compliance_frameworks(provider)
+    # Compliance Frameworks, already written with the findings when streaming the outputs
+    input_compliance_frameworks = (
+        set()
+        if streaming_outputs
+        else set(output_options.output_modes).intersection(
+            get_available_compliance_frameworks(provider)
+        )
     )
     if provider == "aws":
         for compliance_name in input_compliance_frameworks:
@@ -880,7 +941,11 @@ def prowler():
                 aws_account_id=global_provider.identity.account,
                 aws_partition=global_provider.identity.partition,
                 aws_session=global_provider.session.current_session,
-                findings=asff_output.data,
+                findings=(
+                    streaming_outputs.asff_findings
+                    if streaming_outputs
+                    else asff_output.data
+                ),
                 send_only_fails=output_options.send_sh_only_fails,
                 aws_security_hub_available_regions=security_hub_regions,
             )
@@ -5,8 +5,10 @@ import re
 import shutil
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from queue import Queue
 from types import ModuleType
-from typing import Any
+from typing import Any, Callable, Generator
 
 from alive_progress import alive_bar
 from colorama import Fore, Style
@@ -15,7 +17,10 @@ import prowler
 from prowler.config.config import orange_color
 from prowler.lib.check.custom_checks_metadata import update_check_metadata
 from prowler.lib.check.models import Check
-from prowler.lib.check.utils import recover_checks_from_provider
+from prowler.lib.check.utils import (
+    recover_checks_from_provider,
+    recover_service_clients_from_checks,
+)
 from prowler.lib.logger import logger
 from prowler.lib.outputs.outputs import report
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
@@ -298,6 +303,115 @@ def import_check(check_path: str) -> ModuleType:
     return lib
 
 
+def prefetch_service_clients(
+    checks_to_execute: list, provider: str, max_workers: int = 10
+) -> None:
+    """
+    Initialise concurrently all the service clients required by the checks to execute.
+
+    The service clients are instantiated when their *_client module is imported for the first time,
+    so importing them all up front overlaps the resource collection of every service instead of
+    running it when the first check of each service is executed.
+
+    Args:
+        checks_to_execute (list): list of checks to execute
+        provider (str): provider type
+        max_workers (int): maximum number of services initialised at the same time
+    """
+    client_modules = recover_service_clients_from_checks(provider, checks_to_execute)
+    logger.info(
+        f"Initialising {len(client_modules)} service clients for the {provider.upper()} provider..."
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(importlib.import_module, client_module): client_module
+            for client_module in sorted(client_modules)
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as error:
+                # The error will be raised again and handled when the checks import the client
+                logger.error(
+                    f"{futures[future]} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+
+def group_checks_by_service(checks_to_execute: list) -> dict[str, list[str]]:
+    """
+    group_checks_by_service returns the checks to execute grouped by service, keeping the input order.
+
+    Example:
+        group_checks_by_service(["ec2_ami_public", "s3_bucket_public_access", "ec2_ebs_public_snapshot"])
+        -> {"ec2": ["ec2_ami_public", "ec2_ebs_public_snapshot"], "s3": ["s3_bucket_public_access"]}
+    """
+    service_checks = {}
+    for check_name in checks_to_execute:
+        service = check_name.split("_")[0]
+        service_checks.setdefault(service, []).append(check_name)
+    return service_checks
+
+
+def execute_checks_in_parallel(
+    checks_to_execute: list,
+    global_provider: Any,
+    custom_checks_metadata: Any,
+    output_options: Any = None,
+    max_workers: int = 1,
+) -> Generator[tuple[str, Check, list], None, None]:
+    """
+    Execute the checks concurrently and yield the results as soon as each check is completed.
+
+    The checks of the same service are executed sequentially within the same worker,
+    so each service client is only initialised once and the workers do not wait on each other to import it.
+    The results are yielded from the calling thread, so the caller can update the outputs and the audit metadata safely.
+
+    Args:
+        checks_to_execute (list): list of checks to execute
+        global_provider (Any): provider object
+        custom_checks_metadata (Any): custom checks metadata
+        output_options (Any): output options, depending on the provider
+        max_workers (int): maximum number of services scanned at the same time
+
+    Yields:
+        tuple[str, Check, list]: the check name, the check (None if it could not be loaded) and its findings
+    """
+    service_checks = group_checks_by_service(checks_to_execute)
+    checks_results = Queue()
+
+    def execute_service_checks(checks: list) -> None:
+        for check_name in checks:
+            check = None
+            check_findings = []
+            try:
+                service = check_name.split("_")[0]
+                check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
+                lib = import_check(check_module_path)
+                check = getattr(lib, check_name)()
+                check_findings = execute(
+                    check,
+                    global_provider,
+                    custom_checks_metadata,
+                    output_options,
+                )
+            except ModuleNotFoundError:
+                logger.error(
+                    f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
+                )
+            except Exception as error:
+                logger.error(
+                    f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            checks_results.put((check_name, check, check_findings))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Services with more checks are submitted first to balance the load across the workers
+        for checks in sorted(service_checks.values(), key=len, reverse=True):
+            executor.submit(execute_service_checks, checks)
+        for _ in range(sum(len(checks) for checks in service_checks.values())):
+            yield checks_results.get()
+
+
 def run_fixer(check_findings: list) -> int:
     """
     Run the fixer for the check if it exists and there are any FAIL findings
@@ -389,9 +503,13 @@ def execute_checks(
     custom_checks_metadata: Any,
     config_file: str,
     output_options: Any,
+    parallel_checks: int = 1,
+    prefetch_services: bool = False,
+    findings_handler: Callable[[list], None] = None,
 ) -> list:
-    # List to store all the check's findings
+    # List to store all the check's findings, unless they are handed to the findings_handler as soon as each check is completed
     all_findings = []
+    handle_findings = findings_handler or all_findings.extend
     # Services and checks executed for the Audit Status
     services_executed = set()
     checks_executed = set()
@@ -424,6 +542,18 @@ def execute_checks(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    # Initialise the services required by the checks before executing them
+    if prefetch_services:
+        if not output_options.only_logs:
+            print(
+                f"{Style.BRIGHT}Initialising the services required by the checks, please wait...{Style.RESET_ALL}"
+            )
+        prefetch_service_clients(
+            checks_to_execute,
+            global_provider.type,
+            max_workers=max(parallel_checks, 10),
+        )
+
     # Set verbose flag
     verbose = False
     if hasattr(output_options, "verbose"):
@@ -432,7 +562,35 @@ def execute_checks(
         verbose = output_options.fixer
 
     # Execution with the --only-logs flag
-    if output_options.only_logs:
+    if output_options.only_logs and parallel_checks > 1:
+        for check_name, check, check_findings in execute_checks_in_parallel(
+            checks_to_execute,
+            global_provider,
+            custom_checks_metadata,
+            output_options,
+            max_workers=parallel_checks,
+        ):
+            if check is None:
+                continue
+            try:
+                if verbose:
+                    print(
+                        f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
+                    )
+                report(check_findings, global_provider, output_options)
+                handle_findings(check_findings)
+
+                # Update Audit Status
+                services_executed.add(check_name.split("_")[0])
+                checks_executed.add(check_name)
+                global_provider.audit_metadata = update_audit_metadata(
+                    global_provider.audit_metadata, services_executed, checks_executed
+                )
+            except Exception as error:
+                logger.error(
+                    f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+    elif output_options.only_logs:
         for check_name in checks_to_execute:
             # Recover service from check name
             service = check_name.split("_")[0]
@@ -460,7 +618,7 @@ def execute_checks(
                     output_options,
                 )
                 report(check_findings, global_provider, output_options)
-                all_findings.extend(check_findings)
+                handle_findings(check_findings)
 
                 # Update Audit Status
                 services_executed.add(service)
@@ -510,59 +668,90 @@ def execute_checks(
             stats=False,
             enrich_print=False,
         ) as bar:
-            for check_name in checks_to_execute:
-                # Recover service from check name
-                service = check_name.split("_")[0]
-                bar.title = (
-                    f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
-                )
-                try:
+            if parallel_checks > 1:
+                bar.title = f"-> Scanning {orange_color}{len(group_checks_by_service(checks_to_execute))}{Style.RESET_ALL} services"
+                for check_name, check, check_findings in execute_checks_in_parallel(
+                    checks_to_execute,
+                    global_provider,
+                    custom_checks_metadata,
+                    output_options,
+                    max_workers=parallel_checks,
+                ):
+                    if check is not None:
+                        try:
+                            if verbose:
+                                print(
+                                    f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
+                                )
+                            report(check_findings, global_provider, output_options)
+
+                            handle_findings(check_findings)
+                            services_executed.add(check_name.split("_")[0])
+                            checks_executed.add(check_name)
+                            global_provider.audit_metadata = update_audit_metadata(
+                                global_provider.audit_metadata,
+                                services_executed,
+                                checks_executed,
+                            )
+                        except Exception as error:
+                            logger.error(
+                                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                            )
+                    bar()
+            else:
+                for check_name in checks_to_execute:
+                    # Recover service from check name
+                    service = check_name.split("_")[0]
+                    bar.title = (
+                        f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
+                    )
                     try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
+                        try:
+                            # Import check module
+                            check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
+                            lib = import_check(check_module_path)
+                            # Recover functions from check
+                            check_to_execute = getattr(lib, check_name)
+                            check = check_to_execute()
+                        except ModuleNotFoundError:
+                            logger.error(
+                                f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
+                            )
+                            continue
+                        if verbose:
+                            print(
+                                f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
+                            )
+                        check_findings = execute(
+                            check,
+                            global_provider,
+                            custom_checks_metadata,
+                            output_options,
+                        )
+
+                        report(check_findings, global_provider, output_options)
+
+                        handle_findings(check_findings)
+                        services_executed.add(service)
+                        checks_executed.add(check_name)
+                        global_provider.audit_metadata = update_audit_metadata(
+                            global_provider.audit_metadata,
+                            services_executed,
+                            checks_executed,
+                        )
+
+                    # If check does not exists in the provider or is from another provider
                     except ModuleNotFoundError:
+                        # TODO: add more loggin here, we need the original exception -- traceback.print_last()
                         logger.error(
                             f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
                         )
-                        continue
-                    if verbose:
-                        print(
-                            f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
+                    except Exception as error:
+                        # TODO: add more loggin here, we need the original exception -- traceback.print_last()
+                        logger.error(
+                            f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                         )
-                    check_findings = execute(
-                        check,
-                        global_provider,
-                        custom_checks_metadata,
-                        output_options,
-                    )
-
-                    report(check_findings, global_provider, output_options)
-
-                    all_findings.extend(check_findings)
-                    services_executed.add(service)
-                    checks_executed.add(check_name)
-                    global_provider.audit_metadata = update_audit_metadata(
-                        global_provider.audit_metadata,
-                        services_executed,
-                        checks_executed,
-                    )
-
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
-                except Exception as error:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-                bar()
+                    bar()
             bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
 
     return all_findings
@@ -4,6 +4,48 @@ from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.logger import logger
 
 
+def get_checks_requirements(bulk_compliance_frameworks: dict) -> dict:
+    """
+    Build the inverted index of the compliance frameworks requirements by check, walking every requirement once
+    Args:
+        bulk_compliance_frameworks (dict): The compliance frameworks
+
+    Returns:
+        dict: A dictionary with the check ID as key and the list of (compliance name, framework, requirement) that include the check, in the frameworks order
+    """
+    checks_requirements = {}
+    for compliance_name, framework in bulk_compliance_frameworks.items():
+        for requirement in framework.Requirements:
+            # A requirement can list the same check more than once
+            for check in dict.fromkeys(requirement.Checks):
+                checks_requirements.setdefault(check, []).append(
+                    (compliance_name, framework, requirement)
+                )
+    return checks_requirements
+
+
+def build_checks_compliance_index(bulk_compliance_frameworks: dict) -> dict:
+    """
+    Build the check to compliance index, with the requirements IDs of each compliance framework that include the check
+    Args:
+        bulk_compliance_frameworks (dict): The compliance frameworks
+
+    Returns:
+        dict: A dictionary with the check ID as key and a dictionary with the compliance name as key and the requirements IDs as value
+
+    Example:
+        {"iam_root_mfa_enabled": {"cis_2.0_aws": ["1.5"], "ens_rd2022_aws": ["op.acc.5.aws.iam.1"]}}
+    """
+    checks_compliance_index = {}
+    for check, requirements in get_checks_requirements(
+        bulk_compliance_frameworks
+    ).items():
+        check_compliance = checks_compliance_index[check] = {}
+        for compliance_name, _, requirement in requirements:
+            check_compliance.setdefault(compliance_name, []).append(requirement.Id)
+    return checks_compliance_index
+
+
 def update_checks_metadata_with_compliance(
     bulk_compliance_frameworks: dict, bulk_checks_metadata: dict
 ) -> dict:
@@ -17,25 +59,21 @@ def update_checks_metadata_with_compliance(
         dict: The checks metadata with the compliance frameworks
     """
     try:
+        checks_requirements = get_checks_requirements(bulk_compliance_frameworks)
         for check in bulk_checks_metadata:
             check_compliance = []
-            for framework in bulk_compliance_frameworks.values():
-                for requirement in framework.Requirements:
-                    compliance_requirements = []
-                    # Verify if check is in the requirement
-                    if check in requirement.Checks:
-                        # Include the requirement into the check's framework requirements
-                        compliance_requirements.append(requirement)
-                        # Create the Compliance
-                        compliance = Compliance(
-                            Framework=framework.Framework,
-                            Provider=framework.Provider,
-                            Version=framework.Version,
-                            Description=framework.Description,
-                            Requirements=compliance_requirements,
-                        )
-                        # Include the compliance framework for the check
-                        check_compliance.append(compliance)
+            for _, framework, requirement in checks_requirements.get(check, []):
+                # Create the Compliance with the requirement that includes the check,
+                # the framework has been already validated when loaded
+                compliance = Compliance.construct(
+                    Framework=framework.Framework,
+                    Provider=framework.Provider,
+                    Version=framework.Version,
+                    Description=framework.Description,
+                    Requirements=[requirement],
+                )
+                # Include the compliance framework for the check
+                check_compliance.append(compliance)
             # Save it into the check's metadata
             bulk_checks_metadata[check].Compliance = check_compliance
         return bulk_checks_metadata
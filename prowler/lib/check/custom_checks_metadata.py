@@ -116,6 +116,10 @@ def update_check_metadata(check_metadata, custom_metadata):
         if custom_metadata:
             for attribute in custom_metadata:
                 if attribute == "Remediation":
+                    # The remediation is shared with the loaded metadata and the check's findings, so it is copied before being updated
+                    check_metadata.Remediation = check_metadata.Remediation.copy(
+                        deep=True
+                    )
                     for remediation_attribute in custom_metadata[attribute]:
                         update_check_metadata_remediation(
                             check_metadata,
@@ -8,7 +8,7 @@ from enum import Enum
 from typing import Any, Dict, Optional, Set
 
 from checkov.common.output.record import Record
-from pydantic.v1 import BaseModel, ValidationError, validator
+from pydantic.v1 import BaseModel, PrivateAttr, ValidationError, validator
 
 from prowler.config.config import Provider
 from prowler.lib.check.compliance_models import Compliance
@@ -389,6 +389,9 @@ class CheckMetadata(BaseModel):
 class Check(ABC, CheckMetadata):
     """Prowler Check"""
 
+    # Metadata shared by all the check's findings, built on demand
+    _metadata: Optional[CheckMetadata] = PrivateAttr(default=None)
+
     def __init__(self, **data):
         """Check's init function. Calls the CheckMetadataModel init."""
         # Parse the Check's metadata file
@@ -396,16 +399,27 @@ class Check(ABC, CheckMetadata):
             os.path.abspath(sys.modules[self.__module__].__file__)[:-3]
             + ".metadata.json"
         )
-        # Store it to validate them with Pydantic
-        data = CheckMetadata.parse_file(metadata_file).dict()
+        # Store it to validate them with Pydantic, the file is only parsed once
+        data = dict(load_check_metadata(metadata_file))
         # Calls parents init function
         super().__init__(**data)
         # TODO: verify that the CheckID is the same as the filename and classname
         # to mimic the test done at test_<provider>_checks_metadata_is_valid
 
-    def metadata(self) -> dict:
-        """Return the JSON representation of the check's metadata"""
-        return self.json()
+    def __setattr__(self, name, value):
+        # The custom metadata updates the check once loaded, so the shared metadata has to be rebuilt
+        if name in CheckMetadata.__fields__:
+            super().__setattr__("_metadata", None)
+        super().__setattr__(name, value)
+
+    def metadata(self) -> CheckMetadata:
+        """Return the check's metadata, shared by all the check's findings"""
+        if self._metadata is None:
+            self._metadata = CheckMetadata.construct(
+                _fields_set=self.__fields_set__,
+                **{field: getattr(self, field) for field in CheckMetadata.__fields__},
+            )
+        return self._metadata
 
     @abstractmethod
     def execute(self) -> list:
@@ -414,12 +428,27 @@ class Check(ABC, CheckMetadata):
 
 @dataclass
 class Check_Report:
-    """Contains the Check's finding information."""
+    """Contains the Check's finding information.
+
+    The finding is slotted and keeps a reference to the resource, which is only converted to a dictionary when accessed.
+    Other attributes can still be set and are stored in the instance dictionary, only created when they are set.
+    """
+
+    __slots__ = (
+        "__dict__",
+        "status",
+        "status_extended",
+        "check_metadata",
+        "_resource",
+        "_resource_dict",
+        "resource_details",
+        "resource_tags",
+        "muted",
+    )
 
     status: str
     status_extended: str
     check_metadata: CheckMetadata
-    resource: dict
     resource_details: str
     resource_tags: list
     muted: bool
@@ -428,37 +457,56 @@ class Check_Report:
         """Initialize the Check's finding information.
 
         Args:
-            metadata: The metadata of the check.
+            metadata: The metadata of the check, as returned by Check.metadata() or its JSON representation.
             resource: Basic information about the resource. Defaults to None.
                       Only accepted dict, list, BaseModels (dict attribute), custom models (with to_dict attribute) and dataclasses.
         """
         self.status = ""
-        self.check_metadata = CheckMetadata.parse_raw(metadata)
-        if isinstance(resource, dict):
-            self.resource = resource
-        elif hasattr(resource, "dict"):
-            self.resource = resource.dict()
-        elif hasattr(resource, "to_dict"):
-            self.resource = resource.to_dict()
-        elif is_dataclass(resource):
-            self.resource = asdict(resource)
-        elif hasattr(resource, "__dict__"):
-            self.resource = resource.__dict__
+        if isinstance(metadata, CheckMetadata):
+            # Shallow copy of the already validated metadata, so each finding can override fields like the Severity
+            self.check_metadata = metadata.copy()
         else:
-            logger.error(
-                f"Resource metadata {type(resource)} in {self.check_metadata.CheckID} could not be converted to dict"
-            )
-            self.resource = {}
+            self.check_metadata = CheckMetadata.parse_raw(metadata)
+        self.resource = resource
         self.status_extended = ""
         self.resource_details = ""
         self.resource_tags = getattr(resource, "tags", []) if resource else []
         self.muted = False
 
+    @property
+    def resource(self) -> dict:
+        """The resource of the finding as a dictionary, converted on the first access"""
+        if self._resource_dict is None:
+            resource = self._resource
+            if isinstance(resource, dict):
+                self._resource_dict = resource
+            elif hasattr(resource, "dict"):
+                self._resource_dict = resource.dict()
+            elif hasattr(resource, "to_dict"):
+                self._resource_dict = resource.to_dict()
+            elif is_dataclass(resource):
+                self._resource_dict = asdict(resource)
+            elif hasattr(resource, "__dict__"):
+                self._resource_dict = resource.__dict__
+            else:
+                logger.error(
+                    f"Resource metadata {type(resource)} in {self.check_metadata.CheckID} could not be converted to dict"
+                )
+                self._resource_dict = {}
+        return self._resource_dict
+
+    @resource.setter
+    def resource(self, resource: Any) -> None:
+        self._resource = resource
+        self._resource_dict = None
+
 
 @dataclass
 class Check_Report_AWS(Check_Report):
     """Contains the AWS Check's finding information."""
 
+    __slots__ = ("resource_id", "resource_arn", "region")
+
     resource_id: str
     resource_arn: str
     region: str
@@ -476,6 +524,8 @@ class Check_Report_AWS(Check_Report):
 class Check_Report_Azure(Check_Report):
     """Contains the Azure Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "subscription", "location")
+
     resource_name: str
     resource_id: str
     subscription: str
@@ -501,6 +551,8 @@ class Check_Report_Azure(Check_Report):
 class Check_Report_GCP(Check_Report):
     """Contains the GCP Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "project_id", "location")
+
     resource_name: str
     resource_id: str
     project_id: str
@@ -540,6 +592,8 @@ class Check_Report_Kubernetes(Check_Report):
     # TODO change class name to CheckReportKubernetes
     """Contains the Kubernetes Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "namespace")
+
     resource_name: str
     resource_id: str
     namespace: str
@@ -559,6 +613,8 @@ class Check_Report_Kubernetes(Check_Report):
 class CheckReportGithub(Check_Report):
     """Contains the GitHub Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "owner")
+
     resource_name: str
     resource_id: str
     owner: str
@@ -594,6 +650,8 @@ class CheckReportGithub(Check_Report):
 class CheckReportM365(Check_Report):
     """Contains the M365 Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "location")
+
     resource_name: str
     resource_id: str
     location: str
@@ -625,6 +683,8 @@ class CheckReportM365(Check_Report):
 class CheckReportIAC(Check_Report):
     """Contains the IAC Check's finding information using Checkov."""
 
+    __slots__ = ("resource_name", "resource_path", "resource_line_range")
+
     resource_name: str
     resource_path: str
     resource_line_range: str
@@ -647,6 +707,8 @@ class CheckReportIAC(Check_Report):
 class CheckReportNHN(Check_Report):
     """Contains the NHN Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "location")
+
     resource_name: str
     resource_id: str
     location: str
@@ -666,6 +728,14 @@ class CheckReportNHN(Check_Report):
         self.location = getattr(resource, "location", "kr1")
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_check_metadata_file(
+    metadata_file: str, modification_time: int
+) -> CheckMetadata:
+    """Parse the check metadata file once per modification time"""
+    return CheckMetadata.parse_file(metadata_file)
+
+
 # Testing Pending
 def load_check_metadata(metadata_file: str) -> CheckMetadata:
     """
@@ -679,7 +749,10 @@ def load_check_metadata(metadata_file: str) -> CheckMetadata:
     """
 
     try:
-        check_metadata = CheckMetadata.parse_file(metadata_file)
+        # Shallow copy of the parsed file, so the callers can update the top-level fields
+        check_metadata = _parse_check_metadata_file(
+            metadata_file, os.stat(metadata_file).st_mtime_ns
+        ).copy()
     except ValidationError as error:
         logger.critical(f"Metadata from {metadata_file} is not valid: {error}")
         raise error
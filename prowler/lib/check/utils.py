@@ -1,5 +1,7 @@
 import importlib
+import re
 import sys
+from importlib.util import find_spec
 from pkgutil import walk_packages
 
 from prowler.lib.logger import logger
@@ -91,6 +93,35 @@ def recover_checks_from_service(service_list: list, provider: str) -> set:
         )
 
 
+def recover_service_clients_from_checks(provider: str, checks: list) -> set:
+    """
+    Recover the service client modules imported by the given checks, reading the checks source code without importing them
+
+    Returns a set of client modules, e.g. {"prowler.providers.aws.services.ec2.ec2_client"}
+    """
+    client_import_pattern = re.compile(
+        rf"^from\s+(prowler\.providers\.{provider}\.services\.\w+\.\w+_client)\s+import",
+        re.MULTILINE,
+    )
+    client_modules = set()
+    for check_name in checks:
+        try:
+            # Format: "prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+            service = check_name.split("_")[0]
+            check_spec = find_spec(
+                f"prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+            )
+            if not check_spec or not check_spec.origin:
+                continue
+            with open(check_spec.origin, "r", encoding="utf-8") as check_file:
+                client_modules.update(client_import_pattern.findall(check_file.read()))
+        except Exception as error:
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+    return client_modules
+
+
 def list_compliance_modules():
     """
     list_compliance_modules returns the available compliance frameworks and returns their path
@@ -19,6 +19,19 @@ from prowler.providers.common.arguments import (
 )
 
 
+def validate_parallel_checks(parallel_checks: str) -> int:
+    """validate_parallel_checks validates that the input parallel_checks is a positive integer"""
+    try:
+        workers = int(parallel_checks)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        raise argparse.ArgumentTypeError(
+            "The number of parallel checks must be an integer greater than 0"
+        )
+    return workers
+
+
 class ProwlerArgumentParser:
     # Set the default parser
     def __init__(self):
@@ -155,7 +168,7 @@ Detailed documentation at https://docs.prowler.com
             "--output-modes",
             "-M",
             nargs="+",
-            help="Output modes, by default csv and json-oscf are saved. When using AWS Security Hub integration, json-asff output is also saved.",
+            help="Output modes, by default csv and json-oscf are saved. When using AWS Security Hub integration, json-asff output is also saved. The parquet output is compressed with zstd.",
             default=["csv", "json-ocsf", "html"],
             choices=available_output_formats,
         )
@@ -198,6 +211,12 @@ Detailed documentation at https://docs.prowler.com
             default=False,
             help="Set the output timestamp format as unix timestamps instead of iso format timestamps (default mode).",
         )
+        common_outputs_parser.add_argument(
+            "--streaming-outputs",
+            action="store_true",
+            default=False,
+            help="Write the findings to the output files as soon as each check is completed instead of keeping all of them in memory until the end of the scan. Not compatible with the fixer.",
+        )
 
     def __init_logging_parser__(self):
         # Logging Options
@@ -289,6 +308,18 @@ Detailed documentation at https://docs.prowler.com
             default=[],
             # TODO: Pending validate choices
         )
+        common_checks_parser.add_argument(
+            "--parallel-checks",
+            default=1,
+            type=validate_parallel_checks,
+            metavar="N",
+            help="Number of checks to execute concurrently, grouped by service (Default: 1, checks are executed sequentially)",
+        )
+        common_checks_parser.add_argument(
+            "--prefetch-services",
+            action="store_true",
+            help="Initialise concurrently all the services required by the checks before executing them",
+        )
         common_checks_parser.add_argument(
             "--checks-folder",
             "-x",
@@ -1,5 +1,7 @@
 import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Optional
 
 import yaml
 from jsonschema import validate
@@ -83,6 +85,51 @@ mutelist_schema = {
 }
 
 
+@lru_cache(maxsize=None)
+def _compile_item(item: str) -> re.Pattern:
+    """Compiles a Mutelist item, where the * matches any string"""
+    if "*" in item:
+        item = item.replace("*", ".*")
+    return re.compile(item)
+
+
+@lru_cache(maxsize=None)
+def _get_items_pattern(items: tuple) -> Optional[re.Pattern]:
+    """
+    Combines the Mutelist items into a single regex that matches if any of them matches.
+
+    Returns None if any item cannot be compiled or the items cannot be combined safely (e.g. they have capturing groups), so they have to be matched one by one.
+    """
+    try:
+        patterns = [_compile_item(item) for item in items]
+        if any(pattern.groups for pattern in patterns):
+            return None
+        if any(pattern.pattern == ".*" for pattern in patterns):
+            return re.compile("")
+        return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns))
+    except re.error:
+        return None
+
+
+def _is_any_item_matched(items: tuple, finding_items: str) -> bool:
+    pattern = _get_items_pattern(items)
+    if pattern is not None:
+        return pattern.search(finding_items) is not None
+    for item in items:
+        if _compile_item(item).search(finding_items):
+            return True
+    return False
+
+
+@lru_cache(maxsize=65536)
+def _is_every_item_matched(items: tuple, finding_items: str) -> bool:
+    # The result is cached since the same tags are repeated in many findings
+    for item in items:
+        if not _compile_item(item).search(finding_items):
+            return False
+    return True
+
+
 class Mutelist(ABC):
     """
     Abstract base class for managing a mutelist.
@@ -100,11 +147,15 @@ class Mutelist(ABC):
         get_mutelist_file_from_local_file: Retrieves the mutelist file from a local file.
         is_muted: Checks if a finding is muted for the audited account, check, region, resource, and tags.
         is_muted_in_check: Checks if a check is muted.
+        get_matched_checks: Returns the muted checks that match a check.
         is_excepted: Checks if the account, region, resource, and tags are excepted based on the exceptions.
     """
 
     _mutelist: dict = {}
     _mutelist_file_path: str = None
+    # Muted checks matched for each (account, check), built from the mutelist the first time they are needed
+    _matched_checks_index: dict = None
+    _indexed_mutelist: dict = None
 
     MUTELIST_KEY = "Mutelist"
 
@@ -187,14 +238,14 @@ class Mutelist(ABC):
             # By default is not muted
             is_finding_muted = False
 
-            # We always check all the accounts present in the mutelist
+            # We always check the audited account and the * in the mutelist
             # if one mutes the finding we set the finding as muted
-            for account in self._mutelist.get("Accounts", []):
-                if account == audited_account or account == "*":
-                    if self.is_muted_in_check(
-                        self._mutelist["Accounts"][account]["Checks"],
+            muted_accounts = self._mutelist.get("Accounts", {})
+            for account in dict.fromkeys((audited_account, "*")):
+                if account in muted_accounts:
+                    if self._is_muted_in_matched_checks(
+                        self._get_account_matched_checks(account, check),
                         audited_account,
-                        check,
                         finding_region,
                         finding_resource,
                         finding_tags,
@@ -209,6 +260,57 @@ class Mutelist(ABC):
             )
             return False
 
+    def _get_account_matched_checks(self, account: str, check: str) -> list[dict]:
+        """
+        Returns the muted checks of the account in the mutelist that match the check, computing them only once per account and check.
+
+        Args:
+            account (str): The account in the mutelist, the audited one or *.
+            check (str): The check to be evaluated for muting.
+
+        Returns:
+            list[dict]: The muted checks information, in the same order as in the mutelist.
+        """
+        # The index is rebuilt if the mutelist is replaced
+        if self._indexed_mutelist is not self._mutelist:
+            self._matched_checks_index = {}
+            self._indexed_mutelist = self._mutelist
+        matched_checks_index = self._matched_checks_index
+        matched_checks = matched_checks_index.get((account, check))
+        if matched_checks is None:
+            matched_checks = self.get_matched_checks(
+                self._mutelist["Accounts"][account]["Checks"], check
+            )
+            matched_checks_index[(account, check)] = matched_checks
+        return matched_checks
+
+    @staticmethod
+    def get_matched_checks(muted_checks: dict, check: str) -> list[dict]:
+        """
+        Returns the muted checks that match the provided check.
+
+        Args:
+            muted_checks (dict): Dictionary containing information about muted checks.
+            check (str): The check to be evaluated for muting.
+
+        Returns:
+            list[dict]: The muted checks information, in the same order as in muted_checks.
+        """
+        matched_checks = []
+        for muted_check, muted_check_info in muted_checks.items():
+            # map lambda to awslambda
+            if muted_check.startswith("lambda"):
+                muted_check = f"aws{muted_check}"
+
+            # If there is a *, it affects to all checks
+            if (
+                "*" == muted_check
+                or check == muted_check
+                or Mutelist.is_item_matched([muted_check], check)
+            ):
+                matched_checks.append(muted_check_info)
+        return matched_checks
+
     def is_muted_in_check(
         self,
         muted_checks,
@@ -233,33 +335,53 @@ class Mutelist(ABC):
             bool: True if the check is muted, otherwise False.
         """
         try:
-            # Default value is not muted
-            is_check_muted = False
+            return self._is_muted_in_matched_checks(
+                self.get_matched_checks(muted_checks, check),
+                audited_account,
+                finding_region,
+                finding_resource,
+                finding_tags,
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+            )
+            return False
 
-            for muted_check, muted_check_info in muted_checks.items():
-                # map lambda to awslambda
-                muted_check = re.sub("^lambda", "awslambda", muted_check)
+    def _is_muted_in_matched_checks(
+        self,
+        matched_checks,
+        audited_account,
+        finding_region,
+        finding_resource,
+        finding_tags,
+    ) -> bool:
+        """
+        Check if the finding is muted by any of the muted checks that match its check.
 
-                check_match = (
-                    "*" == muted_check
-                    or check == muted_check
-                    or self.is_item_matched([muted_check], check)
-                )
+        Args:
+            matched_checks (list[dict]): The muted checks information matching the check, in the mutelist order.
+            audited_account (str): The account to be audited.
+            finding_region (str): The region where the finding occurred.
+            finding_resource (str): The resource related to the finding.
+            finding_tags (str): The tags associated with the finding.
 
+        Returns:
+            bool: True if the finding is muted, otherwise False.
+        """
+        try:
+            for muted_check_info in matched_checks:
                 # Check if the finding is excepted
                 exceptions = muted_check_info.get("Exceptions")
-                if (
-                    self.is_excepted(
-                        exceptions,
-                        audited_account,
-                        finding_region,
-                        finding_resource,
-                        finding_tags,
-                    )
-                    and check_match
+                if self.is_excepted(
+                    exceptions,
+                    audited_account,
+                    finding_region,
+                    finding_resource,
+                    finding_tags,
                 ):
-                    # Break loop and return default value since is excepted
-                    break
+                    # Stop and return default value since is excepted
+                    return False
 
                 muted_regions = muted_check_info.get("Regions")
                 muted_resources = muted_check_info.get("Resources")
@@ -267,35 +389,20 @@ class Mutelist(ABC):
                 # We need to set the muted_tags if None, "" or [], so the falsy helps
                 if not muted_tags:
                     muted_tags = "*"
-                # If there is a *, it affects to all checks
-                if check_match:
-                    muted_in_check = True
-                    muted_in_region = self.is_item_matched(
-                        muted_regions, finding_region
-                    )
-                    muted_in_resource = self.is_item_matched(
-                        muted_resources, finding_resource
-                    )
-                    muted_in_tags = self.is_item_matched(
-                        muted_tags, finding_tags, tag=True
-                    )
 
-                    # For a finding to be muted requires the following set to True:
-                    # - muted_in_check -> True
-                    # - muted_in_region -> True
-                    # - muted_in_tags -> True
-                    # - muted_in_resource -> True
-                    # - excepted -> False
-
-                    if (
-                        muted_in_check
-                        and muted_in_region
-                        and muted_in_tags
-                        and muted_in_resource
-                    ):
-                        is_check_muted = True
+                # For a finding to be muted requires the following set to True:
+                # - muted_in_region -> True
+                # - muted_in_tags -> True
+                # - muted_in_resource -> True
+                # - excepted -> False
+                if (
+                    self.is_item_matched(muted_regions, finding_region)
+                    and self.is_item_matched(muted_resources, finding_resource)
+                    and self.is_item_matched(muted_tags, finding_tags, tag=True)
+                ):
+                    return True
 
-            return is_check_muted
+            return False
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
@@ -418,19 +525,15 @@ class Mutelist(ABC):
         try:
             is_item_matched = False
             if matched_items and (finding_items or finding_items == ""):
+                # The items are compiled once and cached since they are the same for every finding
                 if tag:
-                    is_item_matched = True
-                for item in matched_items:
-                    if "*" in item:
-                        item = item.replace("*", ".*")
-                    if tag:
-                        if not re.search(item, finding_items):
-                            is_item_matched = False
-                            break
-                    else:
-                        if re.search(item, finding_items):
-                            is_item_matched = True
-                            break
+                    is_item_matched = _is_every_item_matched(
+                        tuple(matched_items), finding_items
+                    )
+                else:
+                    is_item_matched = _is_any_item_matched(
+                        tuple(matched_items), finding_items
+                    )
             return is_item_matched
         except Exception as error:
             logger.error(
@@ -100,6 +100,10 @@ def display_compliance_table(
         sys.exit(1)
 
 
+# Compliance map of each check by (check ID, provider type), built from the check's compliance list
+_check_compliance_cache = {}
+
+
 # TODO: this should be in the Check class
 def get_check_compliance(
     finding: Check_Report, provider_type: str, bulk_checks_metadata: dict
@@ -122,12 +126,17 @@ def get_check_compliance(
         dict: The compliance framework as key and the requirements where the finding's check is present.
     """
     try:
-        check_compliance = {}
+        check_id = finding.check_metadata.CheckID
         # We have to retrieve all the check's compliance requirements
-        if finding.check_metadata.CheckID in bulk_checks_metadata:
-            for compliance in bulk_checks_metadata[
-                finding.check_metadata.CheckID
-            ].Compliance:
+        if check_id not in bulk_checks_metadata:
+            return {}
+        check_compliance_list = bulk_checks_metadata[check_id].Compliance
+        cache_key = (check_id, provider_type.upper())
+        cached = _check_compliance_cache.get(cache_key)
+        # The map is built once per check, unless its compliance has been replaced
+        if cached is None or cached[0] is not check_compliance_list:
+            check_compliance = {}
+            for compliance in check_compliance_list:
                 compliance_fw = compliance.Framework
                 if compliance.Version:
                     compliance_fw = f"{compliance_fw}-{compliance.Version}"
@@ -138,7 +147,13 @@ def get_check_compliance(
                         check_compliance[compliance_fw] = []
                     for requirement in compliance.Requirements:
                         check_compliance[compliance_fw].append(requirement.Id)
-        return check_compliance
+            cached = (check_compliance_list, check_compliance)
+            _check_compliance_cache[cache_key] = cached
+        # Each finding gets its own copy since the map is stored within the finding
+        return {
+            compliance_fw: list(requirements)
+            for compliance_fw, requirements in cached[1].items()
+        }
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
@@ -0,0 +1,140 @@
+from datetime import datetime
+from typing import List
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from prowler.lib.logger import logger
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.finding import Finding
+
+# Columns with few distinct values, dictionary encoded in the record batches and the Parquet file
+PARQUET_DICTIONARY_COLUMNS = (
+    "ACCOUNT_UID",
+    "ACCOUNT_NAME",
+    "PROVIDER",
+    "CHECK_ID",
+    "STATUS",
+    "SERVICE_NAME",
+    "SEVERITY",
+    "RESOURCE_TYPE",
+    "PARTITION",
+    "REGION",
+)
+# Columns not stored as strings, the rest of the CSV columns are strings
+PARQUET_COLUMN_TYPES = {
+    "TIMESTAMP": pa.timestamp("us"),
+    "MUTED": pa.bool_(),
+}
+PARQUET_DEFAULT_COMPRESSION = "zstd"
+
+
+class Parquet(CSV):
+    """
+    Parquet class that writes the findings into a columnar Parquet file.
+
+    The findings are transformed into the same columns as the CSV output, and each call to
+    batch_write_data_to_file converts them into an Arrow record batch and writes it as a new row group,
+    so the file is written incrementally. The repetitive columns are dictionary encoded.
+
+    Attributes:
+        - _data: A list to store the transformed findings.
+        - _file_descriptor: A binary file descriptor to write the findings to a file.
+        - compression: The compression codec of the Parquet file, zstd by default or None to not compress it.
+
+    Methods:
+        - transform(findings: List[Finding]) -> None: Transforms the findings into the CSV columns.
+        - batch_write_data_to_file() -> None: Writes the findings as a row group of the Parquet file.
+    """
+
+    def __init__(
+        self,
+        findings: List[Finding],
+        file_path: str = None,
+        file_extension: str = "",
+        from_cli: bool = True,
+        compression: str = PARQUET_DEFAULT_COMPRESSION,
+    ) -> None:
+        self.compression = compression
+        self._schema = None
+        self._parquet_writer = None
+        super().__init__(findings, file_path, file_extension, from_cli)
+
+    def create_file_descriptor(self, file_path: str) -> None:
+        """Creates a binary file descriptor, Parquet files are not text files"""
+        try:
+            self._file_descriptor = open(file_path, "wb")
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def batch_write_data_to_file(self) -> None:
+        """Writes the findings to a file using the Parquet format using the `Output._file_descriptor`."""
+        try:
+            if (
+                getattr(self, "_file_descriptor", None)
+                and not self._file_descriptor.closed
+            ):
+                if self._data:
+                    if not self._parquet_writer:
+                        self._schema = self._get_schema(self._data[0].keys())
+                        self._parquet_writer = pq.ParquetWriter(
+                            self._file_descriptor,
+                            self._schema,
+                            compression=self.compression or "none",
+                            use_dictionary=[
+                                column
+                                for column in PARQUET_DICTIONARY_COLUMNS
+                                if column in self._schema.names
+                            ],
+                        )
+                    self._parquet_writer.write_batch(self._get_record_batch())
+                if self.close_file or self._from_cli:
+                    if self._parquet_writer:
+                        self._parquet_writer.close()
+                    self._file_descriptor.close()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    @staticmethod
+    def _get_schema(columns) -> pa.Schema:
+        """Returns the Arrow schema of the given CSV columns"""
+        return pa.schema(
+            [
+                (
+                    column,
+                    (
+                        pa.dictionary(pa.int32(), pa.string())
+                        if column in PARQUET_DICTIONARY_COLUMNS
+                        else PARQUET_COLUMN_TYPES.get(column, pa.string())
+                    ),
+                )
+                for column in columns
+            ]
+        )
+
+    def _get_record_batch(self) -> pa.RecordBatch:
+        """Converts the transformed findings into an Arrow record batch, column by column"""
+        arrays = []
+        for field in self._schema:
+            values = [finding.get(field.name) for finding in self._data]
+            if field.name == "TIMESTAMP":
+                # The timestamp is an integer with the --unix-timestamp option
+                values = [
+                    (
+                        datetime.fromtimestamp(value)
+                        if isinstance(value, (int, float))
+                        else value
+                    )
+                    for value in values
+                ]
+            elif not pa.types.is_boolean(field.type):
+                values = [None if value is None else str(value) for value in values]
+            if pa.types.is_dictionary(field.type):
+                arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(values, type=field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self._schema)
@@ -0,0 +1,382 @@
+from collections import namedtuple
+from shutil import copyfileobj
+from tempfile import TemporaryFile
+from typing import Any
+
+from prowler.config.config import (
+    csv_file_suffix,
+    html_file_suffix,
+    json_asff_file_suffix,
+    json_ocsf_file_suffix,
+    parquet_file_suffix,
+)
+from prowler.lib.check.compliance_models import Compliance
+from prowler.lib.check.models import Check_Report
+from prowler.lib.logger import logger
+from prowler.lib.outputs.asff.asff import ASFF
+from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
+    AWSWellArchitected,
+)
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
+from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
+from prowler.lib.outputs.compliance.cis.cis_github import GithubCIS
+from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
+from prowler.lib.outputs.compliance.cis.cis_m365 import M365CIS
+from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
+from prowler.lib.outputs.compliance.ens.ens_azure import AzureENS
+from prowler.lib.outputs.compliance.ens.ens_gcp import GCPENS
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_azure import AzureISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_gcp import GCPISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_kubernetes import (
+    KubernetesISO27001,
+)
+from prowler.lib.outputs.compliance.iso27001.iso27001_m365 import M365ISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_nhn import NHNISO27001
+from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import AWSKISAISMSP
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import AWSMitreAttack
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
+    AzureMitreAttack,
+)
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import GCPMitreAttack
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_aws import (
+    ProwlerThreatScoreAWS,
+)
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_azure import (
+    ProwlerThreatScoreAzure,
+)
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_gcp import (
+    ProwlerThreatScoreGCP,
+)
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365 import (
+    ProwlerThreatScoreM365,
+)
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.html.html import HTML
+from prowler.lib.outputs.ocsf.ocsf import OCSF
+from prowler.lib.outputs.outputs import extract_findings_statistics
+from prowler.lib.outputs.parquet.parquet import Parquet
+
+# Output class and file suffix of each output format
+OUTPUT_FORMATS = {
+    "csv": (CSV, csv_file_suffix),
+    "json-asff": (ASFF, json_asff_file_suffix),
+    "json-ocsf": (OCSF, json_ocsf_file_suffix),
+    "html": (HTML, html_file_suffix),
+    "parquet": (Parquet, parquet_file_suffix),
+}
+
+# Compliance output classes by provider, the first matching condition wins and GenericCompliance is used otherwise
+COMPLIANCE_OUTPUT_CLASSES = {
+    "aws": [
+        (lambda name: name.startswith("cis_"), AWSCIS),
+        (lambda name: name == "mitre_attack_aws", AWSMitreAttack),
+        (lambda name: name.startswith("ens_"), AWSENS),
+        (
+            lambda name: name.startswith("aws_well_architected_framework"),
+            AWSWellArchitected,
+        ),
+        (lambda name: name.startswith("iso27001_"), AWSISO27001),
+        (lambda name: name.startswith("kisa"), AWSKISAISMSP),
+        (lambda name: name == "prowler_threatscore_aws", ProwlerThreatScoreAWS),
+    ],
+    "azure": [
+        (lambda name: name.startswith("cis_"), AzureCIS),
+        (lambda name: name == "mitre_attack_azure", AzureMitreAttack),
+        (lambda name: name.startswith("ens_"), AzureENS),
+        (lambda name: name.startswith("iso27001_"), AzureISO27001),
+        (lambda name: name == "prowler_threatscore_azure", ProwlerThreatScoreAzure),
+    ],
+    "gcp": [
+        (lambda name: name.startswith("cis_"), GCPCIS),
+        (lambda name: name == "mitre_attack_gcp", GCPMitreAttack),
+        (lambda name: name.startswith("ens_"), GCPENS),
+        (lambda name: name.startswith("iso27001_"), GCPISO27001),
+        (lambda name: name == "prowler_threatscore_gcp", ProwlerThreatScoreGCP),
+    ],
+    "kubernetes": [
+        (lambda name: name.startswith("cis_"), KubernetesCIS),
+        (lambda name: name.startswith("iso27001_"), KubernetesISO27001),
+    ],
+    "m365": [
+        (lambda name: name.startswith("cis_"), M365CIS),
+        (lambda name: name == "prowler_threatscore_m365", ProwlerThreatScoreM365),
+        (lambda name: name.startswith("iso27001_"), M365ISO27001),
+    ],
+    "nhn": [
+        (lambda name: name.startswith("iso27001_"), NHNISO27001),
+    ],
+    "github": [
+        (lambda name: name.startswith("cis_"), GithubCIS),
+    ],
+}
+
+# Check's metadata fields used by the summary and compliance tables
+CheckSummary = namedtuple("CheckSummary", "CheckID ServiceName Provider Severity")
+
+
+class FindingSummary:
+    """Compact finding with the fields used by the summary and compliance tables, sharing the check's summary"""
+
+    __slots__ = ("check_metadata", "status", "muted")
+
+    def __init__(self, check_metadata: CheckSummary, status: str, muted: bool):
+        self.check_metadata = check_metadata
+        self.status = status
+        self.muted = muted
+
+
+class StreamingOutputs:
+    """
+    StreamingOutputs writes the findings to the output files as soon as each check is completed, instead of keeping all of them until the end of the scan.
+
+    The findings of each check are converted to Finding, aggregated in the statistics and transformed by each output,
+    so the memory used is bounded by the findings of a check. The last transformed findings of each output are written
+    when the next ones are transformed, so the output files are closed with the last findings.
+    The HTML findings are spooled to a temporary file since its header needs the statistics of the whole scan.
+
+    Attributes:
+        findings (list[FindingSummary]): compact findings for the summary and compliance tables.
+        stats (dict): the statistics of the findings, as returned by extract_findings_statistics.
+        asff_findings (list): the ASFF findings, only kept to send them to AWS Security Hub.
+
+    Example:
+        streaming_outputs = StreamingOutputs(provider, output_options, ["csv"], {})
+        execute_checks(..., findings_handler=streaming_outputs.write)
+        generated_outputs = streaming_outputs.close()
+    """
+
+    def __init__(
+        self,
+        provider: Any,
+        output_options: Any,
+        output_formats: list,
+        compliance_frameworks: dict[str, Compliance],
+        keep_asff_findings: bool = False,
+    ) -> None:
+        """
+        Args:
+            provider (Any): the provider object
+            output_options (Any): the output options object, depending on the provider
+            output_formats (list): the output formats to write, e.g. ["csv", "json-ocsf", "html"]
+            compliance_frameworks (dict[str, Compliance]): the compliance frameworks to write, by name
+            keep_asff_findings (bool): keep the ASFF findings to send them to AWS Security Hub
+        """
+        self._provider = provider
+        self._output_options = output_options
+        self._output_formats = [
+            mode for mode in output_formats or [] if mode in OUTPUT_FORMATS
+        ]
+        self._compliance_frameworks = (
+            compliance_frameworks if provider.type in COMPLIANCE_OUTPUT_CLASSES else {}
+        )
+        self._keep_asff_findings = keep_asff_findings
+        # Writers by output format or compliance name, with their transformed findings pending to be written
+        self._writers = {}
+        self._pending_data = {}
+        # Number of manual requirements rows appended by each compliance transform
+        self._manual_rows = {}
+        self._html_rows = None
+        self._check_summaries = {}
+        self._stats = {}
+        self._resources = set()
+        self.findings = []
+        self.asff_findings = []
+
+    @property
+    def stats(self) -> dict:
+        """Returns the statistics of the findings written so far"""
+        stats = dict(self._stats) or extract_findings_statistics([])
+        stats["resources_count"] = len(self._resources)
+        return stats
+
+    def write(self, check_findings: list[Check_Report]) -> None:
+        """
+        Converts the findings of a check and writes them to the outputs
+
+        Args:
+            check_findings (list[Check_Report]): the findings of the check
+        """
+        finding_outputs = []
+        for finding in check_findings:
+            check_summary = CheckSummary(
+                finding.check_metadata.CheckID,
+                finding.check_metadata.ServiceName,
+                finding.check_metadata.Provider,
+                finding.check_metadata.Severity,
+            )
+            self.findings.append(
+                FindingSummary(
+                    self._check_summaries.setdefault(check_summary, check_summary),
+                    finding.status,
+                    finding.muted,
+                )
+            )
+            try:
+                finding_outputs.append(
+                    Finding.generate_output(
+                        self._provider, finding, self._output_options
+                    )
+                )
+            except Exception:
+                continue
+        if not finding_outputs:
+            return
+
+        self._update_stats(finding_outputs)
+        filename = f"{self._output_options.output_directory}/{self._output_options.output_filename}"
+        for mode in self._output_formats:
+            output_class, suffix = OUTPUT_FORMATS[mode]
+            self._transform(
+                mode,
+                lambda: output_class(
+                    findings=finding_outputs,
+                    file_path=f"{filename}{suffix}",
+                    from_cli=False,
+                ),
+                lambda writer: writer.transform(finding_outputs),
+            )
+        for compliance_name, compliance in self._compliance_frameworks.items():
+            self._transform(
+                compliance_name,
+                lambda: self._get_compliance_output_class(compliance_name)(
+                    findings=finding_outputs,
+                    compliance=compliance,
+                    file_path=(
+                        f"{self._output_options.output_directory}/compliance/"
+                        f"{self._output_options.output_filename}_{compliance_name}.csv"
+                    ),
+                    from_cli=False,
+                ),
+                lambda writer: self._transform_compliance(
+                    writer, compliance_name, finding_outputs
+                ),
+            )
+
+    def close(self) -> dict:
+        """
+        Writes the pending findings, closes the output files and returns the generated outputs
+
+        Returns:
+            dict: the generated outputs, with the "regular" and "compliance" keys
+        """
+        generated_outputs = {"regular": [], "compliance": []}
+        for name, writer in self._writers.items():
+            try:
+                if name == "html":
+                    self._close_html(writer)
+                else:
+                    writer._data = self._pending_data.pop(name, [])
+                    writer.close_file = True
+                    writer.batch_write_data_to_file()
+                    writer._data = []
+                    if writer.file_descriptor and not writer.file_descriptor.closed:
+                        writer.file_descriptor.close()
+            except Exception as error:
+                logger.error(
+                    f"{name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            generated_outputs[
+                "compliance" if name in self._compliance_frameworks else "regular"
+            ].append(writer)
+        return generated_outputs
+
+    def _transform(self, name: str, create, transform) -> None:
+        """Transforms the findings with the output `name`, creating it on the first findings, and writes the previous ones"""
+        try:
+            writer = self._writers.get(name)
+            if writer is None:
+                writer = self._writers[name] = create()
+                if name in self._compliance_frameworks:
+                    self._manual_rows[name] = self._count_manual_rows(writer, name)
+            else:
+                writer._data = []
+                transform(writer)
+            data = writer._data
+            writer._data = []
+            if not data:
+                return
+            if name == "html":
+                self._spool_html(data)
+                return
+            if name == "json-asff" and self._keep_asff_findings:
+                self.asff_findings.extend(data)
+            pending_data = self._pending_data.get(name)
+            if pending_data:
+                writer._data = pending_data
+                writer.close_file = False
+                writer.batch_write_data_to_file()
+                writer._data = []
+            self._pending_data[name] = data
+        except Exception as error:
+            logger.error(
+                f"{name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def _get_compliance_output_class(self, compliance_name: str):
+        for condition, compliance_class in COMPLIANCE_OUTPUT_CLASSES[
+            self._provider.type
+        ]:
+            if condition(compliance_name):
+                return compliance_class
+        return GenericCompliance
+
+    @staticmethod
+    def _get_compliance_name(compliance: Compliance) -> str:
+        return (
+            f"{compliance.Framework}-{compliance.Version}"
+            if compliance.Version
+            else compliance.Framework
+        )
+
+    def _count_manual_rows(self, writer, name: str) -> int:
+        """Returns the number of rows the compliance transform appends for the manual requirements"""
+        compliance = self._compliance_frameworks[name]
+        data_length = len(writer._data)
+        writer.transform([], compliance, self._get_compliance_name(compliance))
+        manual_rows = len(writer._data) - data_length
+        del writer._data[data_length:]
+        return manual_rows
+
+    def _transform_compliance(
+        self, writer, name: str, finding_outputs: list[Finding]
+    ) -> None:
+        compliance = self._compliance_frameworks[name]
+        writer.transform(
+            finding_outputs, compliance, self._get_compliance_name(compliance)
+        )
+        # The manual requirements are written once, with the first findings
+        if self._manual_rows[name]:
+            del writer._data[-self._manual_rows[name] :]
+
+    def _update_stats(self, finding_outputs: list[Finding]) -> None:
+        self._resources.update(finding.resource_uid for finding in finding_outputs)
+        check_stats = extract_findings_statistics(finding_outputs)
+        if not self._stats:
+            self._stats = check_stats
+            return
+        for key, value in check_stats.items():
+            if key == "all_fails_are_muted":
+                self._stats[key] = self._stats[key] and value
+            else:
+                self._stats[key] += value
+
+    def _spool_html(self, data: list[str]) -> None:
+        if self._html_rows is None:
+            self._html_rows = TemporaryFile(mode="w+")
+        self._html_rows.writelines(data)
+
+    def _close_html(self, writer: HTML) -> None:
+        """Writes the HTML file with the header of the whole scan statistics and the spooled findings"""
+        if not writer.file_descriptor or writer.file_descriptor.closed:
+            return
+        HTML.write_header(writer.file_descriptor, self._provider, self.stats)
+        if self._html_rows is not None:
+            self._html_rows.seek(0)
+            copyfileobj(self._html_rows, writer.file_descriptor)
+            self._html_rows.close()
+        HTML.write_footer(writer.file_descriptor)
+        writer.file_descriptor.close()
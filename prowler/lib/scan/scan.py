@@ -4,8 +4,10 @@ from typing import Generator
 
 from prowler.lib.check.check import (
     execute,
+    execute_checks_in_parallel,
     import_check,
     list_services,
+    prefetch_service_clients,
     update_audit_metadata,
 )
 from prowler.lib.check.checks_loader import load_checks_to_execute
@@ -41,6 +43,8 @@ class Scan:
     _status: list[str] = None
     _bulk_checks_metadata: dict[str, CheckMetadata]
     _bulk_compliance_frameworks: dict
+    _max_workers: int = 1
+    _prefetch_services: bool = False
 
     def __init__(
         self,
@@ -53,6 +57,8 @@ class Scan:
         excluded_checks: list[str] = None,
         excluded_services: list[str] = None,
         status: list[str] = None,
+        max_workers: int = 1,
+        prefetch_services: bool = False,
     ):
         """
         Scan is the class that executes the checks and yields the progress and the findings.
@@ -67,6 +73,8 @@ class Scan:
             excluded_checks: list[str] -> The checks to exclude
             excluded_services: list[str] -> The services to exclude
             status: list[str] -> The status of the checks
+            max_workers: int -> The number of checks executed concurrently, grouped by service (default: 1, sequential execution)
+            prefetch_services: bool -> Initialise concurrently all the services required by the checks before executing them
 
         Raises:
             ScanInvalidCheckError: If the check does not exist in the provider or is from another provider.
@@ -77,6 +85,8 @@ class Scan:
             ScanInvalidStatusError: If the status does not exist in the provider.
         """
         self._provider = provider
+        self._max_workers = max_workers
+        self._prefetch_services = prefetch_services
 
         # Validate the status
         if status:
@@ -266,35 +276,28 @@ class Scan:
 
             start_time = datetime.datetime.now()
 
-            for check_name in checks_to_execute:
+            # Initialise the services required by the checks before executing them
+            if self._prefetch_services:
+                prefetch_service_clients(
+                    checks_to_execute,
+                    self._provider.type,
+                    max_workers=max(self._max_workers, 10),
+                )
+
+            for check_name, check_findings in self._execute_checks(
+                checks_to_execute, custom_checks_metadata
+            ):
                 try:
                     # Recover service from check name
                     service = get_service_name_from_check_name(check_name)
-                    try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
-                        )
-                        continue
-                    # Execute the check
-                    check_findings = execute(
-                        check,
-                        self._provider,
-                        custom_checks_metadata,
-                        output_options=None,
-                    )
 
                     # Filter the findings by the status
                     if self._status:
-                        for finding in check_findings:
-                            if finding.status not in self._status:
-                                check_findings.remove(finding)
+                        check_findings = [
+                            finding
+                            for finding in check_findings
+                            if finding.status in self._status
+                        ]
 
                     # Remove the executed check
                     self._service_checks_to_execute[service].remove(check_name)
@@ -329,11 +332,6 @@ class Scan:
                             continue
 
                     yield self.progress, findings
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
-                    )
                 except Exception as error:
                     logger.error(
                         f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -345,6 +343,56 @@ class Scan:
                 f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def _execute_checks(
+        self, checks_to_execute: list[str], custom_checks_metadata: dict = None
+    ) -> Generator[tuple[str, list], None, None]:
+        """
+        _execute_checks executes the checks and yields the check name and its findings as each check is completed.
+
+        The checks are executed concurrently, grouped by service, when the scan has more than one worker.
+        The results are always yielded from the calling thread.
+        """
+        if self._max_workers > 1:
+            for check_name, check, check_findings in execute_checks_in_parallel(
+                checks_to_execute,
+                self._provider,
+                custom_checks_metadata,
+                output_options=None,
+                max_workers=self._max_workers,
+            ):
+                if check is not None:
+                    yield check_name, check_findings
+            return
+
+        for check_name in checks_to_execute:
+            try:
+                # Recover service from check name
+                service = get_service_name_from_check_name(check_name)
+                # Import check module
+                check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
+                lib = import_check(check_module_path)
+                # Recover functions from check
+                check_to_execute = getattr(lib, check_name)
+                check = check_to_execute()
+            # If check does not exists in the provider or is from another provider
+            except ModuleNotFoundError:
+                logger.error(
+                    f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
+                )
+                continue
+            except Exception as error:
+                logger.error(
+                    f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+                continue
+            # Execute the check
+            yield check_name, execute(
+                check,
+                self._provider,
+                custom_checks_metadata,
+                output_options=None,
+            )
+
     def get_completed_services(self) -> set[str]:
         """
         get_completed_services returns the services that have been completed.
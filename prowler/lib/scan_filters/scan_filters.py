@@ -1,13 +1,121 @@
+import re
+from collections import defaultdict
+from typing import Iterator, Union
+
 from prowler.lib.logger import logger
 
+# Separators of the ARN segments, e.g. arn:aws:ec2:eu-west-1:123456789012:instance/i-1234567890abcdef0
+ARN_SEGMENTS_SEPARATOR = re.compile(r"([:/])")
+
+
+class AuditResourcesFilter:
+    """
+    AuditResourcesFilter indexes the resources to audit once, so checking if a resource is filtered takes constant time.
+
+    Besides the complete ARNs, a resource matches an audited ARN if it is one of its prefixes, suffixes or segments,
+    split by ":" and "/", so the resources can also be filtered by their ID, name or parent resource.
+    The IDs of the audited resources are also indexed by service, region and resource type, so the services can
+    request only those resources to the APIs.
+
+    Example:
+        audit_resources_filter = AuditResourcesFilter(["arn:aws:s3:::test_bucket"])
+        audit_resources_filter.is_filtered("test_bucket")
+        True
+    """
+
+    def __init__(self, audit_resources: list) -> None:
+        """
+        Args:
+            audit_resources (list): the ARNs of the resources to audit
+        """
+        self.audit_resources = audit_resources
+        self._index = set()
+        self._resource_ids = defaultdict(list)
+        for audit_resource in audit_resources:
+            self._index.update(self.get_resource_segments(audit_resource))
+            # arn:partition:service:region:account-id:resource-type/resource-id
+            arn_parts = audit_resource.split(":", 5)
+            if len(arn_parts) == 6:
+                resource = ARN_SEGMENTS_SEPARATOR.split(arn_parts[5], maxsplit=1)
+                resource_type, resource_id = (
+                    (resource[0], resource[2])
+                    if len(resource) == 3
+                    else ("", resource[0])
+                )
+                self._resource_ids[(arn_parts[2], arn_parts[3], resource_type)].append(
+                    resource_id
+                )
+
+    @staticmethod
+    def get_resource_segments(audit_resource: str) -> set:
+        """
+        Returns the ARN, its prefixes and suffixes ending and starting at a segment separator and its segments.
+
+        Args:
+            audit_resource (str): the ARN of the resource to audit
+
+        Returns:
+            set: the strings matching the resource
 
-def is_resource_filtered(resource: str, audit_resources: list) -> bool:
+        Example:
+            get_resource_segments("arn:aws:s3:::test_bucket/key")
+            {"arn:aws:s3:::test_bucket/key", "arn:aws:s3:::test_bucket", "test_bucket/key", "test_bucket", "key", "s3", ...}
+        """
+        # The even parts are the segments and the odd ones their separators
+        parts = ARN_SEGMENTS_SEPARATOR.split(audit_resource)
+        segments = {audit_resource}
+        for index in range(0, len(parts), 2):
+            segments.add(parts[index])
+            segments.add("".join(parts[: index + 1]))
+            segments.add("".join(parts[index:]))
+        return segments
+
+    def is_filtered(self, resource: str) -> bool:
+        """Returns True if the resource matches any of the resources to audit"""
+        return resource in self._index
+
+    def get_resource_ids(self, service: str, region: str, resource_type: str) -> list:
+        """
+        Returns the IDs of the audited resources of the given service, region and resource type.
+
+        Args:
+            service (str): the service of the ARNs, e.g. "ec2"
+            region (str): the region of the ARNs, empty for the global resources
+            resource_type (str): the resource type of the ARNs, e.g. "instance", empty if the ARNs do not have it
+
+        Returns:
+            list: the resource IDs, e.g. ["i-1234567890abcdef0"]
+        """
+        return self._resource_ids.get((service, region, resource_type), [])
+
+    def __bool__(self) -> bool:
+        return bool(self.audit_resources)
+
+    def __len__(self) -> int:
+        return len(self.audit_resources)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.audit_resources)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AuditResourcesFilter):
+            return self.audit_resources == other.audit_resources
+        return self.audit_resources == other
+
+
+def is_resource_filtered(
+    resource: str, audit_resources: Union[list, AuditResourcesFilter]
+) -> bool:
     """
     Check if the resource passed as argument is present in the audit_resources.
 
+    The AuditResourcesFilter lookups take constant time, while the lists of resources are searched as a string.
+
     Returns True if it is filtered and False if it does not match the input filters
     """
     try:
+        if isinstance(audit_resources, AuditResourcesFilter):
+            return audit_resources.is_filtered(resource)
         if resource in str(audit_resources):
             return True
         return False
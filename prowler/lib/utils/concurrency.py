@@ -0,0 +1,70 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+
+
+class ConcurrencyLimiter:
+    """Submits calls to a thread pool keeping at most max_concurrency of them running at the same time.
+
+    The calls over the limit wait in a queue instead of taking a worker of the thread pool,
+    so a busy service endpoint does not block the calls of the other services.
+
+    When the endpoint is throttled, the limit is halved and then increased by one each time
+    as many calls as the current limit are completed, until the initial limit is reached again.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self._initial_max_concurrency = max_concurrency
+        self._completed_calls = 0
+        self._running = 0
+        self._pending = deque()
+        self._lock = Lock()
+
+    def submit(self, thread_pool: ThreadPoolExecutor, call, *args) -> Future:
+        future = Future()
+        with self._lock:
+            if self._running >= self.max_concurrency:
+                self._pending.append((thread_pool, call, args, future))
+                return future
+            self._running += 1
+        self._start(thread_pool, call, args, future)
+        return future
+
+    def throttle(self):
+        """Halves the maximum number of concurrent calls, e.g. when the endpoint returns a throttling error"""
+        with self._lock:
+            self.max_concurrency = max(1, self.max_concurrency // 2)
+            self._completed_calls = 0
+
+    def _start(self, thread_pool, call, args, future):
+        try:
+            thread_pool.submit(self._run, thread_pool, call, args, future)
+        except Exception as error:
+            future.set_exception(error)
+            self._release()
+
+    def _run(self, thread_pool, call, args, future):
+        try:
+            if future.set_running_or_notify_cancel():
+                future.set_result(call(*args))
+        except Exception as error:
+            future.set_exception(error)
+        finally:
+            self._release()
+
+    def _release(self):
+        calls_to_start = []
+        with self._lock:
+            self._running -= 1
+            # Recover the initial limit after being throttled
+            if self.max_concurrency < self._initial_max_concurrency:
+                self._completed_calls += 1
+                if self._completed_calls >= self.max_concurrency:
+                    self.max_concurrency += 1
+                    self._completed_calls = 0
+            while self._pending and self._running < self.max_concurrency:
+                calls_to_start.append(self._pending.popleft())
+                self._running += 1
+        for thread_pool, call, args, future in calls_to_start:
+            self._start(thread_pool, call, args, future)
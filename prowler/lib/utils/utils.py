@@ -10,18 +10,21 @@ except ImportError:
 
 import re
 import sys
-import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from hashlib import sha512
-from io import TextIOWrapper
+from hashlib import sha256, sha512
+from io import StringIO, TextIOWrapper
 from ipaddress import ip_address
+from itertools import repeat
 from os.path import exists
 from time import mktime
 from typing import Any, Optional
 
 from colorama import Style
 from detect_secrets import SecretsCollection
-from detect_secrets.settings import transient_settings
+from detect_secrets.core.scan import _process_line_based_plugins
+from detect_secrets.settings import get_plugins, transient_settings
+from detect_secrets.transformers import get_transformed_file
 
 from prowler.config.config import encoding_format_utf_8
 from prowler.lib.logger import logger
@@ -111,6 +114,182 @@ def hash_sha512(string: str) -> str:
     return sha512(string.encode(encoding_format_utf_8)).hexdigest()[0:9]
 
 
+# Name of the in-memory data scanned for secrets, reported in the "filename" of the secrets
+DETECT_SECRETS_DATA_FILENAME = "data"
+# Maximum number of scanned data whose secrets are kept in memory
+DETECT_SECRETS_CACHE_MAX_SIZE = 10000
+_detect_secrets_cache: dict = {}
+
+
+def get_detect_secrets_settings(
+    excluded_secrets: list[str] = None, detect_secrets_plugins: dict = None
+) -> dict:
+    """get_detect_secrets_settings returns the detect-secrets settings with the given plugins and the patterns to exclude."""
+    if not detect_secrets_plugins:
+        detect_secrets_plugins = default_detect_secrets_plugins
+
+    settings = {
+        "plugins_used": detect_secrets_plugins,
+        "filters_used": [
+            {"path": "detect_secrets.filters.common.is_invalid_file"},
+            {"path": "detect_secrets.filters.common.is_known_false_positive"},
+            {"path": "detect_secrets.filters.heuristic.is_likely_id_string"},
+            {"path": "detect_secrets.filters.heuristic.is_potential_secret"},
+        ],
+    }
+
+    if excluded_secrets and len(excluded_secrets) > 0:
+        settings["filters_used"].append(
+            {
+                "path": "detect_secrets.filters.regex.should_exclude_line",
+                "pattern": excluded_secrets,
+            }
+        )
+    return settings
+
+
+def _scan_data_for_secrets(data: str) -> Optional[list[dict]]:
+    """_scan_data_for_secrets scans the data from memory with the detect-secrets settings in use, as SecretsCollection.scan_file does with a file.
+
+    The lines are first parsed with the non-eager transformers and, if no secret is found, with the eager ones.
+    """
+    try:
+        # Same content that detect-secrets would read from a file with the data
+        content = bytes(data, encoding="raw_unicode_escape").decode(
+            encoding_format_utf_8
+        )
+    except UnicodeDecodeError:
+        # detect-secrets ignores the binary files
+        return None
+    data_file = StringIO(content, newline=None)
+    data_file.name = DETECT_SECRETS_DATA_FILENAME
+
+    for use_eager_transformers in (False, True):
+        lines = get_transformed_file(
+            data_file, use_eager_transformers=use_eager_transformers
+        )
+        if not lines:
+            if use_eager_transformers:
+                break
+            lines = data_file.readlines()
+            data_file.seek(0)
+        # The lines are scanned as added lines so their context is taken from memory instead of from the file
+        secrets = []
+        for secret in _process_line_based_plugins(
+            lines=[
+                (number, value, True, False)
+                for number, value in enumerate(lines, start=1)
+            ],
+            filename=DETECT_SECRETS_DATA_FILENAME,
+        ):
+            secret.is_added = False
+            secrets.append(secret)
+        if secrets:
+            # Deduplicated and sorted as in a SecretsCollection
+            return [
+                secret.json()
+                for secret in sorted(
+                    set(secrets),
+                    key=lambda secret: (
+                        secret.line_number,
+                        secret.secret_hash,
+                        secret.type,
+                    ),
+                )
+            ]
+    return None
+
+
+def _scan_data_batch_for_secrets(
+    data_batch: list[str], settings: dict
+) -> list[Optional[list[dict]]]:
+    """_scan_data_batch_for_secrets scans every data of the batch, loading the detect-secrets plugins and filters once."""
+    with transient_settings(settings):
+        if not get_plugins():
+            return [None] * len(data_batch)
+        return [_scan_data_for_secrets(data) for data in data_batch]
+
+
+def detect_secrets_scan_batch(
+    data_list: list[str],
+    excluded_secrets: list[str] = None,
+    detect_secrets_plugins: dict = None,
+    processes: int = None,
+) -> list[Optional[list[dict]]]:
+    """detect_secrets_scan_batch scans every data in memory for secrets using the detect-secrets library.
+
+    The plugins and filters are loaded once for all the data and the secrets of the data already scanned with the same settings are reused, so repeated data is scanned once.
+    Args:
+        data_list (list): The data to scan for secrets.
+        excluded_secrets (list): A list of regex patterns to exclude from the scan.
+        detect_secrets_plugins (dict): The settings to use for the scan.
+        processes (int): The number of processes to scan the data in parallel, by default it is scanned in the current process.
+    Returns:
+        list: The secrets found in each data, or None if no secrets are found, in the same order as the data.
+    Examples:
+        >>> detect_secrets_scan_batch(["password=password", "no secrets"])
+        [[{'type': 'Secret Keyword', 'filename': 'data', 'hashed_secret': 'f7c3bc1d808e04732adf679965ccc34ca7ae3441', 'is_verified': False, 'line_number': 1, 'is_added': False, 'is_removed': False}], None]
+    """
+    results = [None] * len(data_list)
+    try:
+        settings = get_detect_secrets_settings(excluded_secrets, detect_secrets_plugins)
+        settings_hash = sha256(
+            json.dumps(settings, sort_keys=True).encode(encoding_format_utf_8)
+        ).digest()
+
+        # Index the data not scanned yet by its content hash, so repeated data is only scanned once
+        pending = {}
+        for index, data in enumerate(data_list):
+            if not data:
+                continue
+            data_hash = sha256(
+                settings_hash + data.encode(encoding_format_utf_8, "surrogatepass")
+            ).digest()
+            if data_hash in _detect_secrets_cache:
+                results[index] = _detect_secrets_cache[data_hash]
+            else:
+                pending.setdefault(data_hash, (data, []))[1].append(index)
+
+        if pending:
+            pending_data = [data for data, _ in pending.values()]
+            if processes and processes > 1 and len(pending_data) > 1:
+                chunk_size = -(-len(pending_data) // processes)
+                with ProcessPoolExecutor(max_workers=processes) as executor:
+                    scanned = [
+                        secrets
+                        for chunk_secrets in executor.map(
+                            _scan_data_batch_for_secrets,
+                            [
+                                pending_data[start : start + chunk_size]
+                                for start in range(0, len(pending_data), chunk_size)
+                            ],
+                            repeat(settings),
+                        )
+                        for secrets in chunk_secrets
+                    ]
+            else:
+                scanned = _scan_data_batch_for_secrets(pending_data, settings)
+
+            if (
+                len(_detect_secrets_cache) + len(pending)
+                > DETECT_SECRETS_CACHE_MAX_SIZE
+            ):
+                _detect_secrets_cache.clear()
+            for (data_hash, (_, indexes)), secrets in zip(pending.items(), scanned):
+                _detect_secrets_cache[data_hash] = secrets
+                for index in indexes:
+                    results[index] = secrets
+
+        # Each data gets its own copy of the secrets, so they can be modified without altering the cached ones
+        return [
+            [secret.copy() for secret in secrets] if secrets else None
+            for secrets in results
+        ]
+    except Exception as e:
+        logger.error(f"Error scanning for secrets: {e}")
+        return [None] * len(data_list)
+
+
 def detect_secrets_scan(
     data: str = None,
     file=None,
@@ -118,6 +297,8 @@ def detect_secrets_scan(
     detect_secrets_plugins: dict = None,
 ) -> list[dict[str, str]]:
     """detect_secrets_scan scans the data or file for secrets using the detect-secrets library.
+
+    The data is scanned in memory with detect_secrets_scan_batch.
     Args:
         data (str): The data to scan for secrets.
         file (str): The file to scan for secrets.
@@ -133,50 +314,22 @@ def detect_secrets_scan(
         >>> detect_secrets_scan(file="file.txt")
         {'file.txt': [{'filename': 'file.txt', 'hashed_secret': 'f7c3bc1d808e04732adf679965ccc34ca7ae3441', 'is_verified': False, 'line_number': 1, 'type': 'Secret Keyword'}]}
     """
+    if not file:
+        return detect_secrets_scan_batch(
+            [data], excluded_secrets, detect_secrets_plugins
+        )[0]
     try:
-        if not file:
-            temp_data_file = tempfile.NamedTemporaryFile(delete=False)
-            temp_data_file.write(bytes(data, encoding="raw_unicode_escape"))
-            temp_data_file.close()
-
         secrets = SecretsCollection()
 
-        if not detect_secrets_plugins:
-            detect_secrets_plugins = default_detect_secrets_plugins
-
-        settings = {
-            "plugins_used": detect_secrets_plugins,
-            "filters_used": [
-                {"path": "detect_secrets.filters.common.is_invalid_file"},
-                {"path": "detect_secrets.filters.common.is_known_false_positive"},
-                {"path": "detect_secrets.filters.heuristic.is_likely_id_string"},
-                {"path": "detect_secrets.filters.heuristic.is_potential_secret"},
-            ],
-        }
-
-        if excluded_secrets and len(excluded_secrets) > 0:
-            settings["filters_used"].append(
-                {
-                    "path": "detect_secrets.filters.regex.should_exclude_line",
-                    "pattern": excluded_secrets,
-                }
-            )
-        with transient_settings(settings):
-            if file:
-                secrets.scan_file(file)
-            else:
-                secrets.scan_file(temp_data_file.name)
-
-        if not file:
-            os.remove(temp_data_file.name)
+        with transient_settings(
+            get_detect_secrets_settings(excluded_secrets, detect_secrets_plugins)
+        ):
+            secrets.scan_file(file)
 
         detect_secrets_output = secrets.json()
 
         if detect_secrets_output:
-            if file:
-                return detect_secrets_output[file]
-            else:
-                return detect_secrets_output[temp_data_file.name]
+            return detect_secrets_output[file]
         else:
             return None
     except Exception as e:
@@ -21,6 +21,7 @@ from prowler.config.config import (
 )
 from prowler.lib.check.utils import list_modules, recover_checks_from_service
 from prowler.lib.logger import logger
+from prowler.lib.scan_filters.scan_filters import AuditResourcesFilter
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.aws.config import (
     AWS_REGION_US_EAST_1,
@@ -54,6 +55,7 @@ from prowler.providers.aws.lib.organizations.organizations import (
     get_organizations_metadata,
     parse_organizations_metadata,
 )
+from prowler.providers.aws.lib.throttling.throttling import APICallsStats
 from prowler.providers.aws.models import (
     AWSAssumeRoleConfiguration,
     AWSAssumeRoleInfo,
@@ -82,6 +84,7 @@ class AwsProvider(Provider):
         _session (AWSSession): The AWS provider session.
         _organizations_metadata (AWSOrganizationsInfo): The AWS Organizations metadata.
         _audit_resources (list): The list of resources to audit.
+        _audit_resources_filter (AuditResourcesFilter): The index of the resources to audit.
         _audit_config (dict): The audit configuration.
         _scan_unused_services (bool): A boolean indicating whether to scan unused services.
         _enabled_regions (set): The set of enabled regions.
@@ -94,6 +97,7 @@ class AwsProvider(Provider):
     _session: AWSSession
     _organizations_metadata: AWSOrganizationsInfo
     _audit_resources: list = []
+    _audit_resources_filter: AuditResourcesFilter = None
     _audit_config: dict
     _scan_unused_services: bool = False
     _enabled_regions: set = set()
@@ -123,6 +127,8 @@ class AwsProvider(Provider):
         aws_access_key_id: str = None,
         aws_secret_access_key: str = None,
         aws_session_token: Optional[str] = None,
+        max_api_workers: int = None,
+        retries_mode: str = "standard",
     ):
         """
         Initializes the AWS provider.
@@ -148,6 +154,8 @@ class AwsProvider(Provider):
             - aws_access_key_id: The AWS access key ID.
             - aws_secret_access_key: The AWS secret access key.
             - aws_session_token: The AWS session token, optional.
+            - max_api_workers: The maximum number of concurrent API calls shared by all the AWS services, optional.
+            - retries_mode: The botocore retry mode, "standard" or "adaptive". "standard" by default.
 
         Raises:
             - ArgumentTypeError: If the input MFA ARN is invalid.
@@ -202,7 +210,7 @@ class AwsProvider(Provider):
             aws_secret_access_key=aws_secret_access_key,
             aws_session_token=aws_session_token,
         )
-        session_config = self.set_session_config(retries_max_attempts)
+        session_config = self.set_session_config(retries_max_attempts, retries_mode)
         # Current session and the original session points to the same session object until we get a new one, if needed
         self._session = AWSSession(
             current_session=aws_session,
@@ -355,6 +363,12 @@ class AwsProvider(Provider):
         # Fixer Config
         self._fixer_config = fixer_config
 
+        # Maximum number of concurrent API calls
+        self._max_api_workers = max_api_workers
+
+        # Throttling and retries counters of the API calls
+        self._api_calls_stats = APICallsStats()
+
         # Mutelist
         if mutelist_content:
             self._mutelist = AWSMutelist(
@@ -393,6 +407,16 @@ class AwsProvider(Provider):
     def audit_resources(self):
         return self._audit_resources
 
+    @property
+    def audit_resources_filter(self) -> AuditResourcesFilter:
+        """Returns the resources to audit indexed once, to filter the resources in constant time"""
+        if (
+            self._audit_resources_filter is None
+            or self._audit_resources_filter.audit_resources is not self._audit_resources
+        ):
+            self._audit_resources_filter = AuditResourcesFilter(self._audit_resources)
+        return self._audit_resources_filter
+
     @property
     def scan_unused_services(self):
         return self._scan_unused_services
@@ -405,6 +429,14 @@ class AwsProvider(Provider):
     def fixer_config(self):
         return self._fixer_config
 
+    @property
+    def max_api_workers(self):
+        return self._max_api_workers
+
+    @property
+    def api_calls_stats(self) -> APICallsStats:
+        return self._api_calls_stats
+
     @property
     def mutelist(self) -> AWSMutelist:
         """
@@ -991,12 +1023,16 @@ class AwsProvider(Provider):
         mfa_TOTP = input("Enter MFA code: ")
         return AWSMFAInfo(arn=mfa_ARN, totp=mfa_TOTP)
 
-    def set_session_config(self, retries_max_attempts: int) -> Config:
+    @staticmethod
+    def set_session_config(
+        retries_max_attempts: int, retries_mode: str = "standard"
+    ) -> Config:
         """
         set_session_config returns a botocore Config object with the Prowler user agent and the default retrier configuration if nothing is passed as argument
 
         Args:
-            - retries_max_attempts: The maximum number of retries for the standard retrier config
+            - retries_max_attempts: The maximum number of retries for the retrier config
+            - retries_mode: The botocore retry mode, "standard" or "adaptive". The adaptive mode adds a client-side rate limiter that backs off when the requests are throttled.
 
         Returns:
             - Config: The botocore Config object
@@ -1006,12 +1042,12 @@ class AwsProvider(Provider):
             retries={"max_attempts": 3, "mode": "standard"},
             user_agent_extra=BOTO3_USER_AGENT_EXTRA,
         )
-        if retries_max_attempts:
+        if retries_max_attempts or (retries_mode and retries_mode != "standard"):
             # Create the new config
             config = Config(
                 retries={
-                    "max_attempts": retries_max_attempts,
-                    "mode": "standard",
+                    "max_attempts": retries_max_attempts or 3,
+                    "mode": retries_mode or "standard",
                 },
             )
             # Merge the new configuration
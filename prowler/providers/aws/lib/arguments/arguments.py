@@ -148,6 +148,20 @@ def init_parser(self):
         type=int,
         help="Set the maximum attemps for the Boto3 standard retrier config (Default: 3)",
     )
+    boto3_config_subparser.add_argument(
+        "--aws-retries-mode",
+        nargs="?",
+        default="standard",
+        choices=["standard", "adaptive"],
+        help="Set the Boto3 retry mode (Default: standard). The adaptive mode adds a client-side rate limiter per service and region that backs off when the requests are throttled.",
+    )
+    boto3_config_subparser.add_argument(
+        "--max-api-workers",
+        nargs="?",
+        default=None,
+        type=int,
+        help="Set the maximum number of concurrent API calls shared by all the AWS services (Default: 50). The concurrent calls to the same service and region are limited to 10.",
+    )
 
     # Scan Unused Services
     scan_unused_services_subparser = aws_parser.add_argument_group(
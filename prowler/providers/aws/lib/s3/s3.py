@@ -188,6 +188,7 @@ class S3:
                 ".csv": "text/csv",
                 ".ocsf.json": "application/json",
                 ".asff.json": "application/json",
+                ".parquet": "application/vnd.apache.parquet",
             }
             # Keys are regular and/or compliance
             for key, output_list in outputs.items():
@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from time import sleep
 from typing import Optional
 
 from boto3 import Session
@@ -17,6 +19,21 @@ from prowler.providers.common.models import Connection
 
 SECURITY_HUB_INTEGRATION_NAME = "prowler/prowler"
 SECURITY_HUB_MAX_BATCH = 100
+# Maximum number of batches of findings sent at the same time across all the regions
+SECURITY_HUB_MAX_WORKERS = 10
+# Maximum number of times a batch is sent, retrying only the findings that failed
+SECURITY_HUB_MAX_IMPORT_ATTEMPTS = 3
+# Seconds to wait before the first retry, doubled on every attempt
+SECURITY_HUB_RETRY_BASE_DELAY = 1
+# Error codes of the failed findings that can succeed if they are sent again
+SECURITY_HUB_RETRYABLE_ERROR_CODES = {
+    "InternalException",
+    "InternalFailure",
+    "LimitExceededException",
+    "ServiceUnavailable",
+    "ThrottlingException",
+    "TooManyRequestsException",
+}
 
 
 @dataclass
@@ -49,7 +66,8 @@ class SecurityHub:
         verify_enabled_per_region: Verifies and stores enabled regions with SecurityHub clients.
         batch_send_to_security_hub: Sends findings to Security Hub and returns the count of successfully sent findings.
         archive_previous_findings: Archives findings that are not present in the current execution.
-        _send_findings_to_security_hub: Sends findings to AWS Security Hub in batches and returns the count of successfully sent findings.
+        _send_findings_in_batches: Sends findings of all the regions concurrently to AWS Security Hub in batches and returns the count of successfully sent findings.
+        _import_findings: Sends a batch of findings to AWS Security Hub, retrying only the failed findings.
     """
 
     _session: Session
@@ -246,120 +264,179 @@ class SecurityHub:
         """
         Sends the findings to AWS Security Hub in batches for each region and returns the count of successfully sent findings.
 
+        The batches of all the regions are sent concurrently.
+
         Returns:
             int: Number of successfully sent findings to AWS Security Hub.
         """
-        success_count = 0
-        try:
-            # Iterate findings by region
-            for region, findings in self._findings_per_region.items():
-                # Send findings to Security Hub
-                logger.info(
-                    f"Sending {len(findings)} findings to Security Hub in the region {region}"
-                )
-
-                # Convert findings to dict
-                findings = [finding.dict(exclude_none=True) for finding in findings]
-                success_count += self._send_findings_in_batches(
-                    findings,
-                    region,
-                )
-
-        except Exception as error:
-            logger.error(
-                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+        for region, findings in self._findings_per_region.items():
+            logger.info(
+                f"Sending {len(findings)} findings to Security Hub in the region {region}"
             )
-        return success_count
+        return self._send_findings_in_batches(self._findings_per_region)
 
     def archive_previous_findings(self) -> int:
         """
         Checks previous findings in Security Hub to archive them.
 
+        The previous findings of all the regions are retrieved and archived concurrently.
+
         Returns:
             int: Number of successfully archived findings.
         """
         logger.info("Checking previous findings in Security Hub to archive them.")
+        findings_to_archive_per_region = {}
+        with ThreadPoolExecutor(max_workers=SECURITY_HUB_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self._get_findings_to_archive, region): region
+                for region in self._findings_per_region.keys()
+            }
+            for future in as_completed(futures):
+                region = futures[future]
+                try:
+                    findings_to_archive_per_region[region] = future.result()
+                except Exception as error:
+                    logger.error(
+                        f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+                    )
+        return self._send_findings_in_batches(findings_to_archive_per_region)
+
+    def _get_findings_to_archive(self, region: str) -> list[dict]:
+        """
+        Returns the active findings of Prowler in Security Hub for a specific region that are not present in the current execution, marked as archived.
+
+        Args:
+            region (str): The AWS region of the findings.
+
+        Returns:
+            list[dict]: The findings to archive.
+        """
+        # Get current findings IDs
+        current_findings_ids = {
+            finding.Id for finding in self._findings_per_region[region]
+        }
+        # Get findings of that region
+        findings_filter = {
+            "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
+            "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
+            "AwsAccountId": [{"Value": self._aws_account_id, "Comparison": "EQUALS"}],
+            "Region": [{"Value": region, "Comparison": "EQUALS"}],
+        }
+        get_findings_paginator = self._enabled_regions[region].get_paginator(
+            "get_findings"
+        )
+        findings_to_archive = []
+        for page in get_findings_paginator.paginate(
+            Filters=findings_filter, PaginationConfig={"PageSize": 100}
+        ):
+            # Archive findings that have not appear in this execution
+            for finding in page["Findings"]:
+                if finding["Id"] not in current_findings_ids:
+                    finding["RecordState"] = "ARCHIVED"
+                    finding["UpdatedAt"] = timestamp_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+                    findings_to_archive.append(finding)
+        logger.info(
+            f"Archiving {len(findings_to_archive)} findings in region {region}."
+        )
+        return findings_to_archive
+
+    def _send_findings_in_batches(
+        self, findings_per_region: dict[str, list[AWSSecurityFindingFormat]]
+    ) -> int:
+        """
+        Sends the given findings to AWS Security Hub in batches for each region and returns the count of successfully sent findings.
+
+        The batches of all the regions are sent concurrently, so each batch is converted and sent while the others are in flight.
+
+        Args:
+            findings_per_region (dict[str, list[AWSSecurityFindingFormat]]): Findings to send to AWS Security Hub per region, as models or dictionaries.
+
+        Returns:
+            int: Number of successfully sent findings to AWS Security Hub.
+        """
         success_count = 0
-        for region in self._findings_per_region.keys():
-            try:
-                current_findings = self._findings_per_region[region]
-                # Get current findings IDs
-                current_findings_ids = []
-                for finding in current_findings:
-                    current_findings_ids.append(finding.Id)
-                # Get findings of that region
-                findings_filter = {
-                    "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
-                    "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
-                    "AwsAccountId": [
-                        {"Value": self._aws_account_id, "Comparison": "EQUALS"}
-                    ],
-                    "Region": [{"Value": region, "Comparison": "EQUALS"}],
-                }
-                get_findings_paginator = self._enabled_regions[region].get_paginator(
-                    "get_findings"
-                )
-                findings_to_archive = []
-                for page in get_findings_paginator.paginate(
-                    Filters=findings_filter, PaginationConfig={"PageSize": 100}
-                ):
-                    # Archive findings that have not appear in this execution
-                    for finding in page["Findings"]:
-                        if finding["Id"] not in current_findings_ids:
-                            finding["RecordState"] = "ARCHIVED"
-                            finding["UpdatedAt"] = timestamp_utc.strftime(
-                                "%Y-%m-%dT%H:%M:%SZ"
-                            )
-
-                            findings_to_archive.append(finding)
-                logger.info(f"Archiving {len(findings_to_archive)} findings.")
-
-                # Send archive findings to SHub
-                success_count += self._send_findings_in_batches(
-                    findings_to_archive,
+        with ThreadPoolExecutor(max_workers=SECURITY_HUB_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    self._import_findings,
+                    findings[i : i + SECURITY_HUB_MAX_BATCH],
                     region,
-                )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
-                )
+                ): region
+                for region, findings in findings_per_region.items()
+                for i in range(0, len(findings), SECURITY_HUB_MAX_BATCH)
+            }
+            for future in as_completed(futures):
+                try:
+                    success_count += future.result()
+                except Exception as error:
+                    logger.error(
+                        f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {futures[future]}"
+                    )
         return success_count
 
-    def _send_findings_in_batches(
+    def _import_findings(
         self, findings: list[AWSSecurityFindingFormat], region: str
     ) -> int:
         """
-        Sends the given findings to AWS Security Hub in batches for a specific region and returns the count of successfully sent findings.
+        Sends a batch of findings to AWS Security Hub for a specific region and returns the count of successfully sent findings.
+
+        The findings that fail to be imported with a retryable error code are sent again with an exponential backoff, up to SECURITY_HUB_MAX_IMPORT_ATTEMPTS times, without sending again the ones already imported.
 
         Args:
-            findings (list[AWSSecurityFindingFormat]): List of findings to send to AWS Security Hub.
+            findings (list[AWSSecurityFindingFormat]): Batch of findings to send to AWS Security Hub, as models or dictionaries.
             region (str): The AWS region where the findings will be sent.
 
         Returns:
             int: Number of successfully sent findings to AWS Security Hub.
         """
+        # Convert findings to dict
+        findings = [
+            (
+                finding.dict(exclude_none=True)
+                if isinstance(finding, AWSSecurityFindingFormat)
+                else finding
+            )
+            for finding in findings
+        ]
         success_count = 0
-        try:
-            list_chunked = [
-                findings[i : i + SECURITY_HUB_MAX_BATCH]
-                for i in range(0, len(findings), SECURITY_HUB_MAX_BATCH)
-            ]
-            for findings in list_chunked:
-                batch_import = self._enabled_regions[region].batch_import_findings(
-                    Findings=findings
-                )
-                if batch_import["FailedCount"] > 0:
-                    failed_import = batch_import["FailedFindings"][0]
-                    logger.error(
-                        f"Failed to send findings to AWS Security Hub -- {failed_import['ErrorCode']} -- {failed_import['ErrorMessage']}"
+        for attempt in range(1, SECURITY_HUB_MAX_IMPORT_ATTEMPTS + 1):
+            batch_import = self._enabled_regions[region].batch_import_findings(
+                Findings=findings
+            )
+            success_count += batch_import["SuccessCount"]
+            if batch_import["FailedCount"] == 0:
+                break
+            retryable_findings_ids = set()
+            failed_imports = {}
+            for failed_finding in batch_import["FailedFindings"]:
+                if (
+                    attempt < SECURITY_HUB_MAX_IMPORT_ATTEMPTS
+                    and failed_finding["ErrorCode"]
+                    in SECURITY_HUB_RETRYABLE_ERROR_CODES
+                ):
+                    retryable_findings_ids.add(failed_finding["Id"])
+                else:
+                    failed_imports.setdefault(failed_finding["ErrorCode"], []).append(
+                        failed_finding
                     )
-                success_count += batch_import["SuccessCount"]
-            return success_count
-        except Exception as error:
-            logger.error(
-                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+            for error_code, failed_findings in failed_imports.items():
+                logger.error(
+                    f"Failed to send {len(failed_findings)} findings to AWS Security Hub in region {region} -- {error_code} -- {failed_findings[0]['ErrorMessage']}"
+                )
+            if not retryable_findings_ids:
+                break
+            delay = SECURITY_HUB_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+            logger.warning(
+                f"Retrying {len(retryable_findings_ids)} findings that failed to be sent to AWS Security Hub in region {region} in {delay} seconds"
             )
-            return success_count
+            sleep(delay)
+            findings = [
+                finding
+                for finding in findings
+                if finding["Id"] in retryable_findings_ids
+            ]
+        return success_count
 
     @staticmethod
     def test_connection(
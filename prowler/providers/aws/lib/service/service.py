@@ -1,6 +1,17 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Callable, Iterable, Optional
 
 from prowler.lib.logger import logger
+from prowler.lib.scan_filters.scan_filters import AuditResourcesFilter
+from prowler.lib.utils.concurrency import ConcurrencyLimiter
 from prowler.providers.aws.aws_provider import AwsProvider
 
 # TODO: review the following code
@@ -9,7 +20,27 @@ from prowler.providers.aws.aws_provider import AwsProvider
 #     get_default_region,
 # )
 
+# Maximum number of concurrent API calls to the same service and region
 MAX_WORKERS = 10
+# Default maximum number of concurrent API calls shared by all the AWS services
+MAX_API_WORKERS = 50
+# Maximum number of values of the filters of the describe API calls, e.g. EC2 and RDS
+MAX_FILTER_VALUES = 200
+
+
+@dataclass
+class ThreadingPhase:
+    """A collection call of an AWS Service to be scheduled by AWSService.__threading_phases__
+
+    Attributes:
+        call: The function to run, it receives a regional client or an item of the iterator.
+        iterator: Function returning the items to process, evaluated once the dependencies are completed. If not set, the call runs across the regional clients.
+        depends_on: The calls that must be completed before this one starts.
+    """
+
+    call: Callable
+    iterator: Optional[Callable[[], Iterable]] = None
+    depends_on: list[Callable] = field(default_factory=list)
 
 
 class AWSService:
@@ -17,12 +48,46 @@ class AWSService:
     - AWS Regional Clients
     - Shared information like the account ID and ARN, the AWS partition and the checks audited
     - AWS Session
-    - Thread pool for the __threading_call__
+    - Thread pool for the __threading_call__, shared by all the AWS Services and limited per service and region
     - Also handles if the AWS Service is Global
     """
 
     failed_checks = set()
 
+    _thread_pool: ThreadPoolExecutor = None
+    _thread_pool_max_workers: int = MAX_API_WORKERS
+    _thread_pool_lock = Lock()
+    _endpoint_limiters: dict[tuple[str, str], ConcurrencyLimiter] = {}
+
+    @classmethod
+    def get_thread_pool(cls, max_workers: int = None) -> ThreadPoolExecutor:
+        """Returns the thread pool shared by all the AWS Services, creating it if needed
+
+        Args:
+            max_workers (int): The maximum number of concurrent API calls, the current pool is replaced if it is different.
+        """
+        with cls._thread_pool_lock:
+            if max_workers and max_workers != cls._thread_pool_max_workers:
+                if cls._thread_pool:
+                    cls._thread_pool.shutdown(wait=False)
+                    cls._thread_pool = None
+                cls._thread_pool_max_workers = max_workers
+            if not cls._thread_pool:
+                cls._thread_pool = ThreadPoolExecutor(
+                    max_workers=cls._thread_pool_max_workers,
+                    thread_name_prefix="aws-service",
+                )
+            return cls._thread_pool
+
+    @classmethod
+    def shutdown_thread_pool(cls, wait: bool = True):
+        """Shuts down the thread pool shared by all the AWS Services, a new one is created if it is needed again"""
+        with cls._thread_pool_lock:
+            if cls._thread_pool:
+                cls._thread_pool.shutdown(wait=wait)
+                cls._thread_pool = None
+            cls._endpoint_limiters = {}
+
     @classmethod
     def set_failed_check(cls, check_id=None, arn=None):
         if check_id is not None and arn is not None:
@@ -39,7 +104,7 @@ class AWSService:
         self.audited_account = provider.identity.account
         self.audited_account_arn = provider.identity.account_arn
         self.audited_partition = provider.identity.partition
-        self.audit_resources = provider.audit_resources
+        self.audit_resources = provider.audit_resources_filter
         # TODO: remove this
         self.audited_checks = provider.audit_metadata.expected_checks
         self.audit_config = provider.audit_config
@@ -62,15 +127,128 @@ class AWSService:
         # We cannot include this within an else because some services needs both the regional_clients
         # and a single client like S3
         self.region = provider.get_default_region(self.service)
-        self.client = self.session.client(self.service, self.region)
+        self.client = self.session.client(
+            self.service, self.region, config=provider.session.session_config
+        )
+
+        # Count the throttled requests and the retries of the API calls
+        if not global_service:
+            for regional_client in (self.regional_clients or {}).values():
+                provider.api_calls_stats.register_client(regional_client, self.service)
+        provider.api_calls_stats.register_client(self.client, self.service)
 
-        # Thread pool for __threading_call__
-        self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        # Shared thread pool for __threading_call__
+        AWSService.get_thread_pool(provider.max_api_workers)
+
+    @property
+    def thread_pool(self) -> ThreadPoolExecutor:
+        return AWSService.get_thread_pool()
 
     def __get_session__(self):
         return self.session
 
+    def __submit__(self, region: str, call, *args) -> Future:
+        """Submits a call to the shared thread pool, limiting the concurrent calls to the service endpoint of the given region
+
+        Args:
+            region (str): The region of the service endpoint, the service default region if None.
+            call: The function to run.
+            *args: The arguments of the function.
+
+        Returns:
+            Future: The future of the call.
+        """
+        endpoint = (self.service, region or self.region)
+        with AWSService._thread_pool_lock:
+            if endpoint not in AWSService._endpoint_limiters:
+                AWSService._endpoint_limiters[endpoint] = ConcurrencyLimiter(
+                    MAX_WORKERS
+                )
+            limiter = AWSService._endpoint_limiters[endpoint]
+        return limiter.submit(self.thread_pool, call, *args)
+
     def __threading_call__(self, call, iterator=None):
+        # Submit tasks to the thread pool
+        futures = self.__submit_threading_call__(call, iterator)
+
+        # Wait for all tasks to complete
+        for future in as_completed(futures):
+            try:
+                future.result()  # Raises exceptions from the thread, if any
+            except Exception:
+                # Handle exceptions if necessary
+                pass  # Replace 'pass' with any additional exception handling logic. Currently handled within the called function
+
+    def __threading_phases__(self, phases: list[ThreadingPhase]):
+        """Run the collection calls of the service as soon as their dependencies are completed
+
+        Independent calls run concurrently, so the service collection time is bounded by
+        its longest chain of dependent calls instead of the sum of all of them.
+
+        Args:
+            phases (list[ThreadingPhase]): The collection calls of the service and their dependencies.
+
+        Examples:
+            >>> self.__threading_phases__(
+            ...     [
+            ...         ThreadingPhase(self._describe_instances),
+            ...         ThreadingPhase(
+            ...             self._get_instance_user_data,
+            ...             iterator=lambda: self.instances,
+            ...             depends_on=[self._describe_instances],
+            ...         ),
+            ...         ThreadingPhase(self._describe_images),
+            ...     ]
+            ... )
+        """
+        pending = list(phases)
+        scheduled_calls = {phase.call for phase in phases}
+        completed_calls = set()
+        running = {}
+        remaining_tasks = {}
+
+        while pending or running:
+            # Submit the phases whose dependencies are completed
+            ready = [
+                phase
+                for phase in pending
+                if all(
+                    dependency in completed_calls or dependency not in scheduled_calls
+                    for dependency in phase.depends_on
+                )
+            ]
+            if not ready and not running:
+                logger.error(
+                    f"{self.service.upper()} - Circular dependency between {', '.join(phase.call.__name__ for phase in pending)}, running them without dependencies."
+                )
+                ready = list(pending)
+            for phase in ready:
+                pending.remove(phase)
+                futures = self.__submit_threading_call__(
+                    phase.call, phase.iterator() if phase.iterator else None
+                )
+                if not futures:
+                    completed_calls.add(phase.call)
+                    continue
+                remaining_tasks[phase.call] = len(futures)
+                for future in futures:
+                    running[future] = phase.call
+            if not running:
+                continue
+
+            # Wait for any task to complete
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                call = running.pop(future)
+                try:
+                    future.result()  # Raises exceptions from the thread, if any
+                except Exception:
+                    pass  # Currently handled within the called function
+                remaining_tasks[call] -= 1
+                if remaining_tasks[call] == 0:
+                    completed_calls.add(call)
+
+    def __submit_threading_call__(self, call, iterator=None) -> list:
         # Use the provided iterator, or default to self.regional_clients
         items = iterator if iterator is not None else self.regional_clients.values()
         # Determine the total count for logging
@@ -91,16 +269,10 @@ class AWSService:
                 f"{self.service.upper()} - Starting threads for '{call_name}' function to process {item_count} items..."
             )
 
-        # Submit tasks to the thread pool
-        futures = [self.thread_pool.submit(call, item) for item in items]
-
-        # Wait for all tasks to complete
-        for future in as_completed(futures):
-            try:
-                future.result()  # Raises exceptions from the thread, if any
-            except Exception:
-                # Handle exceptions if necessary
-                pass  # Replace 'pass' with any additional exception handling logic. Currently handled within the called function
+        # Submit tasks to the thread pool, the regional clients and most of the resources have a region
+        return [
+            self.__submit__(getattr(item, "region", None), call, item) for item in items
+        ]
 
     def get_unknown_arn(self, resource_type: str = None, region: str = None) -> str:
         """
@@ -115,3 +287,33 @@ class AWSService:
             arn:aws:s3:us-east-1:123456789012:bucket/unknown
         """
         return f"arn:{self.audited_partition}:{self.service}:{f'{region}' if region else ''}:{self.audited_account}:{f'{resource_type}/' if resource_type else ''}unknown"
+
+    def get_audit_resources_filters(
+        self, region: str, resource_type: str, filter_name: str
+    ) -> Optional[dict]:
+        """
+        Returns the filters of the describe API calls to only retrieve the audited resources of the given type.
+
+        Args:
+            region (str): The region of the API call.
+            resource_type (str): The resource type in the ARNs of the audited resources, e.g. "instance".
+            filter_name (str): The name of the API filter by resource ID, e.g. "instance-id".
+        Returns:
+            Optional[dict]: The arguments of the API call, empty to retrieve all the resources, or None if there are no audited resources of the given type in the region, so the API call can be skipped.
+        Examples:
+            >>> service.get_audit_resources_filters("eu-west-1", "instance", "instance-id")
+            {"Filters": [{"Name": "instance-id", "Values": ["i-1234567890abcdef0"]}]}
+        """
+        if not isinstance(self.audit_resources, AuditResourcesFilter) or not (
+            self.audit_resources
+        ):
+            return {}
+        resource_ids = self.audit_resources.get_resource_ids(
+            self.service, region, resource_type
+        )
+        if not resource_ids:
+            return None
+        # The API calls do not accept more values, so all the resources are retrieved and filtered afterwards
+        if len(resource_ids) > MAX_FILTER_VALUES:
+            return {}
+        return {"Filters": [{"Name": filter_name, "Values": resource_ids}]}
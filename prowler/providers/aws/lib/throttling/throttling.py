@@ -0,0 +1,102 @@
+from collections import defaultdict
+from functools import partial
+from threading import Lock
+
+from botocore.client import BaseClient
+
+from prowler.lib.logger import logger
+
+# Error codes returned by the AWS APIs when the request rate is exceeded
+THROTTLING_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "TransactionInProgressException",
+    "RequestLimitExceeded",
+    "BandwidthLimitExceeded",
+    "LimitExceededException",
+    "RequestThrottled",
+    "SlowDown",
+    "PriorRequestNotComplete",
+    "EC2ThrottledException",
+}
+
+
+class APICallsStats:
+    """APICallsStats counts the throttled requests and the retries of the AWS API calls per service, region and operation.
+
+    The counters are updated from the botocore event hooks of the registered clients, so they are shared by all the threads using them.
+
+    Example:
+        stats = APICallsStats()
+        stats.register_client(client, "ec2")
+        ...
+        stats.get_stats()
+        {("ec2", "us-east-1", "DescribeInstances"): {"calls": 10, "throttles": 2, "retries": 2}}
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._stats = defaultdict(lambda: {"calls": 0, "throttles": 0, "retries": 0})
+
+    def register_client(self, client: BaseClient, service: str) -> None:
+        """Registers the event hooks to count the API calls made with the given client
+
+        Args:
+            client (BaseClient): The boto3 client.
+            service (str): The service name, e.g. "ec2".
+        """
+        try:
+            region = client.meta.region_name
+            client.meta.events.register(
+                "needs-retry", partial(self._needs_retry_handler, service, region)
+            )
+            # after-call is emitted for both the successful and the failed responses
+            client.meta.events.register(
+                "after-call", partial(self._after_call_handler, service, region)
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def _needs_retry_handler(
+        self, service: str, region: str, response=None, operation=None, **kwargs
+    ) -> None:
+        # The handler does not return anything so the botocore retry handler takes the decision
+        if response and operation:
+            error_code = response[1].get("Error", {}).get("Code")
+            if error_code in THROTTLING_ERROR_CODES:
+                with self._lock:
+                    self._stats[(service, region, operation.name)]["throttles"] += 1
+
+    def _after_call_handler(
+        self, service: str, region: str, parsed=None, model=None, **kwargs
+    ) -> None:
+        if model:
+            retries = (parsed or {}).get("ResponseMetadata", {}).get("RetryAttempts", 0)
+            with self._lock:
+                stats = self._stats[(service, region, model.name)]
+                stats["calls"] += 1
+                stats["retries"] += retries
+
+    def get_stats(self) -> dict[tuple[str, str, str], dict[str, int]]:
+        """Returns a copy of the counters per (service, region, operation)"""
+        with self._lock:
+            return {api: dict(stats) for api, stats in self._stats.items()}
+
+    def get_throttled_apis(self) -> dict[tuple[str, str, str], dict[str, int]]:
+        """Returns the counters of the APIs that have been throttled or retried"""
+        return {
+            api: stats
+            for api, stats in self.get_stats().items()
+            if stats["throttles"] or stats["retries"]
+        }
+
+    def reset(self) -> None:
+        """Resets all the counters"""
+        with self._lock:
+            self._stats.clear()
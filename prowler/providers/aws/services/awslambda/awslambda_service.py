@@ -66,8 +66,11 @@ class Lambda(AWSService):
         logger.info("Lambda - Getting Function Code...")
         # Use a thread pool handle the queueing and execution of the _fetch_function_code tasks, up to max_workers tasks concurrently.
         lambda_functions_to_fetch = {
-            self.thread_pool.submit(
-                self._fetch_function_code, function.name, function.region
+            self.__submit__(
+                function.region,
+                self._fetch_function_code,
+                function.name,
+                function.region,
             ): function
             for function in self.functions.values()
         }
@@ -4,7 +4,7 @@ from base64 import b64decode
 from prowler.config.config import encoding_format_utf_8
 from prowler.lib.check.models import Check, Check_Report_AWS
 from prowler.lib.logger import logger
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import detect_secrets_scan_batch
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 
 
@@ -18,6 +18,7 @@ class ec2_launch_template_no_secrets(Check):
             report = Check_Report_AWS(metadata=self.metadata(), resource=template)
 
             versions_with_secrets = []
+            versions_user_data = []
 
             for version in template.versions:
                 if not version.template_data.user_data:
@@ -42,14 +43,20 @@ class ec2_launch_template_no_secrets(Check):
                     )
                     continue
 
-                version_secrets = detect_secrets_scan(
-                    data=user_data,
-                    excluded_secrets=secrets_ignore_patterns,
-                    detect_secrets_plugins=ec2_client.audit_config.get(
-                        "detect_secrets_plugins"
-                    ),
-                )
+                versions_user_data.append((version.version_number, user_data))
 
+            # The versions are scanned together, so the user data repeated across them is only scanned once
+            versions_secrets = detect_secrets_scan_batch(
+                [user_data for _, user_data in versions_user_data],
+                excluded_secrets=secrets_ignore_patterns,
+                detect_secrets_plugins=ec2_client.audit_config.get(
+                    "detect_secrets_plugins"
+                ),
+            )
+
+            for (version_number, _), version_secrets in zip(
+                versions_user_data, versions_secrets
+            ):
                 if version_secrets:
                     secrets_string = ", ".join(
                         [
@@ -58,7 +65,7 @@ class ec2_launch_template_no_secrets(Check):
                         ]
                     )
                     versions_with_secrets.append(
-                        f"Version {version.version_number}: {secrets_string}"
+                        f"Version {version_number}: {secrets_string}"
                     )
 
             if len(versions_with_secrets) > 0:
@@ -7,7 +7,7 @@ from pydantic.v1 import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.lib.service.service import AWSService, ThreadingPhase
 
 
 class EC2(AWSService):
@@ -16,43 +16,81 @@ class EC2(AWSService):
         super().__init__(__class__.__name__, provider)
         self.account_arn_template = f"arn:{self.audited_partition}:ec2:{self.region}:{self.audited_account}:account"
         self.instances = []
-        self.__threading_call__(self._describe_instances)
-        self.__threading_call__(self._get_instance_user_data, self.instances)
         self.security_groups = {}
         self.regions_with_sgs = []
-        self.__threading_call__(self._describe_security_groups)
         self.network_acls = {}
-        self.__threading_call__(self._describe_network_acls)
         self.snapshots = []
         self.volumes_with_snapshots = {}
         self.regions_with_snapshots = {}
-        self.__threading_call__(self._describe_snapshots)
-        self.__threading_call__(self._determine_public_snapshots, self.snapshots)
         self.network_interfaces = {}
-        self.__threading_call__(self._describe_network_interfaces)
         self.images = []
-        self.__threading_call__(self._describe_images)
         self.volumes = []
-        self.__threading_call__(self._describe_volumes)
         self.attributes_for_regions = {}
-        self.__threading_call__(self._get_resources_for_regions)
         self.ebs_encryption_by_default = []
-        self.__threading_call__(self._get_ebs_encryption_settings)
         self.elastic_ips = []
-        self.__threading_call__(self._describe_ec2_addresses)
         self.ebs_block_public_access_snapshots_states = []
-        self.__threading_call__(self._get_snapshot_block_public_access_state)
         self.instance_metadata_defaults = []
-        self.__threading_call__(self._get_instance_metadata_defaults)
         self.launch_templates = []
-        self.__threading_call__(self._describe_launch_templates)
-        self.__threading_call__(
-            self._describe_launch_template_versions, self.launch_templates
-        )
         self.vpn_endpoints = {}
-        self.__threading_call__(self._describe_vpn_endpoints)
         self.transit_gateways = {}
-        self.__threading_call__(self._describe_transit_gateways)
+        self.__threading_phases__(
+            [
+                ThreadingPhase(self._describe_instances),
+                ThreadingPhase(
+                    self._get_instance_user_data,
+                    iterator=lambda: self.instances,
+                    depends_on=[self._describe_instances],
+                ),
+                ThreadingPhase(self._describe_security_groups),
+                ThreadingPhase(self._describe_network_acls),
+                ThreadingPhase(self._describe_snapshots),
+                ThreadingPhase(
+                    self._determine_public_snapshots,
+                    iterator=lambda: self.snapshots,
+                    depends_on=[self._describe_snapshots],
+                ),
+                # Network interfaces are added to the security groups
+                ThreadingPhase(
+                    self._describe_network_interfaces,
+                    depends_on=[self._describe_security_groups],
+                ),
+                ThreadingPhase(self._describe_images),
+                ThreadingPhase(self._describe_volumes),
+                ThreadingPhase(
+                    self._get_resources_for_regions,
+                    depends_on=[
+                        self._describe_instances,
+                        self._describe_snapshots,
+                        self._describe_volumes,
+                    ],
+                ),
+                ThreadingPhase(
+                    self._get_ebs_encryption_settings,
+                    depends_on=[self._get_resources_for_regions],
+                ),
+                ThreadingPhase(self._describe_ec2_addresses),
+                ThreadingPhase(
+                    self._get_snapshot_block_public_access_state,
+                    depends_on=[self._get_resources_for_regions],
+                ),
+                ThreadingPhase(
+                    self._get_instance_metadata_defaults,
+                    depends_on=[self._get_resources_for_regions],
+                ),
+                ThreadingPhase(self._describe_launch_templates),
+                # Launch template versions reference the network interfaces
+                ThreadingPhase(
+                    self._describe_launch_template_versions,
+                    iterator=lambda: self.launch_templates,
+                    depends_on=[
+                        self._describe_launch_templates,
+                        self._describe_network_interfaces,
+                    ],
+                ),
+                ThreadingPhase(self._describe_vpn_endpoints),
+                ThreadingPhase(self._describe_transit_gateways),
+            ]
+        )
 
     def _get_volume_arn_template(self, region):
         return (
@@ -61,10 +99,18 @@ class EC2(AWSService):
 
     def _describe_instances(self, regional_client):
         try:
+            # Only the audited instances are requested, if any
+            audit_resources_filters = self.get_audit_resources_filters(
+                regional_client.region, "instance", "instance-id"
+            )
+            if audit_resources_filters is None:
+                return
             describe_instances_paginator = regional_client.get_paginator(
                 "describe_instances"
             )
-            for page in describe_instances_paginator.paginate():
+            for page in describe_instances_paginator.paginate(
+                **audit_resources_filters
+            ):
                 for reservation in page["Reservations"]:
                     for instance in reservation["Instances"]:
                         arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:instance/{instance['InstanceId']}"
@@ -119,10 +165,18 @@ class EC2(AWSService):
 
     def _describe_security_groups(self, regional_client):
         try:
+            # Only the audited security groups are requested, if any
+            audit_resources_filters = self.get_audit_resources_filters(
+                regional_client.region, "security-group", "group-id"
+            )
+            if audit_resources_filters is None:
+                return
             describe_security_groups_paginator = regional_client.get_paginator(
                 "describe_security_groups"
             )
-            for page in describe_security_groups_paginator.paginate():
+            for page in describe_security_groups_paginator.paginate(
+                **audit_resources_filters
+            ):
                 for sg in page["SecurityGroups"]:
                     arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:security-group/{sg['GroupId']}"
                     if not self.audit_resources or (
@@ -190,10 +244,19 @@ class EC2(AWSService):
     def _describe_snapshots(self, regional_client):
         try:
             snapshots_in_region = False
+            # Only the audited snapshots are requested, if any
+            audit_resources_filters = self.get_audit_resources_filters(
+                regional_client.region, "snapshot", "snapshot-id"
+            )
+            if audit_resources_filters is None:
+                self.regions_with_snapshots[regional_client.region] = False
+                return
             describe_snapshots_paginator = regional_client.get_paginator(
                 "describe_snapshots"
             )
-            for page in describe_snapshots_paginator.paginate(OwnerIds=["self"]):
+            for page in describe_snapshots_paginator.paginate(
+                OwnerIds=["self"], **audit_resources_filters
+            ):
                 for snapshot in page["Snapshots"]:
                     arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:snapshot/{snapshot['SnapshotId']}"
                     if not self.audit_resources or (
@@ -371,10 +434,16 @@ class EC2(AWSService):
 
     def _describe_volumes(self, regional_client):
         try:
+            # Only the audited volumes are requested, if any
+            audit_resources_filters = self.get_audit_resources_filters(
+                regional_client.region, "volume", "volume-id"
+            )
+            if audit_resources_filters is None:
+                return
             describe_volumes_paginator = regional_client.get_paginator(
                 "describe_volumes"
             )
-            for page in describe_volumes_paginator.paginate():
+            for page in describe_volumes_paginator.paginate(**audit_resources_filters):
                 for volume in page["Volumes"]:
                     arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:volume/{volume['VolumeId']}"
                     if not self.audit_resources or (
@@ -43,10 +43,18 @@ class RDS(AWSService):
     def _describe_db_instances(self, regional_client):
         logger.info("RDS - Describe Instances...")
         try:
+            # Only the audited instances are requested, if any
+            audit_resources_filters = self.get_audit_resources_filters(
+                regional_client.region, "db", "db-instance-id"
+            )
+            if audit_resources_filters is None:
+                return
             describe_db_instances_paginator = regional_client.get_paginator(
                 "describe_db_instances"
             )
-            for page in describe_db_instances_paginator.paginate():
+            for page in describe_db_instances_paginator.paginate(
+                **audit_resources_filters
+            ):
                 for instance in page["DBInstances"]:
                     arn = f"arn:{self.audited_partition}:rds:{regional_client.region}:{self.audited_account}:db:{instance['DBInstanceIdentifier']}"
                     if not self.audit_resources or (
@@ -237,10 +245,18 @@ class RDS(AWSService):
     def _describe_db_clusters(self, regional_client):
         logger.info("RDS - Describe Clusters...")
         try:
+            # Only the audited clusters are requested, if any
+            audit_resources_filters = self.get_audit_resources_filters(
+                regional_client.region, "cluster", "db-cluster-id"
+            )
+            if audit_resources_filters is None:
+                return
             describe_db_clusters_paginator = regional_client.get_paginator(
                 "describe_db_clusters"
             )
-            for page in describe_db_clusters_paginator.paginate():
+            for page in describe_db_clusters_paginator.paginate(
+                **audit_resources_filters
+            ):
                 try:
                     for cluster in page["DBClusters"]:
                         try:
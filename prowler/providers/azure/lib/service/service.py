@@ -1,8 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
 from prowler.lib.logger import logger
+from prowler.lib.utils.concurrency import ConcurrencyLimiter
 from prowler.providers.azure.azure_provider import AzureProvider
 
+# Maximum number of concurrent API calls to the same subscription
+MAX_WORKERS = 10
+# Maximum number of concurrent API calls shared by all the Azure services
+MAX_API_WORKERS = 50
+# Status code of the ARM API when the requests of a subscription are throttled
+THROTTLING_STATUS_CODE = 429
+
 
 class AzureService:
+    """The AzureService class offers a parent class for each Azure Service to generate:
+    - Azure clients per subscription
+    - Thread pool for the __threading_call__, shared by all the Azure Services and limited per subscription
+    """
+
+    _thread_pool: ThreadPoolExecutor = None
+    _thread_pool_lock = Lock()
+    _subscription_limiters: dict[str, ConcurrencyLimiter] = {}
+
+    @classmethod
+    def get_thread_pool(cls) -> ThreadPoolExecutor:
+        """Returns the thread pool shared by all the Azure Services, creating it if needed"""
+        with cls._thread_pool_lock:
+            if not cls._thread_pool:
+                cls._thread_pool = ThreadPoolExecutor(
+                    max_workers=MAX_API_WORKERS, thread_name_prefix="azure-service"
+                )
+            return cls._thread_pool
+
+    @classmethod
+    def get_subscription_limiter(cls, subscription: str) -> ConcurrencyLimiter:
+        """Returns the limiter of the concurrent API calls to the given subscription, shared by all the Azure Services"""
+        with cls._thread_pool_lock:
+            if subscription not in cls._subscription_limiters:
+                cls._subscription_limiters[subscription] = ConcurrencyLimiter(
+                    MAX_WORKERS
+                )
+            return cls._subscription_limiters[subscription]
+
+    @classmethod
+    def shutdown_thread_pool(cls, wait: bool = True):
+        """Shuts down the thread pool shared by all the Azure Services, a new one is created if it is needed again"""
+        with cls._thread_pool_lock:
+            if cls._thread_pool:
+                cls._thread_pool.shutdown(wait=wait)
+                cls._thread_pool = None
+            cls._subscription_limiters = {}
+
     def __init__(
         self,
         service: str,
@@ -34,6 +83,9 @@ class AzureService:
                                 subscription_id=id,
                                 base_url=region_config.base_url,
                                 credential_scopes=region_config.credential_scopes,
+                                raw_response_hook=self.__get_throttling_hook__(
+                                    display_name
+                                ),
                             )
                         }
                     )
@@ -43,3 +95,58 @@ class AzureService:
             )
         else:
             return clients
+
+    @staticmethod
+    def __get_throttling_hook__(subscription: str):
+        """Returns the hook called with every response of the subscription clients, including the retried ones, that reduces the concurrent calls to the subscription when ARM throttles them"""
+
+        def throttling_hook(pipeline_response):
+            if pipeline_response.http_response.status_code == THROTTLING_STATUS_CODE:
+                logger.warning(
+                    f"Subscription name: {subscription} -- The Azure Resource Manager requests are throttled, reducing the concurrent requests."
+                )
+                AzureService.get_subscription_limiter(subscription).throttle()
+
+        return throttling_hook
+
+    def __threading_call__(self, call, iterator=None) -> list:
+        """Runs the call concurrently for each subscription, or for each resource of the iterator, in the thread pool shared by all the Azure Services.
+
+        The concurrent calls to the same subscription are limited, and reduced while the subscription is throttled.
+        The calls must not run __threading_call__ themselves, to not wait for the thread pool from one of its workers.
+
+        Args:
+            call: The function to run, it receives the subscription and its client, or the subscription and the resource of the iterator.
+            iterator: The (subscription, resource) pairs to process. If not set, the call runs across the subscription clients.
+
+        Returns:
+            list: The results of the calls in the order of the items, None for the calls raising an exception.
+        """
+        items = list(iterator if iterator is not None else self.clients.items())
+
+        # Trim leading and trailing underscores from the call's name
+        call_name = call.__name__.strip("_")
+        # Add Capitalization
+        call_name = " ".join([x.capitalize() for x in call_name.split("_")])
+        logger.info(
+            f"{self.__class__.__name__.upper()} - Starting threads for '{call_name}' function to process {len(items)} items..."
+        )
+
+        thread_pool = AzureService.get_thread_pool()
+        futures = [
+            AzureService.get_subscription_limiter(subscription).submit(
+                thread_pool, call, subscription, item
+            )
+            for subscription, item in items
+        ]
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+                results.append(None)
+        return results
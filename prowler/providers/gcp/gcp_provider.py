@@ -2,12 +2,18 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Optional
 
+import google_auth_httplib2
+import httplib2
 from colorama import Fore, Style
 from google.auth import default, impersonated_credentials, load_credentials_from_dict
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from googleapiclient import discovery
+from googleapiclient.discovery import Resource
 from googleapiclient.errors import HttpError
 
 from prowler.config.config import (
@@ -31,6 +37,9 @@ from prowler.providers.gcp.exceptions.exceptions import (
 from prowler.providers.gcp.lib.mutelist.mutelist import GCPMutelist
 from prowler.providers.gcp.models import GCPIdentityInfo, GCPOrganization, GCPProject
 
+# Maximum number of threads to request the GCP APIs concurrently
+MAX_WORKERS = 10
+
 
 class GcpProvider(Provider):
     """
@@ -159,6 +168,11 @@ class GcpProvider(Provider):
                 ... )
         """
         logger.info("Instantiating GCP Provider ...")
+        # Clients and enabled APIs shared by all the services
+        self._discovery_clients = {}
+        self._enabled_services = {}
+        self._clients_lock = Lock()
+        self._enabled_services_lock = Lock()
         self._impersonated_service_account = impersonate_service_account
         # Set the GCP credentials using the provided client_id, client_secret and refresh_token
         gcp_credentials = None
@@ -316,6 +330,91 @@ class GcpProvider(Provider):
         """
         return self._mutelist
 
+    def get_discovery_client(self, service: str, api_version: str) -> Resource:
+        """
+        get_discovery_client returns the client of the given API, built once from its static discovery document and shared by all the services.
+
+        Args:
+            service: The name of the API, e.g. compute.
+            api_version: The version of the API, e.g. v1.
+
+        Returns:
+            Resource: The client of the API.
+        """
+        with self._clients_lock:
+            if (service, api_version) not in self._discovery_clients:
+                self._discovery_clients[(service, api_version)] = discovery.build(
+                    service,
+                    api_version,
+                    credentials=self._session,
+                    static_discovery=True,
+                )
+            return self._discovery_clients[(service, api_version)]
+
+    def get_enabled_services(self, project_id: str) -> Optional[set]:
+        """
+        get_enabled_services returns the APIs enabled in the given project.
+
+        The first time it is called, the enabled APIs of all the audited projects are listed concurrently with one paginated services.list request per project, so the services do not need to check them one by one.
+
+        Args:
+            project_id: The ID of the project.
+
+        Returns:
+            set: The names of the enabled APIs, e.g. compute.googleapis.com, or None if they could not be listed.
+        """
+        with self._enabled_services_lock:
+            if project_id not in self._enabled_services:
+                project_ids = [
+                    audited_project_id
+                    for audited_project_id in dict.fromkeys(
+                        [project_id, *self._project_ids]
+                    )
+                    if audited_project_id not in self._enabled_services
+                ]
+                with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                    self._enabled_services.update(
+                        zip(
+                            project_ids,
+                            executor.map(self._list_enabled_services, project_ids),
+                        )
+                    )
+            return self._enabled_services[project_id]
+
+    def _list_enabled_services(self, project_id: str) -> Optional[set]:
+        """
+        _list_enabled_services lists the APIs enabled in the given project.
+
+        Args:
+            project_id: The ID of the project.
+
+        Returns:
+            set: The names of the enabled APIs, or None if they could not be listed.
+        """
+        try:
+            client = self.get_discovery_client("serviceusage", "v1")
+            # Each thread uses its own HTTP connection
+            http = google_auth_httplib2.AuthorizedHttp(
+                self._session, http=httplib2.Http()
+            )
+            enabled_services = set()
+            request = client.services().list(
+                parent=f"projects/{project_id}", filter="state:ENABLED", pageSize=200
+            )
+            while request is not None:
+                response = request.execute(http=http)
+                for service in response.get("services", []):
+                    enabled_services.add(service["name"].split("/")[-1])
+                request = client.services().list_next(
+                    previous_request=request, previous_response=response
+                )
+            return enabled_services
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+
     @staticmethod
     def setup_session(
         credentials_file: str,
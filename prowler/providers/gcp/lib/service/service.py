@@ -1,13 +1,12 @@
-import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import google_auth_httplib2
 import httplib2
 from google.oauth2.credentials import Credentials
-from googleapiclient import discovery
 from googleapiclient.discovery import Resource
 
 from prowler.lib.logger import logger
-from prowler.providers.gcp.gcp_provider import GcpProvider
+from prowler.providers.gcp.gcp_provider import MAX_WORKERS, GcpProvider
 
 
 class GCPService:
@@ -21,6 +20,7 @@ class GCPService:
         # We receive the service using __class__.__name__ or the service name in lowercase
         # e.g.: APIKeys --> we need a lowercase string, so service.lower()
         self.service = service.lower() if not service.islower() else service
+        self.provider = provider
         self.credentials = provider.session
         self.api_version = api_version
         self.region = region
@@ -38,13 +38,16 @@ class GCPService:
         return self.client
 
     def __threading_call__(self, call, iterator):
-        threads = []
-        for value in iterator:
-            threads.append(threading.Thread(target=call, args=(value,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        # The calls are run in a bounded thread pool instead of a thread per item
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [executor.submit(call, value) for value in iterator]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as error:
+                    logger.error(
+                        f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
 
     def __get_AuthorizedHttp_client__(self):
         return google_auth_httplib2.AuthorizedHttp(
@@ -55,14 +58,20 @@ class GCPService:
         project_ids = []
         for project_id in audited_project_ids:
             try:
-                client = discovery.build(
-                    "serviceusage", "v1", credentials=self.credentials
-                )
-                request = client.services().get(
-                    name=f"projects/{project_id}/services/{self.service}.googleapis.com"
-                )
-                response = request.execute()
-                if response.get("state") != "DISABLED":
+                # The enabled APIs of each project are listed once and shared by all the services
+                enabled_services = self.provider.get_enabled_services(project_id)
+                if enabled_services is None:
+                    client = self.provider.get_discovery_client("serviceusage", "v1")
+                    request = client.services().get(
+                        name=f"projects/{project_id}/services/{self.service}.googleapis.com"
+                    )
+                    response = request.execute(
+                        http=self.__get_AuthorizedHttp_client__()
+                    )
+                    api_active = response.get("state") != "DISABLED"
+                else:
+                    api_active = f"{self.service}.googleapis.com" in enabled_services
+                if api_active:
                     project_ids.append(project_id)
                 else:
                     logger.error(
@@ -81,7 +90,7 @@ class GCPService:
         credentials: Credentials,
     ) -> Resource:
         try:
-            return discovery.build(service, api_version, credentials=credentials)
+            return self.provider.get_discovery_client(service, api_version)
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
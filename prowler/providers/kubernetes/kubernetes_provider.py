@@ -42,6 +42,7 @@ class KubernetesProvider(Provider):
         _type (str): The provider type, wich is 'kubernetes'.
         _session (KubernetesSession): The Kubernetes session.
         _namespaces (list): The list of namespaces to audit.
+        _all_namespaces (bool): Whether all the namespaces of the cluster are audited.
         _audit_config (dict): The audit configuration.
         _identity (KubernetesIdentityInfo): The Kubernetes identity information.
         _mutelist (dict): The mutelist.
@@ -60,6 +61,7 @@ class KubernetesProvider(Provider):
     _type: str = "kubernetes"
     _session: KubernetesSession
     _namespaces: list
+    _all_namespaces: bool
     _audit_config: dict
     _identity: KubernetesIdentityInfo
     _mutelist: dict
@@ -153,6 +155,7 @@ class KubernetesProvider(Provider):
         self._session = self.setup_session(
             kubeconfig_file, kubeconfig_content, context, cluster_name
         )
+        self._all_namespaces = not namespace
         if not namespace:
             logger.info("Retrieving all namespaces ...")
             self._namespaces = self.get_all_namespaces()
@@ -212,6 +215,10 @@ class KubernetesProvider(Provider):
     def namespaces(self):
         return self._namespaces
 
+    @property
+    def all_namespaces(self):
+        return self._all_namespaces
+
     @property
     def audit_config(self):
         return self._audit_config
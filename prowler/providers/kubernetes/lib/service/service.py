@@ -1,21 +1,102 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from threading import Lock
+from weakref import WeakKeyDictionary
 
+from kubernetes.client.rest import ApiException
 from prowler.lib.logger import logger
 from prowler.providers.kubernetes.kubernetes_provider import KubernetesProvider
 
 MAX_WORKERS = 10
+# Maximum number of objects returned by each page of the list calls
+LIST_PAGE_SIZE = 500
+# Status code of the Kubernetes API when the continue token of a list has expired
+EXPIRED_CONTINUE_STATUS_CODE = 410
 
 
 class KubernetesService:
+    """The KubernetesService class offers a parent class for each Kubernetes Service to generate:
+    - Thread pool for the __threading_call__
+    - Paginated list calls, shared by all the Kubernetes Services of the same provider
+    """
+
+    # Objects listed per provider, so each resource kind is only listed once per scan
+    _listed_resources: WeakKeyDictionary = WeakKeyDictionary()
+    _listed_resources_lock = Lock()
+
     def __init__(self, provider: KubernetesProvider):
         self.context = provider.identity.context
         self.api_client = provider.session.api_client
         self.audit_config = provider.audit_config
         self.fixer_config = provider.fixer_config
 
+        with KubernetesService._listed_resources_lock:
+            self._listed_resources = KubernetesService._listed_resources.setdefault(
+                provider, {}
+            )
+
         # Thread pool for __threading_call__
         self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
 
+    def __list_resources__(
+        self, list_call, namespaced_list_call=None, namespaces: list = None
+    ) -> list:
+        """Returns the objects of a resource kind, listed once and shared by all the Kubernetes Services of the provider.
+
+        Args:
+            list_call: The cluster-wide list call, e.g. CoreV1Api.list_pod_for_all_namespaces.
+            namespaced_list_call: The list call of a namespace, e.g. CoreV1Api.list_namespaced_pod.
+            namespaces: The namespaces to list concurrently with the namespaced_list_call. If not set, the objects are listed cluster-wide.
+
+        Returns:
+            list: The deserialised objects of all the pages.
+        """
+        namespaced = namespaced_list_call is not None and namespaces is not None
+        key = (
+            namespaced_list_call.__name__ if namespaced else list_call.__name__,
+            tuple(namespaces) if namespaced else None,
+        )
+        with KubernetesService._listed_resources_lock:
+            if key not in self._listed_resources:
+                self._listed_resources[key] = {"lock": Lock(), "items": None}
+            listed_resource = self._listed_resources[key]
+
+        # The services listing the same objects wait for the first one instead of listing them again
+        with listed_resource["lock"]:
+            if listed_resource["items"] is None:
+                if namespaced:
+                    items = []
+                    for namespace_items in self.thread_pool.map(
+                        partial(self.__list_pages__, namespaced_list_call), namespaces
+                    ):
+                        items.extend(namespace_items)
+                else:
+                    items = self.__list_pages__(list_call)
+                listed_resource["items"] = items
+            return listed_resource["items"]
+
+    @staticmethod
+    def __list_pages__(list_call, *args) -> list:
+        """Returns the objects of all the pages of the list call, listing them again if the continue token expires"""
+        items = []
+        _continue = None
+        while True:
+            try:
+                response = list_call(*args, limit=LIST_PAGE_SIZE, _continue=_continue)
+            except ApiException as error:
+                if error.status != EXPIRED_CONTINUE_STATUS_CODE or not _continue:
+                    raise
+                logger.warning(
+                    f"The continue token of '{list_call.__name__}' has expired, listing the objects again."
+                )
+                items = []
+                _continue = None
+                continue
+            items.extend(response.items or [])
+            _continue = response.metadata._continue if response.metadata else None
+            if not _continue:
+                return items
+
     def __threading_call__(self, call, iterator):
         items = iterator
         # Determine the total count for logging
@@ -14,6 +14,7 @@ class Core(KubernetesService):
         super().__init__(provider)
         self.client = client.CoreV1Api(self.api_client)
         self.namespaces = provider.namespaces
+        self.all_namespaces = provider.all_namespaces
         self.pods = {}
         self._get_pods()
         self.config_maps = {}
@@ -24,69 +25,71 @@ class Core(KubernetesService):
 
     def _get_pods(self):
         try:
-            for namespace in self.namespaces:
-                pods = self.client.list_namespaced_pod(namespace)
-                for pod in pods.items:
-                    pod_containers = {}
-                    containers = pod.spec.containers if pod.spec.containers else []
-                    init_containers = (
-                        pod.spec.init_containers if pod.spec.init_containers else []
-                    )
-                    ephemeral_containers = (
-                        pod.spec.ephemeral_containers
-                        if pod.spec.ephemeral_containers
-                        else []
-                    )
-                    for container in (
-                        containers + init_containers + ephemeral_containers
-                    ):
-                        pod_containers[container.name] = Container(
-                            name=container.name,
-                            image=container.image,
-                            command=container.command if container.command else None,
-                            ports=(
-                                [
-                                    {"containerPort": port.container_port}
-                                    for port in container.ports
-                                ]
-                                if container.ports
-                                else None
-                            ),
-                            env=(
-                                [
-                                    {"name": env.name, "value": env.value}
-                                    for env in container.env
-                                ]
-                                if container.env
-                                else None
-                            ),
-                            security_context=(
-                                container.security_context.to_dict()
-                                if container.security_context
-                                else {}
-                            ),
-                        )
-                    self.pods[pod.metadata.uid] = Pod(
-                        name=pod.metadata.name,
-                        uid=pod.metadata.uid,
-                        namespace=pod.metadata.namespace,
-                        labels=pod.metadata.labels,
-                        annotations=pod.metadata.annotations,
-                        node_name=pod.spec.node_name,
-                        service_account=pod.spec.service_account_name,
-                        status_phase=pod.status.phase,
-                        pod_ip=pod.status.pod_ip,
-                        host_ip=pod.status.host_ip,
-                        host_pid=pod.spec.host_pid,
-                        host_ipc=pod.spec.host_ipc,
-                        host_network=pod.spec.host_network,
+            # The pods are listed once cluster-wide when all the namespaces are audited
+            pods = self.__list_resources__(
+                self.client.list_pod_for_all_namespaces,
+                self.client.list_namespaced_pod,
+                namespaces=None if self.all_namespaces else self.namespaces,
+            )
+            for pod in pods:
+                pod_containers = {}
+                containers = pod.spec.containers if pod.spec.containers else []
+                init_containers = (
+                    pod.spec.init_containers if pod.spec.init_containers else []
+                )
+                ephemeral_containers = (
+                    pod.spec.ephemeral_containers
+                    if pod.spec.ephemeral_containers
+                    else []
+                )
+                for container in containers + init_containers + ephemeral_containers:
+                    pod_containers[container.name] = Container(
+                        name=container.name,
+                        image=container.image,
+                        command=container.command if container.command else None,
+                        ports=(
+                            [
+                                {"containerPort": port.container_port}
+                                for port in container.ports
+                            ]
+                            if container.ports
+                            else None
+                        ),
+                        env=(
+                            [
+                                {"name": env.name, "value": env.value}
+                                for env in container.env
+                            ]
+                            if container.env
+                            else None
+                        ),
                         security_context=(
-                            pod.spec.security_context.to_dict()
-                            if pod.spec.security_context
+                            container.security_context.to_dict()
+                            if container.security_context
                             else {}
                         ),
-                        containers=pod_containers,
                     )
+                self.pods[pod.metadata.uid] = Pod(
+                    name=pod.metadata.name,
+                    uid=pod.metadata.uid,
+                    namespace=pod.metadata.namespace,
+                    labels=pod.metadata.labels,
+                    annotations=pod.metadata.annotations,
+                    node_name=pod.spec.node_name,
+                    service_account=pod.spec.service_account_name,
+                    status_phase=pod.status.phase,
+                    pod_ip=pod.status.pod_ip,
+                    host_ip=pod.status.host_ip,
+                    host_pid=pod.spec.host_pid,
+                    host_ipc=pod.spec.host_ipc,
+                    host_network=pod.spec.host_network,
+                    security_context=(
+                        pod.spec.security_context.to_dict()
+                        if pod.spec.security_context
+                        else {}
+                    ),
+                    containers=pod_containers,
+                )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -94,8 +97,9 @@ class Core(KubernetesService):
 
     def _list_config_maps(self):
         try:
-            response = self.client.list_config_map_for_all_namespaces()
-            for cm in response.items:
+            for cm in self.__list_resources__(
+                self.client.list_config_map_for_all_namespaces
+            ):
                 self.config_maps[cm.metadata.uid] = ConfigMap(
                     name=cm.metadata.name,
                     namespace=cm.metadata.namespace,
@@ -111,8 +115,7 @@ class Core(KubernetesService):
 
     def _list_nodes(self):
         try:
-            response = self.client.list_node()
-            for node in response.items:
+            for node in self.__list_resources__(self.client.list_node):
                 node_model = Node(
                     name=node.metadata.name,
                     uid=node.metadata.uid,
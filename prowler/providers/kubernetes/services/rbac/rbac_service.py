@@ -21,7 +21,9 @@ class Rbac(KubernetesService):
     def _list_cluster_role_bindings(self):
         try:
             bindings = {}
-            for binding in self.client.list_cluster_role_binding().items:
+            for binding in self.__list_resources__(
+                self.client.list_cluster_role_binding
+            ):
                 # For each binding, create a ClusterRoleBinding object and append it to the list
                 formatted_binding = {
                     "metadata": binding.metadata,
@@ -55,7 +57,9 @@ class Rbac(KubernetesService):
     def _list_role_bindings(self):
         try:
             role_bindings = {}
-            for binding in self.client.list_role_binding_for_all_namespaces().items:
+            for binding in self.__list_resources__(
+                self.client.list_role_binding_for_all_namespaces
+            ):
                 formatted_binding = {
                     "metadata": binding.metadata,
                     "subjects": [
@@ -84,7 +88,9 @@ class Rbac(KubernetesService):
     def _list_roles(self):
         try:
             roles = {}
-            for role in self.client.list_role_for_all_namespaces().items:
+            for role in self.__list_resources__(
+                self.client.list_role_for_all_namespaces
+            ):
                 formatted_role = {
                     "uid": role.metadata.uid,
                     "name": role.metadata.name,
@@ -109,7 +115,7 @@ class Rbac(KubernetesService):
     def _list_cluster_roles(self):
         try:
             cluster_roles = {}
-            for role in self.client.list_cluster_role().items:
+            for role in self.__list_resources__(self.client.list_cluster_role):
                 formatted_role = {
                     "uid": role.metadata.uid,
                     "name": role.metadata.name,
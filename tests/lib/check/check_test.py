@@ -15,11 +15,14 @@ from prowler.lib.check.check import (
     exclude_services_to_run,
     execute,
     execute_checks,
+    execute_checks_in_parallel,
+    group_checks_by_service,
     list_categories,
     list_checks_json,
     list_services,
     parse_checks_from_file,
     parse_checks_from_folder,
+    prefetch_service_clients,
     remove_custom_checks_module,
     update_audit_metadata,
 )
@@ -28,6 +31,7 @@ from prowler.lib.check.utils import (
     list_modules,
     recover_checks_from_provider,
     recover_checks_from_service,
+    recover_service_clients_from_checks,
 )
 from prowler.providers.aws.aws_provider import AwsProvider
 from prowler.providers.aws.services.accessanalyzer.accessanalyzer_service import (
@@ -658,6 +662,50 @@ class TestCheck:
         recovered_checks = recover_checks_from_service(service_list, provider)
         assert recovered_checks == expected_checks
 
+    def test_recover_service_clients_from_checks(self):
+        checks = [
+            "awslambda_function_url_public",
+            "ec2_instance_public_ip",
+            "ec2_securitygroup_allow_ingress_from_internet_to_any_port",
+            "non_existing_check",
+        ]
+        assert recover_service_clients_from_checks("aws", checks) == {
+            "prowler.providers.aws.services.awslambda.awslambda_client",
+            "prowler.providers.aws.services.ec2.ec2_client",
+            "prowler.providers.aws.services.vpc.vpc_client",
+        }
+
+    def test_prefetch_service_clients(self, caplog):
+        caplog.set_level(ERROR)
+        client_modules = {
+            "prowler.providers.aws.services.ec2.ec2_client",
+            "prowler.providers.aws.services.vpc.vpc_client",
+        }
+
+        def import_module_side_effect(module):
+            if module.endswith("vpc_client"):
+                raise Exception("error")
+            return Mock()
+
+        with (
+            patch(
+                "prowler.lib.check.check.recover_service_clients_from_checks",
+                return_value=client_modules,
+            ),
+            patch(
+                "importlib.import_module", side_effect=import_module_side_effect
+            ) as mock_import_module,
+        ):
+            prefetch_service_clients(
+                ["ec2_instance_public_ip", "vpc_flow_logs_enabled"], "aws"
+            )
+
+        assert {
+            call.args[0] for call in mock_import_module.call_args_list
+        } == client_modules
+        assert len(caplog.record_tuples) == 1
+        assert "prowler.providers.aws.services.vpc.vpc_client" in caplog.text
+
     # def test_parse_checks_from_compliance_framework_two(self):
     #     test_case = {
     #         "input": {"compliance_frameworks": ["cis_v1.4_aws", "ens_v3_aws"]},
@@ -973,3 +1021,108 @@ class TestCheck:
             assert caplog.record_tuples == [
                 ("root", 40, f"Check '{checks[0]}' was not found for the AWS provider")
             ]
+
+    def test_group_checks_by_service(self):
+        checks = [
+            "ec2_ami_public",
+            "s3_bucket_public_access",
+            "ec2_ebs_public_snapshot",
+        ]
+        assert group_checks_by_service(checks) == {
+            "ec2": ["ec2_ami_public", "ec2_ebs_public_snapshot"],
+            "s3": ["s3_bucket_public_access"],
+        }
+
+    def test_execute_checks_in_parallel(self):
+        checks = [
+            "ec2_ami_public",
+            "s3_bucket_public_access",
+            "ec2_ebs_public_snapshot",
+        ]
+        provider = mock.MagicMock()
+        provider.type = "aws"
+
+        def execute_side_effect(check, *args):
+            return [check.CheckID]
+
+        with (
+            patch("prowler.lib.check.check.import_check") as mock_import_check,
+            patch("prowler.lib.check.check.execute", side_effect=execute_side_effect),
+        ):
+            mock_import_check.side_effect = lambda check_path: Mock(
+                **{
+                    check_path.split(".")[-1]: Mock(
+                        return_value=Mock(CheckID=check_path.split(".")[-1])
+                    )
+                }
+            )
+            results = list(
+                execute_checks_in_parallel(
+                    checks,
+                    provider,
+                    custom_checks_metadata=None,
+                    output_options=None,
+                    max_workers=2,
+                )
+            )
+
+        assert len(results) == 3
+        assert {check_name: findings for check_name, _, findings in results} == {
+            check: [check] for check in checks
+        }
+
+    def test_execute_checks_in_parallel_check_not_found(self, caplog):
+        caplog.set_level(ERROR)
+        provider = mock.MagicMock()
+        provider.type = "aws"
+
+        results = list(
+            execute_checks_in_parallel(
+                ["test-check"],
+                provider,
+                custom_checks_metadata=None,
+                output_options=None,
+                max_workers=2,
+            )
+        )
+
+        assert results == [("test-check", None, [])]
+        assert caplog.record_tuples == [
+            ("root", 40, "Check 'test-check' was not found for the AWS provider")
+        ]
+
+    def test_execute_checks_with_findings_handler(self):
+        checks = ["ec2_ami_public", "s3_bucket_public_access"]
+        provider = mock.MagicMock()
+        provider.type = "aws"
+        output_options = mock.MagicMock()
+        output_options.only_logs = True
+        handled_findings = []
+
+        def execute_side_effect(check, *args):
+            return [check.CheckID]
+
+        with (
+            patch("prowler.lib.check.check.import_check") as mock_import_check,
+            patch("prowler.lib.check.check.execute", side_effect=execute_side_effect),
+            patch("prowler.lib.check.check.report"),
+        ):
+            mock_import_check.side_effect = lambda check_path: Mock(
+                **{
+                    check_path.split(".")[-1]: Mock(
+                        return_value=Mock(CheckID=check_path.split(".")[-1])
+                    )
+                }
+            )
+            findings = execute_checks(
+                checks,
+                provider,
+                custom_checks_metadata=None,
+                config_file=None,
+                output_options=output_options,
+                findings_handler=handled_findings.append,
+            )
+
+        # The findings are handed to the handler check by check instead of being returned
+        assert findings == []
+        assert handled_findings == [["ec2_ami_public"], ["s3_bucket_public_access"]]
@@ -1,6 +1,9 @@
 from unittest import mock
 
-from prowler.lib.check.compliance import update_checks_metadata_with_compliance
+from prowler.lib.check.compliance import (
+    build_checks_compliance_index,
+    update_checks_metadata_with_compliance,
+)
 from prowler.lib.check.compliance_models import (
     CIS_Requirement_Attribute,
     CIS_Requirement_Attribute_AssessmentStatus,
@@ -291,6 +294,50 @@ class TestCompliance:
         assert accessanalyzer_enabled_attribute.AdditionalInformation == "Additional"
         assert accessanalyzer_enabled_attribute.References == "References"
 
+    def test_build_checks_compliance_index(self):
+        checks_compliance_index = build_checks_compliance_index(
+            custom_compliance_metadata
+        )
+
+        assert checks_compliance_index == {
+            "accessanalyzer_enabled": {"framework1_aws": ["1.1.1"]},
+            "iam_user_mfa_enabled_console_access": {"framework1_aws": ["1.1.1"]},
+        }
+
+    def test_build_checks_compliance_index_check_in_several_requirements(self):
+        framework = custom_compliance_metadata["framework1_aws"].copy(
+            update={
+                "Requirements": [
+                    requirement.copy(update={"Checks": ["accessanalyzer_enabled"] * 2})
+                    for requirement in custom_compliance_metadata[
+                        "framework1_aws"
+                    ].Requirements
+                ]
+            }
+        )
+
+        checks_compliance_index = build_checks_compliance_index(
+            {"framework1_aws": framework, "framework2_aws": framework}
+        )
+
+        assert checks_compliance_index == {
+            "accessanalyzer_enabled": {
+                "framework1_aws": ["1.1.1", "1.1.2"],
+                "framework2_aws": ["1.1.1", "1.1.2"],
+            }
+        }
+
+    def test_update_checks_metadata_check_without_compliance(self):
+        bulk_checks_metadata = self.get_custom_check_metadata()
+
+        updated_metadata = update_checks_metadata_with_compliance(
+            {"framework1_gcp": custom_compliance_metadata["framework1_gcp"]},
+            bulk_checks_metadata,
+        )
+
+        assert updated_metadata["accessanalyzer_enabled"].Compliance == []
+        assert updated_metadata["iam_user_mfa_enabled_console_access"].Compliance == []
+
     def test_list_no_provider(self):
         bulk_compliance_frameworks = custom_compliance_metadata
 
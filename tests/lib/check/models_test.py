@@ -1,6 +1,16 @@
+from dataclasses import dataclass
 from unittest import mock
 
-from prowler.lib.check.models import CheckMetadata
+from pydantic.v1 import BaseModel
+
+from prowler.lib.check.custom_checks_metadata import update_check_metadata
+from prowler.lib.check.models import (
+    Check,
+    Check_Report,
+    Check_Report_AWS,
+    CheckMetadata,
+    load_check_metadata,
+)
 from tests.lib.check.compliance_check_test import custom_compliance_metadata
 
 mock_metadata = CheckMetadata(
@@ -325,3 +335,133 @@ class TestCheckMetada:
 
         result = CheckMetadata.list(bulk_checks_metadata=bulk_metadata)
         assert result == set()
+
+
+class check_with_shared_metadata(Check):
+    def execute(self):
+        return []
+
+
+class TestCheck:
+    @mock.patch("prowler.lib.check.models.load_check_metadata")
+    def test_metadata_shared_by_findings(self, mock_load_metadata):
+        mock_load_metadata.return_value = mock_metadata
+        check = check_with_shared_metadata()
+
+        metadata = check.metadata()
+        assert isinstance(metadata, CheckMetadata)
+        assert not isinstance(metadata, Check)
+        assert check.metadata() is metadata
+        assert metadata == mock_metadata
+
+        first_report = Check_Report(metadata=check.metadata(), resource={})
+        second_report = Check_Report(metadata=check.metadata(), resource={})
+        assert first_report.check_metadata == mock_metadata
+        assert first_report.check_metadata is not metadata
+
+        # A finding can override its own metadata fields
+        first_report.check_metadata.Severity = "low"
+        assert second_report.check_metadata.Severity == "high"
+        assert check.metadata().Severity == "high"
+
+    @mock.patch("prowler.lib.check.models.load_check_metadata")
+    def test_metadata_rebuilt_with_custom_metadata(self, mock_load_metadata):
+        mock_load_metadata.return_value = mock_metadata
+        check = check_with_shared_metadata()
+        report = Check_Report(metadata=check.metadata(), resource={})
+
+        check = update_check_metadata(
+            check,
+            {"Severity": "low", "Remediation": {"Code": {"CLI": "updated_cli"}}},
+        )
+
+        assert check.metadata().Severity == "low"
+        assert check.metadata().Remediation.Code.CLI == "updated_cli"
+        # The findings already created and the loaded metadata are not updated
+        assert report.check_metadata.Severity == "high"
+        assert report.check_metadata.Remediation.Code.CLI == "cli1"
+        assert mock_metadata.Remediation.Code.CLI == "cli1"
+
+    def test_check_report_from_json_metadata(self):
+        report = Check_Report(metadata=mock_metadata.json(), resource={})
+
+        assert report.check_metadata == mock_metadata
+
+
+class TestLoadCheckMetadata:
+    def test_load_check_metadata_parses_file_once(self, tmp_path):
+        metadata_file = tmp_path / "check.metadata.json"
+        metadata_file.write_text(mock_metadata.json())
+
+        with mock.patch.object(
+            CheckMetadata, "parse_file", wraps=CheckMetadata.parse_file
+        ) as mock_parse_file:
+            first_metadata = load_check_metadata(str(metadata_file))
+            second_metadata = load_check_metadata(str(metadata_file))
+
+        mock_parse_file.assert_called_once()
+        assert first_metadata == mock_metadata
+        assert second_metadata == mock_metadata
+        assert first_metadata is not second_metadata
+
+
+class ResourceModel(BaseModel):
+    id: str
+    arn: str
+    region: str
+    tags: list = []
+
+
+@dataclass
+class ResourceDataclass:
+    id: str
+
+
+class TestCheckReport:
+    def test_check_report_is_slotted(self):
+        report = Check_Report_AWS(
+            metadata=mock_metadata,
+            resource=ResourceModel(id="id", arn="arn", region="eu-west-1"),
+        )
+
+        report.status = "PASS"
+        # The fields are stored in slots and the instance dictionary is only used for other attributes
+        assert report.__dict__ == {}
+        report.unknown_field = "value"
+        assert report.__dict__ == {"unknown_field": "value"}
+
+    def test_check_report_resource_converted_on_access(self):
+        resource = ResourceModel(
+            id="id", arn="arn", region="eu-west-1", tags=[{"Key": "k"}]
+        )
+
+        with mock.patch.object(
+            ResourceModel, "dict", wraps=resource.dict
+        ) as mock_resource_dict:
+            report = Check_Report_AWS(metadata=mock_metadata, resource=resource)
+            assert report.resource_id == "id"
+            assert report.resource_arn == "arn"
+            assert report.region == "eu-west-1"
+            assert report.resource_tags == [{"Key": "k"}]
+            mock_resource_dict.assert_not_called()
+
+            assert report.resource == resource.dict()
+            assert report.resource is report.resource
+        assert mock_resource_dict.call_count == 2
+
+    def test_check_report_resource_types(self):
+        assert Check_Report(metadata=mock_metadata, resource={"id": "id"}).resource == {
+            "id": "id"
+        }
+        assert Check_Report(
+            metadata=mock_metadata, resource=ResourceDataclass(id="id")
+        ).resource == {"id": "id"}
+        assert Check_Report(metadata=mock_metadata, resource=None).resource == {}
+
+    def test_check_report_resource_replaced(self):
+        report = Check_Report(metadata=mock_metadata, resource={"id": "id"})
+        assert report.resource == {"id": "id"}
+
+        report.resource = {"id": "other_id"}
+
+        assert report.resource == {"id": "other_id"}
@@ -5,7 +5,7 @@ from argparse import ArgumentTypeError
 import pytest
 from mock import patch
 
-from prowler.lib.cli.parser import ProwlerArgumentParser
+from prowler.lib.cli.parser import ProwlerArgumentParser, validate_parallel_checks
 from prowler.providers.aws.config import ROLE_SESSION_NAME
 from prowler.providers.aws.lib.arguments.arguments import (
     validate_bucket,
@@ -374,6 +374,16 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.unix_timestamp
 
+    def test_root_parser_streaming_outputs(self):
+        command = [prowler_command, "--streaming-outputs"]
+        parsed = self.parser.parse(command)
+        assert parsed.streaming_outputs
+
+    def test_root_parser_default_streaming_outputs(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.streaming_outputs
+
     def test_logging_parser_only_logs_set(self):
         command = [prowler_command, "--only-logs"]
         parsed = self.parser.parse(command)
@@ -546,6 +556,40 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.checks_folder == filename
 
+    def test_checks_parser_parallel_checks_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == 1
+        assert not parsed.prefetch_services
+
+    def test_checks_parser_parallel_checks(self):
+        argument = "--parallel-checks"
+        command = [prowler_command, argument, "4"]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == 4
+
+    def test_checks_parser_parallel_checks_without_value(self):
+        argument = "--parallel-checks"
+        command = [prowler_command, argument]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_checks_parser_parallel_checks_invalid(self):
+        argument = "--parallel-checks"
+        command = [prowler_command, argument, "0"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_checks_parser_prefetch_services(self):
+        argument = "--prefetch-services"
+        command = [prowler_command, argument]
+        parsed = self.parser.parse(command)
+        assert parsed.prefetch_services
+
     def test_checks_parser_services_short(self):
         argument = "-s"
         service_1 = "iam"
@@ -1081,6 +1125,25 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.aws_retries_max_attempts == int(max_retries)
 
+    def test_aws_parser_max_api_workers(self):
+        argument = "--max-api-workers"
+        max_api_workers = "100"
+        command = [prowler_command, argument, max_api_workers]
+        parsed = self.parser.parse(command)
+        assert parsed.max_api_workers == int(max_api_workers)
+
+    def test_aws_parser_retries_mode_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_retries_mode == "standard"
+
+    def test_aws_parser_retries_mode_adaptive(self):
+        argument = "--aws-retries-mode"
+        retries_mode = "adaptive"
+        command = [prowler_command, argument, retries_mode]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_retries_mode == retries_mode
+
     def test_aws_parser_scan_unused_services(self):
         argument = "--scan-unused-services"
         command = [prowler_command, argument]
@@ -1347,6 +1410,21 @@ class Test_Parser:
         for bucket_name in valid_bucket_names:
             assert validate_bucket(bucket_name) == bucket_name
 
+    def test_validate_parallel_checks_invalid_values(self):
+        for parallel_checks in ["0", "-2", "four", "1.5"]:
+            with pytest.raises(ArgumentTypeError) as argument_error:
+                validate_parallel_checks(parallel_checks)
+
+            assert argument_error.type == ArgumentTypeError
+            assert (
+                argument_error.value.args[0]
+                == "The number of parallel checks must be an integer greater than 0"
+            )
+
+    def test_validate_parallel_checks_valid_values(self):
+        assert validate_parallel_checks("1") == 1
+        assert validate_parallel_checks("8") == 8
+
     def test_validate_role_session_name_invalid_role_names(self):
         bad_role_names = [
             "role name",
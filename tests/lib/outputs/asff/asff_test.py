@@ -576,6 +576,29 @@ class TestASFF:
         content = mock_file.read()
         assert loads(content) == expected_asff
 
+    def test_asff_write_to_file_in_batches(self):
+        mock_file = StringIO()
+        asff = ASFF(findings=[generate_finding_output(status="PASS")], from_cli=False)
+        asff._file_descriptor = mock_file
+
+        with patch.object(mock_file, "close", return_value=None) as mock_close:
+            asff.batch_write_data_to_file()
+            # The file is not closed until the last batch
+            mock_close.assert_not_called()
+
+            asff._data = []
+            asff.transform([generate_finding_output(status="FAIL")])
+            asff.close_file = True
+            asff.batch_write_data_to_file()
+            mock_close.assert_called_once()
+
+        mock_file.seek(0)
+        content = loads(mock_file.read())
+        assert [finding["Compliance"]["Status"] for finding in content] == [
+            "PASSED",
+            "FAILED",
+        ]
+
     def test_batch_write_data_to_file_without_findings(self):
         assert not ASFF([])._file_descriptor
 
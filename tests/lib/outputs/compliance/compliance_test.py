@@ -382,3 +382,40 @@ class TestCompliance:
         assert get_check_compliance(finding, "github", bulk_checks_metadata) == {
             "CIS-1.0": ["1.1.11"],
         }
+
+    def test_get_check_compliance_cached_per_check(self):
+        finding = Check_Report(
+            metadata=load_check_metadata(
+                f"{path.dirname(path.realpath(__file__))}/../fixtures/metadata.json"
+            ).json(),
+            resource={},
+        )
+
+        bulk_checks_metadata = {}
+        bulk_checks_metadata["iam_user_accesskey_unused"] = mock.MagicMock()
+        bulk_checks_metadata["iam_user_accesskey_unused"].Compliance = [
+            Compliance(
+                Framework="CIS",
+                Provider="AWS",
+                Version="1.4",
+                Description="CIS",
+                Requirements=[
+                    Compliance_Requirement(
+                        Checks=[], Id="2.1.3", Description="", Attributes=[]
+                    )
+                ],
+            )
+        ]
+
+        first_compliance = get_check_compliance(finding, "aws", bulk_checks_metadata)
+        assert first_compliance == {"CIS-1.4": ["2.1.3"]}
+
+        # Each finding gets its own copy of the compliance map
+        first_compliance["CIS-1.4"].append("1.1")
+        assert get_check_compliance(finding, "aws", bulk_checks_metadata) == {
+            "CIS-1.4": ["2.1.3"]
+        }
+
+        # The map is rebuilt when the check's compliance is replaced
+        bulk_checks_metadata["iam_user_accesskey_unused"].Compliance = []
+        assert get_check_compliance(finding, "aws", bulk_checks_metadata) == {}
@@ -0,0 +1,108 @@
+import tempfile
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from freezegun import freeze_time
+
+from prowler.config.config import prowler_version
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.parquet.parquet import Parquet
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+from tests.providers.aws.utils import AWS_ACCOUNT_NUMBER, AWS_REGION_EU_WEST_1
+
+
+class TestParquet:
+    def test_output_transform(self):
+        findings = [generate_finding_output()]
+
+        output = Parquet(findings)
+
+        assert output.data == CSV(findings).data
+
+    @freeze_time(datetime.now())
+    def test_parquet_write_to_file(self):
+        findings = [
+            generate_finding_output(status="PASS"),
+            generate_finding_output(status="FAIL", muted=True),
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = f"{temp_dir}/test.parquet"
+            output = Parquet(findings, file_path=file_path)
+            output.batch_write_data_to_file()
+
+            assert output.file_descriptor.closed
+            table = pq.read_table(file_path)
+
+        assert table.num_rows == 2
+        assert table.column_names == list(output.data[0].keys())
+        assert table.column("CHECK_ID").to_pylist() == ["test-check-id"] * 2
+        assert table.column("ACCOUNT_UID").to_pylist() == [AWS_ACCOUNT_NUMBER] * 2
+        assert table.column("REGION").to_pylist() == [AWS_REGION_EU_WEST_1] * 2
+        assert table.column("STATUS").to_pylist() == ["PASS", "FAIL"]
+        assert table.column("MUTED").to_pylist() == [False, True]
+        assert table.column("TIMESTAMP").to_pylist() == [datetime.now()] * 2
+        assert table.column("PROWLER_VERSION").to_pylist() == [prowler_version] * 2
+        assert pa.types.is_dictionary(table.schema.field("SEVERITY").type)
+        assert pa.types.is_boolean(table.schema.field("MUTED").type)
+
+    def test_parquet_write_to_file_in_batches(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = f"{temp_dir}/test.parquet"
+            output = Parquet(
+                [generate_finding_output(status="PASS")],
+                file_path=file_path,
+                from_cli=False,
+            )
+            output.batch_write_data_to_file()
+            assert not output.file_descriptor.closed
+
+            output._data = []
+            output.transform([generate_finding_output(status="FAIL")])
+            output.close_file = True
+            output.batch_write_data_to_file()
+            assert output.file_descriptor.closed
+
+            parquet_file = pq.ParquetFile(file_path)
+            assert parquet_file.metadata.num_row_groups == 2
+            assert parquet_file.metadata.row_group(0).column(0).compression == "ZSTD"
+            assert parquet_file.read().column("STATUS").to_pylist() == [
+                "PASS",
+                "FAIL",
+            ]
+
+    def test_parquet_without_compression(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = f"{temp_dir}/test.parquet"
+            output = Parquet(
+                [generate_finding_output()], file_path=file_path, compression=None
+            )
+            output.batch_write_data_to_file()
+
+            parquet_file = pq.ParquetFile(file_path)
+            assert (
+                parquet_file.metadata.row_group(0).column(0).compression
+                == "UNCOMPRESSED"
+            )
+
+    def test_parquet_unix_timestamp(self):
+        finding = generate_finding_output()
+        finding.timestamp = 1700000000
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = f"{temp_dir}/test.parquet"
+            output = Parquet([finding], file_path=file_path)
+            output.batch_write_data_to_file()
+
+            table = pq.read_table(file_path)
+
+        assert table.column("TIMESTAMP").to_pylist() == [
+            datetime.fromtimestamp(1700000000)
+        ]
+
+    def test_batch_write_data_to_file_without_findings(self):
+        assert not Parquet([])._file_descriptor
+
+    def test_parquet_with_file_path(self):
+        parquet = Parquet(findings=[], file_path="test.parquet")
+
+        assert parquet.file_extension == ".parquet"
@@ -0,0 +1,231 @@
+import json
+from csv import DictReader
+from unittest import mock
+
+import pyarrow.parquet as pq
+from mock import patch
+
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+from prowler.lib.outputs.outputs import extract_findings_statistics
+from prowler.lib.outputs.streaming import FindingSummary, StreamingOutputs
+from tests.lib.outputs.compliance.fixtures import CIS_1_4_AWS, CIS_1_4_AWS_NAME
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, set_mocked_aws_provider
+
+
+def generate_check_report(finding_output):
+    """Returns a check report that is converted to the given finding output"""
+    check_report = mock.MagicMock()
+    check_report.check_metadata.CheckID = finding_output.metadata.CheckID
+    check_report.check_metadata.ServiceName = finding_output.metadata.ServiceName
+    check_report.check_metadata.Provider = finding_output.metadata.Provider
+    check_report.check_metadata.Severity = finding_output.metadata.Severity
+    check_report.status = finding_output.status
+    check_report.muted = finding_output.muted
+    check_report.finding_output = finding_output
+    return check_report
+
+
+def generate_output(provider, check_report, output_options):
+    return check_report.finding_output
+
+
+class TestStreamingOutputs:
+    def setup_method(self):
+        self.provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+        self.finding_outputs = [
+            generate_finding_output(
+                status="FAIL",
+                resource_uid="resource-1",
+                compliance={"CIS-1.4": "2.1.3"},
+            ),
+            generate_finding_output(
+                status="PASS",
+                resource_uid="resource-2",
+                compliance={"CIS-1.4": "2.1.3"},
+            ),
+            generate_finding_output(
+                status="FAIL",
+                muted=True,
+                resource_uid="resource-1",
+                service_name="other-service",
+                check_id="other-check-id",
+            ),
+        ]
+        self.checks_findings = [
+            [generate_check_report(finding) for finding in self.finding_outputs[:2]],
+            [],
+            [generate_check_report(self.finding_outputs[2])],
+        ]
+
+    def stream(self, tmp_path, output_formats, compliance_frameworks={}, **kwargs):
+        output_options = mock.MagicMock()
+        output_options.output_directory = str(tmp_path)
+        output_options.output_filename = "prowler-output"
+        (tmp_path / "compliance").mkdir()
+        streaming_outputs = StreamingOutputs(
+            self.provider,
+            output_options,
+            output_formats,
+            compliance_frameworks,
+            **kwargs,
+        )
+        with patch(
+            "prowler.lib.outputs.streaming.Finding.generate_output",
+            side_effect=generate_output,
+        ):
+            for check_findings in self.checks_findings:
+                streaming_outputs.write(check_findings)
+        return streaming_outputs, streaming_outputs.close()
+
+    def test_csv_and_ocsf(self, tmp_path):
+        _, generated_outputs = self.stream(tmp_path, ["csv", "json-ocsf"])
+
+        assert generated_outputs["compliance"] == []
+        assert len(generated_outputs["regular"]) == 2
+        assert all(
+            output.file_descriptor.closed for output in generated_outputs["regular"]
+        )
+        with open(tmp_path / "prowler-output.csv") as csv_file:
+            rows = list(DictReader(csv_file, delimiter=";"))
+        assert [row["RESOURCE_UID"] for row in rows] == [
+            "resource-1",
+            "resource-2",
+            "resource-1",
+        ]
+        with open(tmp_path / "prowler-output.ocsf.json") as ocsf_file:
+            ocsf_findings = json.load(ocsf_file)
+        assert [finding["status_code"] for finding in ocsf_findings] == [
+            "FAIL",
+            "PASS",
+            "FAIL",
+        ]
+
+    def test_asff(self, tmp_path):
+        streaming_outputs, _ = self.stream(
+            tmp_path, ["json-asff"], keep_asff_findings=True
+        )
+
+        with open(tmp_path / "prowler-output.asff.json") as asff_file:
+            asff_findings = json.load(asff_file)
+        assert len(asff_findings) == 3
+        assert [
+            finding.Compliance.Status for finding in streaming_outputs.asff_findings
+        ] == [
+            "FAILED",
+            "PASSED",
+            "WARNING",
+        ]
+
+    def test_asff_findings_not_kept(self, tmp_path):
+        streaming_outputs, _ = self.stream(tmp_path, ["json-asff"])
+
+        assert streaming_outputs.asff_findings == []
+
+    def test_parquet(self, tmp_path):
+        _, generated_outputs = self.stream(tmp_path, ["parquet"])
+
+        assert generated_outputs["regular"][0].file_descriptor.closed
+        parquet_file = pq.ParquetFile(tmp_path / "prowler-output.parquet")
+        # One row group per check with findings
+        assert parquet_file.metadata.num_row_groups == 2
+        assert parquet_file.read().column("RESOURCE_UID").to_pylist() == [
+            "resource-1",
+            "resource-2",
+            "resource-1",
+        ]
+
+    def test_html(self, tmp_path):
+        _, generated_outputs = self.stream(tmp_path, ["html"])
+
+        assert generated_outputs["regular"][0].file_descriptor.closed
+        with open(tmp_path / "prowler-output.html") as html_file:
+            content = html_file.read()
+        assert content.count("<html") == 1
+        assert content.count("</html>") == 1
+        assert content.count("<td>FAIL</td>") == 1
+        assert content.count("<td>MUTED (FAIL)</td>") == 1
+        assert content.count("<td>PASS</td>") == 1
+        # The header is written with the statistics of all the findings
+        assert content.index("<html") < content.index("<td>PASS</td>")
+
+    def test_compliance(self, tmp_path):
+        _, generated_outputs = self.stream(
+            tmp_path, [], {CIS_1_4_AWS_NAME: CIS_1_4_AWS}
+        )
+
+        assert generated_outputs["regular"] == []
+        assert isinstance(generated_outputs["compliance"][0], AWSCIS)
+        with open(
+            tmp_path / "compliance" / f"prowler-output_{CIS_1_4_AWS_NAME}.csv"
+        ) as compliance_file:
+            rows = list(DictReader(compliance_file, delimiter=";"))
+        # The manual requirements are only written once
+        assert [row["STATUS"] for row in rows] == ["FAIL", "PASS", "MANUAL"]
+        expected_rows = AWSCIS(self.finding_outputs, CIS_1_4_AWS).data
+        assert [row["REQUIREMENTS_ID"] for row in rows] == [
+            row.Requirements_Id for row in expected_rows
+        ]
+
+    def test_stats(self, tmp_path):
+        streaming_outputs, _ = self.stream(tmp_path, ["csv"])
+
+        expected_stats = extract_findings_statistics(self.finding_outputs)
+        assert streaming_outputs.stats == expected_stats
+        assert streaming_outputs.stats["resources_count"] == 2
+        assert not streaming_outputs.stats["all_fails_are_muted"]
+
+    def test_stats_without_findings(self):
+        streaming_outputs = StreamingOutputs(
+            self.provider, mock.MagicMock(), ["csv"], {}
+        )
+
+        assert streaming_outputs.stats == extract_findings_statistics([])
+        assert streaming_outputs.close() == {"regular": [], "compliance": []}
+
+    def test_findings_summary(self, tmp_path):
+        streaming_outputs, _ = self.stream(tmp_path, [])
+
+        assert all(
+            isinstance(finding, FindingSummary)
+            for finding in streaming_outputs.findings
+        )
+        assert [
+            (finding.check_metadata.CheckID, finding.status, finding.muted)
+            for finding in streaming_outputs.findings
+        ] == [
+            ("test-check-id", "FAIL", False),
+            ("test-check-id", "PASS", False),
+            ("other-check-id", "FAIL", True),
+        ]
+        # The findings of the same check share their summary
+        assert (
+            streaming_outputs.findings[0].check_metadata
+            is streaming_outputs.findings[1].check_metadata
+        )
+
+    def test_finding_not_converted(self, tmp_path):
+        self.checks_findings[0][1].finding_output = None
+
+        def generate_output_with_error(provider, check_report, output_options):
+            if check_report.finding_output is None:
+                raise ValueError("invalid finding")
+            return check_report.finding_output
+
+        output_options = mock.MagicMock()
+        output_options.output_directory = str(tmp_path)
+        output_options.output_filename = "prowler-output"
+        streaming_outputs = StreamingOutputs(self.provider, output_options, ["csv"], {})
+        with patch(
+            "prowler.lib.outputs.streaming.Finding.generate_output",
+            side_effect=generate_output_with_error,
+        ):
+            for check_findings in self.checks_findings:
+                streaming_outputs.write(check_findings)
+        streaming_outputs.close()
+
+        # The findings are summarized even if they cannot be written
+        assert len(streaming_outputs.findings) == 3
+        assert streaming_outputs.stats["findings_count"] == 2
+        with open(tmp_path / "prowler-output.csv") as csv_file:
+            assert len(list(DictReader(csv_file, delimiter=";"))) == 2
@@ -392,3 +392,41 @@ class TestScan:
         results = list(scan.scan(custom_checks_metadata))
 
         assert results[0] == (100.0, [])
+
+    @patch("prowler.lib.check.check.execute", return_value=[finding])
+    @patch("importlib.import_module")
+    def test_scan_parallel(
+        self,
+        mock_import_module,
+        mock_check_execute,
+        mock_global_provider,
+        mock_logger,
+        mock_generate_output,
+        mock_recover_checks_from_provider,
+        mock_load_check_metadata,
+    ):
+        mock_check_class = MagicMock()
+        mock_check_instance = mock_check_class.return_value
+        mock_check_instance.Provider = "aws"
+        mock_check_instance.CheckID = "accessanalyzer_enabled"
+        mock_check_instance.CheckTitle = "Check if IAM Access Analyzer is enabled"
+        mock_check_instance.Categories = []
+
+        mock_import_module.return_value = MagicMock(
+            accessanalyzer_enabled=mock_check_class
+        )
+
+        checks_to_execute = {"accessanalyzer_enabled"}
+        custom_checks_metadata = {}
+
+        scan = Scan(mock_global_provider, checks=checks_to_execute, max_workers=4)
+        results = list(scan.scan(custom_checks_metadata))
+
+        assert mock_check_execute.call_count == 1
+        assert len(results) == 1
+        assert results[0] == (100.0, [finding])
+        assert scan.progress == 100.0
+        assert scan.service_checks_completed == {
+            "accessanalyzer": {"accessanalyzer_enabled"},
+        }
+        mock_logger.error.assert_not_called()
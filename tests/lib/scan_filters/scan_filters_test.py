@@ -1,4 +1,7 @@
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import (
+    AuditResourcesFilter,
+    is_resource_filtered,
+)
 
 
 class Test_Scan_Filters:
@@ -15,3 +18,105 @@ class Test_Scan_Filters:
         )
         assert is_resource_filtered("test_bucket", audit_resources)
         assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+
+    def test_is_resource_filtered_with_audit_resources_filter(self):
+        audit_resources = AuditResourcesFilter(
+            [
+                "arn:aws:iam::123456789012:user/test_user",
+                "arn:aws:s3:::test_bucket",
+            ]
+        )
+        assert is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test_user", audit_resources
+        )
+        assert not is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test1", audit_resources
+        )
+        assert is_resource_filtered("test_bucket", audit_resources)
+        assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+
+
+class Test_AuditResourcesFilter:
+    def test_is_filtered(self):
+        audit_resources_filter = AuditResourcesFilter(
+            [
+                "arn:aws:ec2:eu-west-1:123456789012:instance/i-1234567890abcdef0",
+                "arn:aws:s3:::test_bucket/folder/key",
+                "arn:aws:wafv2:eu-west-1:123456789012:regional/webacl/test-acl/1234-abcd",
+            ]
+        )
+        # Complete ARNs
+        assert audit_resources_filter.is_filtered(
+            "arn:aws:ec2:eu-west-1:123456789012:instance/i-1234567890abcdef0"
+        )
+        # Resource IDs and names
+        assert audit_resources_filter.is_filtered("i-1234567890abcdef0")
+        assert audit_resources_filter.is_filtered("test_bucket")
+        assert audit_resources_filter.is_filtered("test-acl")
+        assert audit_resources_filter.is_filtered("1234-abcd")
+        # Parent resources
+        assert audit_resources_filter.is_filtered("arn:aws:s3:::test_bucket")
+        assert audit_resources_filter.is_filtered("arn:aws:s3:::test_bucket/folder")
+        # Other resources
+        assert not audit_resources_filter.is_filtered(
+            "arn:aws:ec2:eu-west-1:123456789012:instance/i-0000000000000000"
+        )
+        assert not audit_resources_filter.is_filtered("arn:aws:s3:::other_bucket")
+        assert not audit_resources_filter.is_filtered("i-12345")
+
+    def test_get_resource_ids(self):
+        audit_resources_filter = AuditResourcesFilter(
+            [
+                "arn:aws:ec2:eu-west-1:123456789012:instance/i-1",
+                "arn:aws:ec2:eu-west-1:123456789012:instance/i-2",
+                "arn:aws:ec2:us-east-1:123456789012:instance/i-3",
+                "arn:aws:rds:eu-west-1:123456789012:db:test-db",
+                "arn:aws:s3:::test_bucket",
+            ]
+        )
+
+        assert audit_resources_filter.get_resource_ids(
+            "ec2", "eu-west-1", "instance"
+        ) == ["i-1", "i-2"]
+        assert audit_resources_filter.get_resource_ids(
+            "ec2", "us-east-1", "instance"
+        ) == ["i-3"]
+        assert audit_resources_filter.get_resource_ids("rds", "eu-west-1", "db") == [
+            "test-db"
+        ]
+        assert audit_resources_filter.get_resource_ids("s3", "", "") == ["test_bucket"]
+        assert (
+            audit_resources_filter.get_resource_ids("ec2", "eu-west-1", "volume") == []
+        )
+
+    def test_without_audit_resources(self):
+        audit_resources_filter = AuditResourcesFilter([])
+
+        assert not audit_resources_filter
+        assert audit_resources_filter == []
+        assert not audit_resources_filter.is_filtered("arn:aws:s3:::test_bucket")
+
+    def test_behaves_as_the_audit_resources(self):
+        audit_resources = ["arn:aws:s3:::test_bucket", "arn:aws:s3:::other_bucket"]
+        audit_resources_filter = AuditResourcesFilter(audit_resources)
+
+        assert audit_resources_filter
+        assert len(audit_resources_filter) == 2
+        assert list(audit_resources_filter) == audit_resources
+        assert audit_resources_filter == audit_resources
+        assert audit_resources_filter == AuditResourcesFilter(audit_resources)
+
+    def test_get_resource_segments(self):
+        segments = AuditResourcesFilter.get_resource_segments(
+            "arn:aws:s3:::test_bucket/key"
+        )
+
+        assert {
+            "arn:aws:s3:::test_bucket/key",
+            "arn:aws:s3:::test_bucket",
+            "test_bucket/key",
+            "test_bucket",
+            "key",
+        } <= segments
+        assert "test_buck" not in segments
+        assert "bucket/key" not in segments
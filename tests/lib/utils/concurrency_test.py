@@ -0,0 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import sleep
+
+from prowler.lib.utils.concurrency import ConcurrencyLimiter
+
+
+class TestConcurrencyLimiter:
+    def test_throttle(self):
+        limiter = ConcurrencyLimiter(4)
+
+        limiter.throttle()
+        assert limiter.max_concurrency == 2
+        limiter.throttle()
+        limiter.throttle()
+        assert limiter.max_concurrency == 1
+
+    def test_throttle_limits_and_recovers(self):
+        limiter = ConcurrencyLimiter(4)
+        limiter.throttle()
+        lock = Lock()
+        running = []
+        max_running = []
+
+        def call(item):
+            with lock:
+                running.append(item)
+                max_running.append(len(running))
+            sleep(0.01)
+            with lock:
+                running.remove(item)
+            return item
+
+        with ThreadPoolExecutor(max_workers=8) as thread_pool:
+            futures = [limiter.submit(thread_pool, call, item) for item in range(20)]
+            assert [future.result(timeout=5) for future in futures] == list(range(20))
+
+        # The first calls run with the throttled limit
+        assert max(max_running[:2]) <= 2
+        assert max(max_running) <= 4
+        # The initial limit is recovered
+        assert limiter.max_concurrency == 4
@@ -16,6 +16,7 @@ from moto import mock_aws
 from pytest import raises
 from tzlocal import get_localzone
 
+from prowler.lib.scan_filters.scan_filters import AuditResourcesFilter
 from prowler.providers.aws.aws_provider import AwsProvider, get_aws_region_for_sts
 from prowler.providers.aws.config import (
     AWS_STS_GLOBAL_ENDPOINT_REGION,
@@ -1095,6 +1096,24 @@ aws:
 
         assert aws_provider.audit_resources == [AWS_ACCOUNT_ARN]
 
+    @mock_aws
+    def test_aws_provider_audit_resources_filter(self):
+        resource_arn = ["arn:aws:s3:::test_bucket"]
+        aws_provider = AwsProvider(
+            resource_arn=resource_arn,
+        )
+
+        audit_resources_filter = aws_provider.audit_resources_filter
+        assert isinstance(audit_resources_filter, AuditResourcesFilter)
+        assert audit_resources_filter.is_filtered("test_bucket")
+        # The filter is only built once for the same resources
+        assert aws_provider.audit_resources_filter is audit_resources_filter
+
+        aws_provider._audit_resources = ["arn:aws:s3:::other_bucket"]
+        assert aws_provider.audit_resources_filter is not audit_resources_filter
+        assert aws_provider.audit_resources_filter.is_filtered("other_bucket")
+        assert not aws_provider.audit_resources_filter.is_filtered("test_bucket")
+
     @mock_aws
     def test_validate_credentials_commercial_partition_with_regions(self):
         # Create a mock IAM user
@@ -1948,6 +1967,22 @@ aws:
         assert session_config.user_agent_extra == BOTO3_USER_AGENT_EXTRA
         assert session_config.retries == {"max_attempts": 10, "mode": "standard"}
 
+    @mock_aws
+    def test_set_session_config_adaptive_mode(self):
+        aws_provider = AwsProvider()
+        session_config = aws_provider.set_session_config(None, "adaptive")
+
+        assert session_config.user_agent_extra == BOTO3_USER_AGENT_EXTRA
+        assert session_config.retries == {"max_attempts": 3, "mode": "adaptive"}
+
+    @mock_aws
+    def test_set_session_config_10_max_attempts_adaptive_mode(self):
+        aws_provider = AwsProvider()
+        session_config = aws_provider.set_session_config(10, "adaptive")
+
+        assert session_config.user_agent_extra == BOTO3_USER_AGENT_EXTRA
+        assert session_config.retries == {"max_attempts": 10, "mode": "adaptive"}
+
     @mock_aws
     @patch(
         "prowler.lib.check.utils.recover_checks_from_provider",
@@ -1955,3 +1955,117 @@ class TestAWSMutelist:
             "prowler",
             "",
         )
+
+    def test_get_matched_checks(self):
+        muted_checks = {
+            "ec2_*": {"Regions": ["*"], "Resources": ["*"]},
+            "s3_bucket_public_access": {"Regions": ["*"], "Resources": ["*"]},
+            "lambda_function_url_public": {
+                "Regions": [AWS_REGION_US_EAST_1],
+                "Resources": ["*"],
+            },
+            "*": {"Regions": [AWS_REGION_EU_WEST_1], "Resources": ["*"]},
+        }
+
+        assert AWSMutelist.get_matched_checks(
+            muted_checks, "ec2_instance_public_ip"
+        ) == [muted_checks["ec2_*"], muted_checks["*"]]
+        assert AWSMutelist.get_matched_checks(
+            muted_checks, "awslambda_function_url_public"
+        ) == [muted_checks["lambda_function_url_public"], muted_checks["*"]]
+        assert AWSMutelist.get_matched_checks(muted_checks, "iam_root_mfa_enabled") == [
+            muted_checks["*"]
+        ]
+
+    def test_is_muted_rebuilds_index_when_mutelist_changes(self):
+        mutelist_content = {
+            "Accounts": {
+                AWS_ACCOUNT_NUMBER: {
+                    "Checks": {
+                        "check_test": {
+                            "Regions": [AWS_REGION_US_EAST_1],
+                            "Resources": ["prowler"],
+                        }
+                    }
+                }
+            }
+        }
+        mutelist = AWSMutelist(mutelist_content=mutelist_content)
+
+        assert mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER, "check_test", AWS_REGION_US_EAST_1, "prowler", ""
+        )
+        # The matched checks are computed once per account and check
+        assert mutelist._matched_checks_index == {
+            (AWS_ACCOUNT_NUMBER, "check_test"): [
+                mutelist_content["Accounts"][AWS_ACCOUNT_NUMBER]["Checks"]["check_test"]
+            ]
+        }
+
+        mutelist._mutelist = {
+            "Accounts": {
+                AWS_ACCOUNT_NUMBER: {
+                    "Checks": {
+                        "another_check": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        }
+                    }
+                }
+            }
+        }
+
+        assert not mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER, "check_test", AWS_REGION_US_EAST_1, "prowler", ""
+        )
+
+    def test_is_muted_excepted_stops_following_checks(self):
+        mutelist_content = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "check_*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Exceptions": {"Regions": [AWS_REGION_US_EAST_1]},
+                        },
+                        "check_test": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        },
+                    }
+                }
+            }
+        }
+        mutelist = AWSMutelist(mutelist_content=mutelist_content)
+
+        assert not mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER, "check_test", AWS_REGION_US_EAST_1, "prowler", ""
+        )
+        assert mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER, "check_test", AWS_REGION_EU_WEST_1, "prowler", ""
+        )
+
+    def test_is_item_matched_with_capturing_groups(self):
+        assert AWSMutelist.is_item_matched(["(prowler)-\\1", "test"], "prowler-prowler")
+        assert AWSMutelist.is_item_matched(["(prowler)-\\1", "test"], "test")
+        assert not AWSMutelist.is_item_matched(
+            ["(prowler)-\\1", "test"], "prowler-other"
+        )
+
+    def test_is_item_matched_invalid_regex(self):
+        assert not AWSMutelist.is_item_matched(["prowler[", "test"], "test")
+        assert AWSMutelist.is_item_matched(["test", "prowler["], "test")
+
+    def test_is_item_matched_tags_cached(self):
+        tags = ["environment=dev", "project=prowler"]
+
+        assert AWSMutelist.is_item_matched(
+            tags, "environment=dev | project=prowler", tag=True
+        )
+        assert AWSMutelist.is_item_matched(
+            tags, "environment=dev | project=prowler", tag=True
+        )
+        assert not AWSMutelist.is_item_matched(
+            tags, "environment=dev | project=other", tag=True
+        )
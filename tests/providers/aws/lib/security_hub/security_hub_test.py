@@ -12,7 +12,11 @@ from prowler.providers.aws.lib.security_hub.exceptions.exceptions import (
     SecurityHubInvalidRegionError,
     SecurityHubNoEnabledRegionsError,
 )
-from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
+from prowler.providers.aws.lib.security_hub.security_hub import (
+    SECURITY_HUB_MAX_IMPORT_ATTEMPTS,
+    SECURITY_HUB_RETRY_BASE_DELAY,
+    SecurityHub,
+)
 from tests.lib.outputs.fixtures.fixtures import generate_finding_output
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_NUMBER,
@@ -410,6 +414,254 @@ class TestSecurityHub:
 
         assert security_hub.batch_send_to_security_hub() == 2
 
+    def test_batch_send_to_security_hub_multiple_batches_and_regions(self):
+        findings = [
+            generate_finding_output(
+                status="FAIL",
+                region=region,
+                resource_uid=f"resource-{index}",
+            )
+            for region in [AWS_REGION_EU_WEST_1, AWS_REGION_EU_WEST_2]
+            for index in range(150)
+        ]
+        asff = ASFF(findings=findings)
+        imported_findings = []
+
+        def mock_batch_import_findings(self, operation_name, kwarg):
+            if operation_name == "BatchImportFindings":
+                imported_findings.extend(kwarg["Findings"])
+                return {"FailedCount": 0, "SuccessCount": len(kwarg["Findings"])}
+            return mock_make_api_call(self, operation_name, kwarg)
+
+        with patch(
+            "botocore.client.BaseClient._make_api_call", new=mock_batch_import_findings
+        ):
+            security_hub = SecurityHub(
+                aws_session=session.Session(region_name=AWS_REGION_EU_WEST_1),
+                aws_account_id=AWS_ACCOUNT_NUMBER,
+                aws_partition=AWS_COMMERCIAL_PARTITION,
+                aws_security_hub_available_regions=[
+                    AWS_REGION_EU_WEST_1,
+                    AWS_REGION_EU_WEST_2,
+                ],
+                findings=asff.data,
+            )
+
+            assert security_hub.batch_send_to_security_hub() == 300
+
+        assert sorted(finding["Id"] for finding in imported_findings) == sorted(
+            finding.Id for finding in asff.data
+        )
+
+    def test_batch_send_to_security_hub_retries_failed_findings(self):
+        findings = [
+            generate_finding_output(
+                status="FAIL",
+                region=AWS_REGION_EU_WEST_1,
+                resource_uid=f"resource-{index}",
+            )
+            for index in range(3)
+        ]
+        asff = ASFF(findings=findings)
+        failed_finding_id = asff.data[1].Id
+        batch_imports = []
+
+        def mock_batch_import_findings(self, operation_name, kwarg):
+            if operation_name == "BatchImportFindings":
+                batch_imports.append([finding["Id"] for finding in kwarg["Findings"]])
+                if len(batch_imports) == 1:
+                    return {
+                        "FailedCount": 1,
+                        "SuccessCount": 2,
+                        "FailedFindings": [
+                            {
+                                "Id": failed_finding_id,
+                                "ErrorCode": "InternalFailure",
+                                "ErrorMessage": "Internal failure",
+                            }
+                        ],
+                    }
+                return {"FailedCount": 0, "SuccessCount": len(kwarg["Findings"])}
+            return mock_make_api_call(self, operation_name, kwarg)
+
+        with (
+            patch(
+                "botocore.client.BaseClient._make_api_call",
+                new=mock_batch_import_findings,
+            ),
+            patch(
+                "prowler.providers.aws.lib.security_hub.security_hub.sleep"
+            ) as mock_sleep,
+        ):
+            security_hub = SecurityHub(
+                aws_session=session.Session(region_name=AWS_REGION_EU_WEST_1),
+                aws_account_id=AWS_ACCOUNT_NUMBER,
+                aws_partition=AWS_COMMERCIAL_PARTITION,
+                aws_security_hub_available_regions=[AWS_REGION_EU_WEST_1],
+                findings=asff.data,
+            )
+
+            assert security_hub.batch_send_to_security_hub() == 3
+
+        # Only the failed finding is sent again, after waiting
+        assert batch_imports == [
+            [finding.Id for finding in asff.data],
+            [failed_finding_id],
+        ]
+        mock_sleep.assert_called_once_with(SECURITY_HUB_RETRY_BASE_DELAY)
+
+    def test_batch_send_to_security_hub_failed_findings_max_attempts(self, caplog):
+        asff = ASFF(
+            findings=[
+                generate_finding_output(status="FAIL", region=AWS_REGION_EU_WEST_1)
+            ]
+        )
+        batch_imports = []
+
+        def mock_batch_import_findings(self, operation_name, kwarg):
+            if operation_name == "BatchImportFindings":
+                batch_imports.append(kwarg["Findings"])
+                return {
+                    "FailedCount": 1,
+                    "SuccessCount": 0,
+                    "FailedFindings": [
+                        {
+                            "Id": kwarg["Findings"][0]["Id"],
+                            "ErrorCode": "ThrottlingException",
+                            "ErrorMessage": "Rate exceeded",
+                        }
+                    ],
+                }
+            return mock_make_api_call(self, operation_name, kwarg)
+
+        with (
+            patch(
+                "botocore.client.BaseClient._make_api_call",
+                new=mock_batch_import_findings,
+            ),
+            patch(
+                "prowler.providers.aws.lib.security_hub.security_hub.sleep"
+            ) as mock_sleep,
+        ):
+            security_hub = SecurityHub(
+                aws_session=session.Session(region_name=AWS_REGION_EU_WEST_1),
+                aws_account_id=AWS_ACCOUNT_NUMBER,
+                aws_partition=AWS_COMMERCIAL_PARTITION,
+                aws_security_hub_available_regions=[AWS_REGION_EU_WEST_1],
+                findings=asff.data,
+            )
+
+            assert security_hub.batch_send_to_security_hub() == 0
+
+        assert len(batch_imports) == SECURITY_HUB_MAX_IMPORT_ATTEMPTS
+        # Exponential backoff between the attempts
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [
+            SECURITY_HUB_RETRY_BASE_DELAY * 2**attempt
+            for attempt in range(SECURITY_HUB_MAX_IMPORT_ATTEMPTS - 1)
+        ]
+        assert (
+            f"Failed to send 1 findings to AWS Security Hub in region {AWS_REGION_EU_WEST_1} -- ThrottlingException -- Rate exceeded"
+            in caplog.text
+        )
+
+    def test_batch_send_to_security_hub_failed_findings_not_retryable(self, caplog):
+        asff = ASFF(
+            findings=[
+                generate_finding_output(
+                    status="FAIL",
+                    region=AWS_REGION_EU_WEST_1,
+                    resource_uid=f"resource-{index}",
+                )
+                for index in range(2)
+            ]
+        )
+        batch_imports = []
+
+        def mock_batch_import_findings(self, operation_name, kwarg):
+            if operation_name == "BatchImportFindings":
+                batch_imports.append(kwarg["Findings"])
+                return {
+                    "FailedCount": 2,
+                    "SuccessCount": 0,
+                    "FailedFindings": [
+                        {
+                            "Id": finding["Id"],
+                            "ErrorCode": "InvalidInput",
+                            "ErrorMessage": "Invalid input",
+                        }
+                        for finding in kwarg["Findings"]
+                    ],
+                }
+            return mock_make_api_call(self, operation_name, kwarg)
+
+        with (
+            patch(
+                "botocore.client.BaseClient._make_api_call",
+                new=mock_batch_import_findings,
+            ),
+            patch(
+                "prowler.providers.aws.lib.security_hub.security_hub.sleep"
+            ) as mock_sleep,
+        ):
+            security_hub = SecurityHub(
+                aws_session=session.Session(region_name=AWS_REGION_EU_WEST_1),
+                aws_account_id=AWS_ACCOUNT_NUMBER,
+                aws_partition=AWS_COMMERCIAL_PARTITION,
+                aws_security_hub_available_regions=[AWS_REGION_EU_WEST_1],
+                findings=asff.data,
+            )
+
+            assert security_hub.batch_send_to_security_hub() == 0
+
+        # The invalid findings are not sent again and are logged once
+        assert len(batch_imports) == 1
+        mock_sleep.assert_not_called()
+        assert (
+            caplog.text.count(
+                f"Failed to send 2 findings to AWS Security Hub in region {AWS_REGION_EU_WEST_1} -- InvalidInput -- Invalid input"
+            )
+            == 1
+        )
+
+    def test_archive_previous_findings(self):
+        asff = ASFF(
+            findings=[
+                generate_finding_output(
+                    status="FAIL", region=AWS_REGION_EU_WEST_1, resource_uid="current"
+                )
+            ]
+        )
+        current_finding_id = asff.data[0].Id
+        archived_findings = []
+
+        def mock_get_findings(self, operation_name, kwarg):
+            if operation_name == "GetFindings":
+                return {
+                    "Findings": [
+                        {"Id": current_finding_id, "RecordState": "ACTIVE"},
+                        {"Id": "previous-finding", "RecordState": "ACTIVE"},
+                    ]
+                }
+            if operation_name == "BatchImportFindings":
+                archived_findings.extend(kwarg["Findings"])
+                return {"FailedCount": 0, "SuccessCount": len(kwarg["Findings"])}
+            return mock_make_api_call(self, operation_name, kwarg)
+
+        with patch("botocore.client.BaseClient._make_api_call", new=mock_get_findings):
+            security_hub = SecurityHub(
+                aws_session=session.Session(region_name=AWS_REGION_EU_WEST_1),
+                aws_account_id=AWS_ACCOUNT_NUMBER,
+                aws_partition=AWS_COMMERCIAL_PARTITION,
+                aws_security_hub_available_regions=[AWS_REGION_EU_WEST_1],
+                findings=asff.data,
+            )
+
+            assert security_hub.archive_previous_findings() == 1
+
+        assert len(archived_findings) == 1
+        assert archived_findings[0]["Id"] == "previous-finding"
+        assert archived_findings[0]["RecordState"] == "ARCHIVED"
+
     @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
     def test_security_hub_test_connection_success(self):
         session_mock = session.Session(region_name=AWS_REGION_EU_WEST_1)
@@ -1,6 +1,15 @@
+from threading import Event, Lock
+from time import sleep
+
 from mock import patch
 
-from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.lib.service.service import (
+    MAX_API_WORKERS,
+    MAX_FILTER_VALUES,
+    AWSService,
+    ConcurrencyLimiter,
+    ThreadingPhase,
+)
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_ARN,
     AWS_ACCOUNT_NUMBER,
@@ -61,6 +70,16 @@ class TestAWSService:
         assert service.region == AWS_REGION_US_EAST_1
         assert service.client.__class__.__name__ == "CloudFront"
 
+    def test_AWSService_init_global_service_session_config(self):
+        service_name = "iam"
+        provider = set_mocked_aws_provider()
+        provider._session.session_config = provider.set_session_config(
+            retries_max_attempts=5, retries_mode="adaptive"
+        )
+        service = AWSService(service_name, provider, global_service=True)
+
+        assert service.client.meta.config.retries["mode"] == "adaptive"
+
     def test_AWSService_set_failed_check(self):
 
         AWSService.failed_checks.clear()
@@ -152,3 +171,188 @@ class TestAWSService:
             service.get_unknown_arn(region="eu-west-1", resource_type="bucket")
             == f"arn:aws:{service_name}:eu-west-1:{AWS_ACCOUNT_NUMBER}:bucket/unknown"
         )
+
+    def test_AWSService_threading_phases_dependencies(self):
+        service_name = "ec2"
+        provider = set_mocked_aws_provider()
+        service = AWSService(service_name, provider)
+        executed = []
+        items = []
+
+        def describe_items(regional_client):
+            items.extend(["item-1", "item-2"])
+            executed.append("describe_items")
+
+        def get_item_attributes(item):
+            executed.append(item)
+
+        service.__threading_phases__(
+            [
+                ThreadingPhase(
+                    get_item_attributes,
+                    iterator=lambda: items,
+                    depends_on=[describe_items],
+                ),
+                ThreadingPhase(describe_items),
+            ]
+        )
+
+        assert executed[0] == "describe_items"
+        assert sorted(executed[1:]) == ["item-1", "item-2"]
+
+    def test_AWSService_threading_phases_independent_calls_run_concurrently(self):
+        service_name = "ec2"
+        provider = set_mocked_aws_provider()
+        service = AWSService(service_name, provider)
+        first_call_started = Event()
+        second_call_completed = Event()
+        second_call_completed_while_first_running = []
+
+        def first_call(regional_client):
+            first_call_started.set()
+            second_call_completed_while_first_running.append(
+                second_call_completed.wait(timeout=5)
+            )
+
+        def second_call(regional_client):
+            first_call_started.wait(timeout=5)
+            second_call_completed.set()
+
+        service.__threading_phases__(
+            [ThreadingPhase(first_call), ThreadingPhase(second_call)]
+        )
+
+        assert second_call_completed_while_first_running == [True]
+
+    def test_AWSService_threading_phases_empty_iterator(self):
+        service_name = "ec2"
+        provider = set_mocked_aws_provider()
+        service = AWSService(service_name, provider)
+        executed = []
+
+        def process_item(item):
+            executed.append(item)
+
+        def after_items(regional_client):
+            executed.append("after_items")
+
+        service.__threading_phases__(
+            [
+                ThreadingPhase(process_item, iterator=lambda: []),
+                ThreadingPhase(after_items, depends_on=[process_item]),
+            ]
+        )
+
+        assert executed == ["after_items"]
+
+    def test_AWSService_shared_thread_pool(self):
+        provider = set_mocked_aws_provider()
+        ec2_service = AWSService("ec2", provider)
+        s3_service = AWSService("s3", provider)
+
+        assert ec2_service.thread_pool is s3_service.thread_pool
+        assert ec2_service.thread_pool._max_workers == MAX_API_WORKERS
+
+    def test_AWSService_max_api_workers(self):
+        provider = set_mocked_aws_provider()
+        provider._max_api_workers = 5
+        service = AWSService("ec2", provider)
+
+        assert service.thread_pool._max_workers == 5
+
+        AWSService.get_thread_pool(MAX_API_WORKERS)
+
+    def test_AWSService_shutdown_thread_pool(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("ec2", provider)
+        thread_pool = service.thread_pool
+
+        AWSService.shutdown_thread_pool()
+
+        assert thread_pool._shutdown
+        # A new thread pool is created if the service needs it again
+        assert service.thread_pool is not thread_pool
+        assert not service.thread_pool._shutdown
+
+    def test_AWSService_get_audit_resources_filters(self):
+        provider = set_mocked_aws_provider()
+        provider._audit_resources = [
+            f"arn:aws:ec2:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:instance/i-1",
+            f"arn:aws:ec2:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:instance/i-2",
+            f"arn:aws:ec2:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:volume/vol-1",
+        ]
+        service = AWSService("ec2", provider)
+
+        assert service.get_audit_resources_filters(
+            AWS_REGION_US_EAST_1, "instance", "instance-id"
+        ) == {"Filters": [{"Name": "instance-id", "Values": ["i-1", "i-2"]}]}
+        # There are no audited security groups, so they are not requested
+        assert (
+            service.get_audit_resources_filters(
+                AWS_REGION_US_EAST_1, "security-group", "group-id"
+            )
+            is None
+        )
+        assert (
+            service.get_audit_resources_filters("eu-west-1", "instance", "instance-id")
+            is None
+        )
+
+    def test_AWSService_get_audit_resources_filters_without_audit_resources(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("ec2", provider)
+
+        assert (
+            service.get_audit_resources_filters(
+                AWS_REGION_US_EAST_1, "instance", "instance-id"
+            )
+            == {}
+        )
+
+    def test_AWSService_get_audit_resources_filters_too_many_values(self):
+        provider = set_mocked_aws_provider()
+        provider._audit_resources = [
+            f"arn:aws:ec2:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:instance/i-{index}"
+            for index in range(MAX_FILTER_VALUES + 1)
+        ]
+        service = AWSService("ec2", provider)
+
+        assert (
+            service.get_audit_resources_filters(
+                AWS_REGION_US_EAST_1, "instance", "instance-id"
+            )
+            == {}
+        )
+
+    def test_ConcurrencyLimiter(self):
+        thread_pool = AWSService.get_thread_pool()
+        limiter = ConcurrencyLimiter(2)
+        lock = Lock()
+        running = []
+        max_running = []
+
+        def call(item):
+            with lock:
+                running.append(item)
+                max_running.append(len(running))
+            sleep(0.01)
+            with lock:
+                running.remove(item)
+            return item
+
+        futures = [limiter.submit(thread_pool, call, item) for item in range(10)]
+
+        assert sorted(future.result(timeout=5) for future in futures) == list(range(10))
+        assert max(max_running) <= 2
+
+    def test_ConcurrencyLimiter_exception(self):
+        thread_pool = AWSService.get_thread_pool()
+        limiter = ConcurrencyLimiter(1)
+
+        def call():
+            raise ValueError("error")
+
+        futures = [limiter.submit(thread_pool, call) for _ in range(2)]
+
+        for future in futures:
+            assert isinstance(future.exception(timeout=5), ValueError)
@@ -0,0 +1,112 @@
+from boto3 import client
+from mock import MagicMock
+from moto import mock_aws
+
+from prowler.providers.aws.lib.throttling.throttling import APICallsStats
+from tests.providers.aws.utils import AWS_REGION_US_EAST_1
+
+
+class TestAPICallsStats:
+    @mock_aws
+    def test_register_client_counts_calls(self):
+        ec2_client = client("ec2", region_name=AWS_REGION_US_EAST_1)
+        stats = APICallsStats()
+        stats.register_client(ec2_client, "ec2")
+
+        ec2_client.describe_instances()
+        ec2_client.describe_instances()
+        ec2_client.describe_volumes()
+
+        assert stats.get_stats() == {
+            ("ec2", AWS_REGION_US_EAST_1, "DescribeInstances"): {
+                "calls": 2,
+                "throttles": 0,
+                "retries": 0,
+            },
+            ("ec2", AWS_REGION_US_EAST_1, "DescribeVolumes"): {
+                "calls": 1,
+                "throttles": 0,
+                "retries": 0,
+            },
+        }
+        assert stats.get_throttled_apis() == {}
+
+    def test_throttled_calls(self):
+        stats = APICallsStats()
+        operation = MagicMock()
+        operation.name = "DescribeInstances"
+        throttled_response = (
+            MagicMock(),
+            {"Error": {"Code": "RequestLimitExceeded"}},
+        )
+
+        # Two throttled attempts and a successful one
+        stats._needs_retry_handler(
+            "ec2",
+            AWS_REGION_US_EAST_1,
+            response=throttled_response,
+            operation=operation,
+        )
+        stats._needs_retry_handler(
+            "ec2",
+            AWS_REGION_US_EAST_1,
+            response=throttled_response,
+            operation=operation,
+        )
+        stats._needs_retry_handler(
+            "ec2",
+            AWS_REGION_US_EAST_1,
+            response=(MagicMock(), {"ResponseMetadata": {}}),
+            operation=operation,
+        )
+        stats._after_call_handler(
+            "ec2",
+            AWS_REGION_US_EAST_1,
+            parsed={"ResponseMetadata": {"RetryAttempts": 2}},
+            model=operation,
+        )
+
+        assert stats.get_throttled_apis() == {
+            ("ec2", AWS_REGION_US_EAST_1, "DescribeInstances"): {
+                "calls": 1,
+                "throttles": 2,
+                "retries": 2,
+            }
+        }
+
+    def test_other_errors_are_not_throttles(self):
+        stats = APICallsStats()
+        operation = MagicMock()
+        operation.name = "DescribeInstances"
+
+        stats._needs_retry_handler(
+            "ec2",
+            AWS_REGION_US_EAST_1,
+            response=(MagicMock(), {"Error": {"Code": "AccessDenied"}}),
+            operation=operation,
+        )
+        # The connection errors do not have a response
+        stats._needs_retry_handler(
+            "ec2", AWS_REGION_US_EAST_1, response=None, operation=operation
+        )
+
+        assert stats.get_stats() == {}
+
+    def test_reset(self):
+        stats = APICallsStats()
+        operation = MagicMock()
+        operation.name = "ListBuckets"
+        stats._after_call_handler(
+            "s3", AWS_REGION_US_EAST_1, parsed={}, model=operation
+        )
+        assert stats.get_stats() == {
+            ("s3", AWS_REGION_US_EAST_1, "ListBuckets"): {
+                "calls": 1,
+                "throttles": 0,
+                "retries": 0,
+            }
+        }
+
+        stats.reset()
+
+        assert stats.get_stats() == {}
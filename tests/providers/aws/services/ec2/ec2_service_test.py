@@ -152,6 +152,45 @@ class Test_EC2_Service:
         assert ec2.instances[0].network_interfaces is not None
         assert ec2.instances[0].virtualization_type == "hvm"
 
+    # Test EC2 Describe Instances with audit resources
+    @mock_aws
+    def test_describe_instances_with_audit_resources(self):
+        ec2_resource = resource("ec2", region_name=AWS_REGION_US_EAST_1)
+        ec2_client = client("ec2", region_name=AWS_REGION_US_EAST_1)
+        image_id = ec2_client.describe_images()["Images"][0]["ImageId"]
+        instances = ec2_resource.create_instances(
+            MinCount=2,
+            MaxCount=2,
+            ImageId=image_id,
+        )
+        audited_instance_arn = f"arn:aws:ec2:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:instance/{instances[0].id}"
+        aws_provider = set_mocked_aws_provider(
+            [AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1]
+        )
+        aws_provider._audit_resources = [audited_instance_arn]
+
+        with mock.patch(
+            "botocore.paginate.Paginator.paginate",
+            autospec=True,
+            side_effect=botocore.paginate.Paginator.paginate,
+        ) as paginate:
+            ec2 = EC2(aws_provider)
+
+        assert len(ec2.instances) == 1
+        assert ec2.instances[0].arn == audited_instance_arn
+        # Only the audited instance is requested and the other resources are not described
+        describe_instances_calls = [
+            call
+            for call in paginate.call_args_list
+            if call.args[0]._method.__name__ == "describe_instances"
+        ]
+        assert len(describe_instances_calls) == 1
+        assert describe_instances_calls[0].kwargs == {
+            "Filters": [{"Name": "instance-id", "Values": [instances[0].id]}]
+        }
+        assert ec2.security_groups == {}
+        assert ec2.volumes == []
+
     # Test EC2 Describe Security Groups
     @mock_aws
     def test_describe_security_groups(self):
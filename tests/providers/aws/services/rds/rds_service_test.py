@@ -292,6 +292,30 @@ class Test_RDS_Service:
                 # No certificate should be found due to the exception
                 assert len(db_instance.cert) == 0
 
+    # Test RDS Describe DB Instances with audit resources
+    @mock_aws
+    def test_describe_db_instances_with_audit_resources(self):
+        conn = client("rds", region_name=AWS_REGION_US_EAST_1)
+        for db_instance_identifier in ["db-audited", "db-not-audited"]:
+            conn.create_db_instance(
+                DBInstanceIdentifier=db_instance_identifier,
+                AllocatedStorage=10,
+                Engine="postgres",
+                DBInstanceClass="db.m1.small",
+            )
+        audited_db_arn = (
+            f"arn:aws:rds:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:db:db-audited"
+        )
+        aws_provider = set_mocked_aws_provider([AWS_REGION_US_EAST_1])
+        aws_provider._audit_resources = [audited_db_arn]
+
+        rds = RDS(aws_provider)
+
+        assert list(rds.db_instances) == [audited_db_arn]
+        assert rds.db_instances[audited_db_arn].id == "db-audited"
+        # There are no audited clusters, so they are not described
+        assert rds.db_clusters == {}
+
     # Test RDS Describe DB Snapshots
     @mock_aws
     def test_describe_db_snapshots(self):
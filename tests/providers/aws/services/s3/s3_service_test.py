@@ -95,6 +95,34 @@ class Test_S3_Service:
         assert s3.buckets[bucket_arn].region == AWS_REGION_US_EAST_1
         assert not s3.buckets[bucket_arn].object_lock
 
+    # Test S3 List Buckets with audit resources
+    @mock_aws
+    def test_list_buckets_with_audit_resources(self):
+        s3_client = client("s3")
+        s3_client.create_bucket(Bucket="audited-bucket")
+        s3_client.create_bucket(Bucket="not-audited-bucket")
+        audited_bucket_arn = "arn:aws:s3:::audited-bucket"
+        aws_provider = set_mocked_aws_provider([AWS_REGION_US_EAST_1])
+        aws_provider._audit_resources = [audited_bucket_arn]
+
+        api_calls = []
+        make_api_call = botocore.client.BaseClient._make_api_call
+
+        def mock_make_api_call(self, operation_name, kwarg):
+            api_calls.append((operation_name, kwarg))
+            return make_api_call(self, operation_name, kwarg)
+
+        with patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call):
+            s3 = S3(aws_provider)
+
+        assert list(s3.buckets) == [audited_bucket_arn]
+        # The location is only requested for the audited bucket
+        assert [
+            kwarg["Bucket"]
+            for operation_name, kwarg in api_calls
+            if operation_name == "GetBucketLocation"
+        ] == ["audited-bucket"]
+
     # Test S3 Get Bucket Versioning
     @mock_aws
     def test_get_bucket_versioning(self):
@@ -0,0 +1,93 @@
+from threading import Lock
+from time import sleep
+
+from azure.mgmt.storage import StorageManagementClient
+from mock import MagicMock
+
+from prowler.providers.azure.lib.service.service import (
+    MAX_WORKERS,
+    THROTTLING_STATUS_CODE,
+    AzureService,
+)
+from tests.providers.azure.azure_fixtures import (
+    AZURE_SUBSCRIPTION_ID,
+    set_mocked_azure_provider,
+)
+
+
+class TestAzureService:
+    def teardown_method(self):
+        AzureService.shutdown_thread_pool()
+
+    def test_AzureService_clients(self):
+        service = AzureService(StorageManagementClient, set_mocked_azure_provider())
+
+        assert isinstance(
+            service.clients[AZURE_SUBSCRIPTION_ID], StorageManagementClient
+        )
+        # The clients report the throttled responses
+        assert (
+            service.clients[
+                AZURE_SUBSCRIPTION_ID
+            ]._config.custom_hook_policy._response_callback
+            is not None
+        )
+
+    def test_threading_call_subscriptions(self):
+        service = AzureService(StorageManagementClient, set_mocked_azure_provider())
+        service.clients = {"subscription-1": "client-1", "subscription-2": "client-2"}
+
+        def call(subscription, client):
+            if subscription == "subscription-2":
+                raise Exception("Error")
+            return f"{subscription}-{client}"
+
+        assert service.__threading_call__(call) == [
+            "subscription-1-client-1",
+            None,
+        ]
+
+    def test_threading_call_limited_per_subscription(self):
+        service = AzureService(StorageManagementClient, set_mocked_azure_provider())
+        lock = Lock()
+        running = {"subscription-1": 0, "subscription-2": 0}
+        max_running = {"subscription-1": 0, "subscription-2": 0}
+
+        def call(subscription, item):
+            with lock:
+                running[subscription] += 1
+                max_running[subscription] = max(
+                    max_running[subscription], running[subscription]
+                )
+            sleep(0.01)
+            with lock:
+                running[subscription] -= 1
+            return item
+
+        items = [
+            (subscription, item)
+            for subscription in ["subscription-1", "subscription-2"]
+            for item in range(MAX_WORKERS * 2)
+        ]
+
+        assert service.__threading_call__(call, items) == [item for _, item in items]
+        assert max_running["subscription-1"] <= MAX_WORKERS
+        assert max_running["subscription-2"] <= MAX_WORKERS
+
+    def test_throttling_hook(self):
+        throttling_hook = AzureService.__get_throttling_hook__("subscription-1")
+        limiter = AzureService.get_subscription_limiter("subscription-1")
+
+        pipeline_response = MagicMock()
+        pipeline_response.http_response.status_code = 200
+        throttling_hook(pipeline_response)
+        assert limiter.max_concurrency == MAX_WORKERS
+
+        pipeline_response.http_response.status_code = THROTTLING_STATUS_CODE
+        throttling_hook(pipeline_response)
+        assert limiter.max_concurrency == MAX_WORKERS // 2
+        # The other subscriptions are not throttled
+        assert (
+            AzureService.get_subscription_limiter("subscription-2").max_concurrency
+            == MAX_WORKERS
+        )
@@ -91,6 +91,101 @@ class TestGCPProvider:
                 "max_unused_account_days": 180,
             }
 
+    def test_get_discovery_client_and_enabled_services(self):
+        projects = {
+            project_id: GCPProject(
+                number="55555555",
+                id=project_id,
+                name=project_id,
+                labels={},
+                lifecycle_state="ACTIVE",
+            )
+            for project_id in ["test-project", "other-project", "failed-project"]
+        }
+
+        def list_services(parent, filter, pageSize):
+            if parent == "projects/failed-project":
+                raise Exception("Permission denied")
+            return MagicMock(
+                execute=MagicMock(
+                    return_value={
+                        "services": [
+                            {"name": f"{parent}/services/compute.googleapis.com"}
+                        ]
+                    }
+                )
+            )
+
+        def list_next_services(previous_request, previous_response):
+            if "iam.googleapis.com" in str(previous_response):
+                return None
+            return MagicMock(
+                execute=MagicMock(
+                    return_value={
+                        "services": [
+                            {"name": "projects/test/services/iam.googleapis.com"}
+                        ]
+                    }
+                )
+            )
+
+        mocked_service = MagicMock()
+        mocked_service.services.return_value.list.side_effect = list_services
+        mocked_service.services.return_value.list_next.side_effect = list_next_services
+
+        with (
+            patch(
+                "prowler.providers.gcp.gcp_provider.GcpProvider.setup_session",
+                return_value=(None, "test-project"),
+            ),
+            patch(
+                "prowler.providers.gcp.gcp_provider.GcpProvider.get_projects",
+                return_value=projects,
+            ),
+            patch(
+                "prowler.providers.gcp.gcp_provider.GcpProvider.update_projects_with_organizations",
+                return_value=None,
+            ),
+            patch(
+                "prowler.providers.gcp.gcp_provider.discovery.build",
+                return_value=mocked_service,
+            ) as discovery_build,
+            patch("prowler.providers.gcp.gcp_provider.google_auth_httplib2"),
+        ):
+            gcp_provider = GcpProvider(
+                [],
+                [],
+                "",
+                "",
+                False,
+                config_path=default_config_file_path,
+                client_id="test-client-id",
+                client_secret="test-client-secret",
+                refresh_token="test-refresh-token",
+            )
+
+            # The clients are built once
+            assert gcp_provider.get_discovery_client(
+                "compute", "v1"
+            ) is gcp_provider.get_discovery_client("compute", "v1")
+            assert [
+                call.args
+                for call in discovery_build.call_args_list
+                if call.args[0] == "compute"
+            ] == [("compute", "v1")]
+
+            assert gcp_provider.get_enabled_services("test-project") == {
+                "compute.googleapis.com",
+                "iam.googleapis.com",
+            }
+            assert gcp_provider.get_enabled_services("other-project") == {
+                "compute.googleapis.com",
+                "iam.googleapis.com",
+            }
+            assert gcp_provider.get_enabled_services("failed-project") is None
+            # The enabled services of all the projects are listed at once
+            assert mocked_service.services.return_value.list.call_count == 3
+
     @freeze_time(datetime.today())
     def test_is_project_matching(self):
         arguments = Namespace()
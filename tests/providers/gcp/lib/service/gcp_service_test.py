@@ -0,0 +1,60 @@
+from threading import Lock, get_ident
+from time import sleep
+
+from mock import MagicMock
+
+from prowler.providers.gcp.gcp_provider import MAX_WORKERS
+from prowler.providers.gcp.lib.service.service import GCPService
+from tests.providers.gcp.gcp_fixtures import GCP_PROJECT_ID, set_mocked_gcp_provider
+
+
+class TestGCPService:
+    def test_gcp_service(self):
+        provider = set_mocked_gcp_provider(project_ids=[GCP_PROJECT_ID, "other"])
+        provider.get_enabled_services.side_effect = lambda project_id: (
+            {"compute.googleapis.com"} if project_id == GCP_PROJECT_ID else set()
+        )
+
+        service = GCPService("Compute", provider)
+
+        assert service.service == "compute"
+        assert service.client == provider.get_discovery_client.return_value
+        provider.get_discovery_client.assert_called_once_with("compute", "v1")
+        # Only the projects with the API enabled are scanned
+        assert service.project_ids == [GCP_PROJECT_ID]
+
+    def test_gcp_service_enabled_services_not_listed(self):
+        provider = set_mocked_gcp_provider()
+        provider.get_enabled_services.return_value = None
+        serviceusage_client = MagicMock()
+        serviceusage_client.services().get().execute.return_value = {"state": "ENABLED"}
+        provider.get_discovery_client.return_value = serviceusage_client
+
+        service = GCPService("compute", provider)
+
+        # The API is checked for the project whose enabled services are unknown
+        assert service.project_ids == [GCP_PROJECT_ID]
+        serviceusage_client.services().get.assert_called_with(
+            name=f"projects/{GCP_PROJECT_ID}/services/compute.googleapis.com"
+        )
+
+    def test_threading_call(self):
+        provider = set_mocked_gcp_provider()
+        provider.get_enabled_services.return_value = set()
+        service = GCPService("compute", provider)
+        threads = set()
+        values = []
+        lock = Lock()
+
+        def call(value):
+            sleep(0.01)
+            with lock:
+                threads.add(get_ident())
+                values.append(value)
+            if value == 0:
+                raise Exception("Error")
+
+        service.__threading_call__(call, range(50))
+
+        assert sorted(values) == list(range(50))
+        assert len(threads) <= MAX_WORKERS
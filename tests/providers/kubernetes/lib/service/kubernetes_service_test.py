@@ -1,8 +1,13 @@
 # This file needs to be named with the provider at the beginning since there is a limitation in pytest and two tests files cannot have the same name
 # https://github.com/pytest-dev/pytest/issues/774#issuecomment-112343498
-from kubernetes import client
+from unittest.mock import MagicMock, call
 
-from prowler.providers.kubernetes.lib.service.service import KubernetesService
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+from prowler.providers.kubernetes.lib.service.service import (
+    LIST_PAGE_SIZE,
+    KubernetesService,
+)
 from tests.providers.kubernetes.kubernetes_fixtures import (
     set_mocked_kubernetes_provider,
 )
@@ -15,3 +20,75 @@ class TestKubernetesService:
 
         assert service.context is None
         assert service.api_client == client.ApiClient
+
+    def test_list_resources_paginated(self):
+        kubernetes_provider = set_mocked_kubernetes_provider()
+        service = KubernetesService(kubernetes_provider)
+        list_call = MagicMock(
+            __name__="list_pod_for_all_namespaces",
+            side_effect=[
+                MagicMock(items=["pod-1", "pod-2"], metadata=MagicMock(_continue="1")),
+                MagicMock(items=["pod-3"], metadata=MagicMock(_continue=None)),
+            ],
+        )
+
+        assert service.__list_resources__(list_call) == ["pod-1", "pod-2", "pod-3"]
+        assert list_call.call_args_list == [
+            call(limit=LIST_PAGE_SIZE, _continue=None),
+            call(limit=LIST_PAGE_SIZE, _continue="1"),
+        ]
+
+    def test_list_resources_shared_by_services(self):
+        kubernetes_provider = set_mocked_kubernetes_provider()
+        list_call = MagicMock(
+            __name__="list_node",
+            return_value=MagicMock(
+                items=["node-1"], metadata=MagicMock(_continue=None)
+            ),
+        )
+
+        first_service = KubernetesService(kubernetes_provider)
+        second_service = KubernetesService(kubernetes_provider)
+
+        assert first_service.__list_resources__(list_call) == ["node-1"]
+        assert second_service.__list_resources__(list_call) == ["node-1"]
+        list_call.assert_called_once()
+        # Other providers list their own objects
+        assert KubernetesService(set_mocked_kubernetes_provider()).__list_resources__(
+            list_call
+        ) == ["node-1"]
+        assert list_call.call_count == 2
+
+    def test_list_resources_namespaced(self):
+        kubernetes_provider = set_mocked_kubernetes_provider()
+        service = KubernetesService(kubernetes_provider)
+        list_call = MagicMock(__name__="list_pod_for_all_namespaces")
+        namespaced_list_call = MagicMock(
+            __name__="list_namespaced_pod",
+            side_effect=lambda namespace, limit, _continue: MagicMock(
+                items=[f"{namespace}-pod"], metadata=MagicMock(_continue=None)
+            ),
+        )
+
+        assert service.__list_resources__(
+            list_call, namespaced_list_call, namespaces=["default", "kube-system"]
+        ) == ["default-pod", "kube-system-pod"]
+        list_call.assert_not_called()
+        assert namespaced_list_call.call_count == 2
+
+    def test_list_resources_expired_continue_token(self):
+        kubernetes_provider = set_mocked_kubernetes_provider()
+        service = KubernetesService(kubernetes_provider)
+        list_call = MagicMock(
+            __name__="list_config_map_for_all_namespaces",
+            side_effect=[
+                MagicMock(items=["cm-1"], metadata=MagicMock(_continue="1")),
+                ApiException(status=410),
+                MagicMock(items=["cm-1", "cm-2"], metadata=MagicMock(_continue=None)),
+            ],
+        )
+
+        assert service.__list_resources__(list_call) == ["cm-1", "cm-2"]
+        assert list_call.call_args_list[-1] == call(
+            limit=LIST_PAGE_SIZE, _continue=None
+        )